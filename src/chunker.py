@@ -6,6 +6,10 @@ maintaining overlap for context continuity.
 """
 
 import re
+from typing import Final
+
+# Approximate number of characters per token used for all size estimates
+CHARS_PER_TOKEN: Final[int] = 4
 
 
 def estimate_tokens(text: str) -> int:
@@ -24,7 +28,7 @@ def estimate_tokens(text: str) -> int:
         >>> estimate_tokens("Hello, world!")
         3
     """
-    return len(text) // 4
+    return len(text) // CHARS_PER_TOKEN
 
 
 def split_text(text: str, chunk_size: int, overlap: int) -> list[str]:
@@ -68,72 +72,84 @@ def split_text(text: str, chunk_size: int, overlap: int) -> list[str]:
         return [text]
 
     # Convert token counts to character counts for splitting
-    chunk_chars = chunk_size * 4
-    overlap_chars = overlap * 4
+    chunk_chars = chunk_size * CHARS_PER_TOKEN
+    overlap_chars = overlap * CHARS_PER_TOKEN
+    text_length = len(text)
 
+    # Chunks are located as (start, end) offsets into the original text and
+    # sliced exactly once, instead of slicing a window and re-slicing it at
+    # the chosen boundary.
     chunks: list[str] = []
     current_pos = 0
 
-    while current_pos < len(text):
+    while current_pos < text_length:
         # Calculate end position for this chunk
-        end_pos = min(current_pos + chunk_chars, len(text))
+        end_pos = min(current_pos + chunk_chars, text_length)
 
-        # Extract chunk
-        chunk = text[current_pos:end_pos]
+        # If not the last chunk, try to end at a natural boundary
+        if end_pos < text_length:
+            chunk_end = _find_boundary(text, current_pos, end_pos)
+        else:
+            chunk_end = end_pos
 
-        # If not the last chunk, try to split at a natural boundary
-        if end_pos < len(text):
-            chunk = _split_at_boundary(chunk)
+        chunks.append(text[current_pos:chunk_end].strip())
 
-        chunks.append(chunk.strip())
+        if end_pos >= text_length:
+            break
 
         # Move position forward, accounting for overlap
-        # Overlap is applied by moving back from the end of current chunk
-        if end_pos < len(text):
-            current_pos = end_pos - overlap_chars
-            # Ensure we make progress (avoid infinite loop)
-            if current_pos <= chunks[-1].find(chunk[:100]):
-                current_pos = end_pos
-        else:
-            break
+        # Overlap is applied by moving back from the end of current window
+        next_pos = end_pos - overlap_chars
+        # Ensure we make progress (avoid infinite loop)
+        current_pos = next_pos if next_pos > current_pos else end_pos
 
     return chunks
 
 
-def _split_at_boundary(text: str) -> str:
-    """Split text at the last natural boundary (paragraph or sentence).
+# Precompiled boundary patterns, searched within [start, end) offsets
+_PARAGRAPH_BREAK = re.compile(r"\n\n+")
+_SENTENCE_END = re.compile(r"[.!?]\s+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def _find_boundary(text: str, start: int, end: int) -> int:
+    """Find the last natural boundary (paragraph or sentence) in a window.
 
     Attempts to find the last paragraph boundary, then sentence boundary,
-    then word boundary. Falls back to the full text if no boundary found.
+    then word boundary within text[start:end]. Falls back to the end of
+    the window if no boundary is found. The window is searched in place
+    using the patterns' pos/endpos arguments, so no substring is copied.
 
     Args:
-        text: Text to find boundary in.
+        text: The full text being chunked.
+        start: Start offset of the window (inclusive).
+        end: End offset of the window (exclusive).
 
     Returns:
-        Text truncated at the last natural boundary.
+        Offset in text at which the chunk should end.
     """
     # Try to split at last paragraph boundary (double newline)
-    paragraph_matches = list(re.finditer(r'\n\n+', text))
-    if paragraph_matches:
-        last_para = paragraph_matches[-1]
-        return text[:last_para.end()].rstrip()
+    last_para = None
+    for last_para in _PARAGRAPH_BREAK.finditer(text, start, end):
+        pass
+    if last_para is not None:
+        return last_para.end()
 
     # Try to split at last sentence boundary
-    sentence_matches = list(re.finditer(r'[.!?]\s+', text))
-    if sentence_matches:
+    sentence_matches = _SENTENCE_END.finditer(text, start, end)
+    previous_sentence = last_sentence = None
+    for match in sentence_matches:
+        previous_sentence, last_sentence = last_sentence, match
+    if last_sentence is not None:
         # Use second-to-last sentence to leave some context
-        if len(sentence_matches) >= 2:
-            last_sentence = sentence_matches[-2]
-        else:
-            last_sentence = sentence_matches[-1]
-        return text[:last_sentence.end()].rstrip()
+        return (previous_sentence or last_sentence).end()
 
     # Try to split at last word boundary
-    word_matches = list(re.finditer(r'\s+', text))
+    word_matches = list(_WHITESPACE.finditer(text, start, end))
     if word_matches and len(word_matches) > 10:
         # Use a word boundary in the last 20% of text
         target_match = word_matches[int(len(word_matches) * 0.8)]
-        return text[:target_match.end()].rstrip()
+        return target_match.end()
 
-    # No good boundary found, return full text
-    return text
+    # No good boundary found, use the full window
+    return end
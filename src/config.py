@@ -5,15 +5,24 @@ All configuration values are read from environment variables.
 Supports loading from .env file via python-dotenv.
 """
 
+import functools
 import os
-from typing import Literal
+from collections.abc import Mapping
+from typing import Any, Final, Literal
 
 from dotenv import load_dotenv
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 # Load environment variables from .env file (if present)
 load_dotenv()
 
+# Default CHUNK_MAX_CONCURRENCY per provider. A local Ollama server handles
+# one request at a time, so queued calls would only wait out its timeout.
+_DEFAULT_MAX_CONCURRENCY: Final[dict[str, int]] = {"openai": 8, "gemini": 8, "ollama": 1}
+
+# Case-insensitive string values treated as true for boolean settings
+_TRUTHY: Final[frozenset[str]] = frozenset({"1", "true", "yes", "on", "t", "y"})
+
 
 class Config(BaseModel):
     """Application configuration loaded from environment variables.
@@ -28,9 +37,12 @@ class Config(BaseModel):
         chunk_enabled: Whether to enable document chunking for large texts.
         chunk_size_tokens: Target number of tokens per chunk.
         chunk_overlap_tokens: Number of tokens to overlap between chunks.
+        chunk_max_concurrency: Maximum number of chunks extracted concurrently.
     """
 
-    model_config = ConfigDict(extra="forbid")
+    # Frozen: load_config() hands out one cached instance to every caller,
+    # so it must not be mutable.
+    model_config = ConfigDict(frozen=True, extra="forbid")
 
     llm_provider: Literal["openai", "ollama", "gemini"] = Field(
         default="openai",
@@ -70,11 +82,30 @@ class Config(BaseModel):
         description="Number of tokens to overlap between chunks",
         ge=0,
     )
+    chunk_max_concurrency: int = Field(
+        default=8,
+        description="Maximum number of chunks sent to the LLM concurrently",
+        gt=0,
+    )
 
+    @field_validator("chunk_enabled", mode="before")
+    @classmethod
+    def _parse_bool(cls, value: Any) -> Any:
+        """Parse string flags such as "yes" or "0" into booleans."""
+        if isinstance(value, str):
+            return value.casefold() in _TRUTHY
+        return value
 
-def load_config() -> Config:
+
+def load_config(env: Mapping[str, str] | None = None) -> Config:
     """Load configuration from environment variables.
 
+    When ``env`` is omitted the process environment is read and validated
+    once per process; subsequent calls return the same cached Config
+    instance. Call ``clear_config_cache()`` to force a re-read after
+    changing environment variables. An explicit ``env`` mapping is never
+    cached.
+
     Reads the following environment variables:
     - LLM_PROVIDER: "openai", "ollama", or "gemini" (default: "openai")
     - OPENAI_API_KEY: API key for OpenAI
@@ -82,9 +113,15 @@ def load_config() -> Config:
     - OLLAMA_BASE_URL: Ollama API URL (default: "http://localhost:11434")
     - GEMINI_API_KEY: API key for Google Gemini
     - GEMINI_MODEL: Model name for Gemini (default: "gemini-2.0-flash")
-    - CHUNK_ENABLED: Enable document chunking (default: "true")
+    - CHUNK_ENABLED: Enable document chunking; "1", "true", "yes", "on",
+      "t" or "y" (any case) enable it (default: "true")
     - CHUNK_SIZE_TOKENS: Target tokens per chunk (default: 4000)
     - CHUNK_OVERLAP_TOKENS: Overlap tokens between chunks (default: 200)
+    - CHUNK_MAX_CONCURRENCY: Max chunks extracted concurrently (default: 8,
+      or 1 for the ollama provider)
+
+    Args:
+        env: Mapping to read variables from instead of ``os.environ``.
 
     Returns:
         A validated Config instance.
@@ -92,19 +129,37 @@ def load_config() -> Config:
     Raises:
         pydantic.ValidationError: If environment values fail validation.
     """
-    # Parse CHUNK_ENABLED as boolean
-    chunk_enabled_str = os.environ.get("CHUNK_ENABLED", "true").lower()
-    chunk_enabled = chunk_enabled_str in ("true", "1", "yes")
+    if env is None:
+        return _load_environ_config()
+    return _parse_config(env)
 
+
+@functools.lru_cache(maxsize=1)
+def _load_environ_config() -> Config:
+    """Build the process-wide Config from ``os.environ``."""
+    return _parse_config(os.environ)
+
+
+def clear_config_cache() -> None:
+    """Discard the cached Config so the next load_config() re-reads os.environ."""
+    _load_environ_config.cache_clear()
+
+
+def _parse_config(env: Mapping[str, str]) -> Config:
+    """Build a Config from a mapping of environment variable values."""
+    llm_provider = env.get("LLM_PROVIDER", "openai")
+    default_concurrency = _DEFAULT_MAX_CONCURRENCY.get(llm_provider, 8)
     return Config(
-        llm_provider=os.environ.get("LLM_PROVIDER", "openai"),  # type: ignore[arg-type]
-        openai_api_key=os.environ.get("OPENAI_API_KEY"),
-        ollama_model=os.environ.get("OLLAMA_MODEL", "llama3:latest"),
-        ollama_base_url=os.environ.get("OLLAMA_BASE_URL", "http://localhost:11434"),
-        gemini_api_key=os.environ.get("GEMINI_API_KEY"),
-        gemini_model=os.environ.get("GEMINI_MODEL", "gemini-2.0-flash"),
-        chunk_enabled=chunk_enabled,
-        chunk_size_tokens=int(os.environ.get("CHUNK_SIZE_TOKENS", "4000")),
-        chunk_overlap_tokens=int(os.environ.get("CHUNK_OVERLAP_TOKENS", "200")),
+        llm_provider=llm_provider,  # type: ignore[arg-type]
+        openai_api_key=env.get("OPENAI_API_KEY"),
+        ollama_model=env.get("OLLAMA_MODEL", "llama3:latest"),
+        ollama_base_url=env.get("OLLAMA_BASE_URL", "http://localhost:11434"),
+        gemini_api_key=env.get("GEMINI_API_KEY"),
+        gemini_model=env.get("GEMINI_MODEL", "gemini-2.0-flash"),
+        chunk_enabled=env.get("CHUNK_ENABLED", "true"),  # type: ignore[arg-type]
+        chunk_size_tokens=int(env.get("CHUNK_SIZE_TOKENS", "4000")),
+        chunk_overlap_tokens=int(env.get("CHUNK_OVERLAP_TOKENS", "200")),
+        chunk_max_concurrency=int(
+            env.get("CHUNK_MAX_CONCURRENCY", str(default_concurrency))
+        ),
     )
-
@@ -9,17 +9,23 @@ the text is split into overlapping chunks, each chunk is processed
 independently, and the resulting graphs are merged.
 
 Features:
+- Concurrent chunk extraction: LLM calls overlap, bounded by CHUNK_MAX_CONCURRENCY
 - Graceful failure handling: failed chunks are skipped, not fatal
 - Detailed logging: shows exactly what succeeded and failed
 - Progress callbacks: save intermediate results while processing
 """
 
+from collections.abc import Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import closing
+from itertools import islice
 from typing import Callable
 
 from src.chunker import estimate_tokens, split_text
 from src.config import load_config
+from src.extractor.base import LLMExtractor
 from src.extractor.factory import create_extractor
-from src.graph_merger import merge_graphs
+from src.graph_merger import GraphMerger
 from src.schema import KnowledgeGraph
 
 
@@ -40,8 +46,9 @@ def extract_knowledge_graph(
 
     When chunking is enabled (CHUNK_ENABLED=true) and the text exceeds
     the configured chunk size (CHUNK_SIZE_TOKENS), the text is split
-    into overlapping chunks. Each chunk is processed independently by
-    the LLM, and the resulting graphs are merged into a single graph.
+    into overlapping chunks. Chunks are sent to the LLM concurrently
+    (up to CHUNK_MAX_CONCURRENCY at a time), and the resulting graphs are
+    merged into a single graph in document order.
 
     Failed chunks are logged and skipped - extraction continues with
     remaining chunks. Only fails if ALL chunks fail.
@@ -81,52 +88,111 @@ def extract_knowledge_graph(
         total_chunks = len(chunks)
         print(f"      Splitting into {total_chunks} chunks (size={config.chunk_size_tokens} tokens, overlap={config.chunk_overlap_tokens} tokens)")
 
-        # Track success/failure stats
-        graphs: list[KnowledgeGraph] = []
+        # Track success/failure stats. The merger keeps deduplication state
+        # across chunks so each progress snapshot costs O(chunk), not O(all).
+        merger = GraphMerger()
+        success_count = 0
         failed_chunks: list[int] = []
         total_nodes = 0
         total_relationships = 0
 
-        # Extract from each chunk, merging incrementally
-        for i, chunk in enumerate(chunks, start=1):
-            print(f"      [{i}/{total_chunks}] Processing...", end=" ", flush=True)
-            try:
-                graph = extractor.extract(chunk)
-                nodes_count = len(graph.nodes)
-                rels_count = len(graph.relationships)
+        # Extract chunks concurrently, merging incrementally in chunk order.
+        # closing() cancels queued chunks if this loop exits early.
+        with closing(
+            _extract_chunks(extractor, chunks, config.chunk_max_concurrency)
+        ) as results:
+            for i, outcome in results:
+                if isinstance(outcome, Exception):
+                    failed_chunks.append(i)
+                    error_msg = str(outcome)[:100]
+                    print(f"      [{i}/{total_chunks}] ✗ FAILED: {error_msg}")
+                    # Continue processing other chunks
+                    continue
+
+                nodes_count = len(outcome.nodes)
+                rels_count = len(outcome.relationships)
                 total_nodes += nodes_count
                 total_relationships += rels_count
-                print(f"✓ {nodes_count} nodes, {rels_count} rels")
-                graphs.append(graph)
+                print(f"      [{i}/{total_chunks}] ✓ {nodes_count} nodes, {rels_count} rels")
+                merger.add(outcome)
+                success_count += 1
 
-                # Merge and invoke callback with current progress
-                if on_chunk_complete is not None and graphs:
-                    merged_so_far = merge_graphs(graphs)
-                    on_chunk_complete(merged_so_far, i, total_chunks)
-
-            except Exception as e:
-                failed_chunks.append(i)
-                error_msg = str(e)[:100]
-                print(f"✗ FAILED: {error_msg}")
-                # Continue processing other chunks
+                # Invoke callback with current progress
+                if on_chunk_complete is not None:
+                    on_chunk_complete(merger.result(), i, total_chunks)
 
         # Summary
-        success_count = len(graphs)
-        fail_count = len(failed_chunks)
         print(f"      ─────────────────────────────────────")
         print(f"      Summary: {success_count}/{total_chunks} chunks succeeded")
         if failed_chunks:
             print(f"      Failed chunks: {failed_chunks}")
         print(f"      Total extracted: {total_nodes} nodes, {total_relationships} relationships")
 
-        if not graphs:
+        if success_count == 0:
             raise ValueError(
                 f"All {total_chunks} chunks failed to extract. "
                 "Check LLM connection and prompt compatibility."
             )
 
-        # Merge all graphs into one
-        return merge_graphs(graphs)
+        # Merged graph of all successful chunks
+        return merger.result()
 
     # Single extraction (chunking disabled or text fits in one chunk)
     return extractor.extract(text)
+
+
+def _extract_chunks(
+    extractor: LLMExtractor,
+    chunks: list[str],
+    max_concurrency: int,
+) -> Iterator[tuple[int, KnowledgeGraph | Exception]]:
+    """Extract graphs from chunks concurrently, yielding results in order.
+
+    At most max_concurrency chunks are submitted to a thread pool at a
+    time, so network-bound LLM calls overlap without queueing the whole
+    document. Results are buffered and yielded in chunk order as soon as
+    every earlier chunk has finished, which keeps merged node IDs
+    independent of completion order while still streaming progress.
+
+    If the consumer stops early (an exception in a progress callback,
+    KeyboardInterrupt, or closing the generator), chunks not yet started
+    are cancelled and the caller does not wait for in-flight calls.
+
+    Args:
+        extractor: The LLM extractor to call for each chunk.
+        chunks: Text chunks to extract from.
+        max_concurrency: Maximum number of chunks extracted at once.
+
+    Yields:
+        (chunk_index, outcome) tuples with 1-based chunk indices, where
+        outcome is the extracted KnowledgeGraph or the exception raised
+        while extracting that chunk.
+    """
+    max_workers = max(1, min(max_concurrency, len(chunks)))
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    pending_chunks = enumerate(chunks, start=1)
+    in_flight: dict[Future[KnowledgeGraph], int] = {}
+
+    def submit(count: int) -> None:
+        for i, chunk in islice(pending_chunks, count):
+            in_flight[executor.submit(extractor.extract, chunk)] = i
+
+    try:
+        submit(max_workers)
+        finished: dict[int, KnowledgeGraph | Exception] = {}
+        next_index = 1
+        while in_flight:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = in_flight.pop(future)
+                try:
+                    finished[index] = future.result()
+                except Exception as e:
+                    finished[index] = e
+            submit(len(done))
+
+            while next_index in finished:
+                yield next_index, finished.pop(next_index)
+                next_index += 1
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
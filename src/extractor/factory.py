@@ -2,20 +2,25 @@
 
 This module provides a factory function that creates the appropriate
 LLM extractor based on application configuration.
+
+Extractors are cached per provider settings so repeated calls reuse the
+same instance (and its underlying HTTP client) instead of rebuilding it.
+Provider modules are imported only when their extractor is built, so an
+unused provider's SDK is never loaded.
 """
 
+import functools
+
 from src.config import load_config
 from src.extractor.base import LLMExtractor
-from src.extractor.gemini_llm import GeminiExtractor
-from src.extractor.ollama_llm import OllamaExtractor
-from src.extractor.openai_llm import OpenAIExtractor
 
 
 def create_extractor() -> LLMExtractor:
     """Create an LLM extractor based on configuration.
 
     Reads the LLM_PROVIDER from environment configuration and returns
-    the appropriate extractor instance.
+    the appropriate extractor instance. Calls with identical provider
+    settings return the same cached instance.
 
     Returns:
         An LLMExtractor instance configured for the selected provider.
@@ -26,19 +31,59 @@ def create_extractor() -> LLMExtractor:
     config = load_config()
 
     if config.llm_provider == "openai":
-        return OpenAIExtractor(api_key=config.openai_api_key)
+        return _build_extractor("openai", None, None, config.openai_api_key)
 
     if config.llm_provider == "ollama":
-        return OllamaExtractor(
-            model=config.ollama_model,
-            base_url=config.ollama_base_url,
+        return _build_extractor(
+            "ollama", config.ollama_model, config.ollama_base_url, None
         )
 
     if config.llm_provider == "gemini":
-        return GeminiExtractor(
-            api_key=config.gemini_api_key,
-            model=config.gemini_model,
+        return _build_extractor(
+            "gemini", config.gemini_model, None, config.gemini_api_key
         )
 
     raise ValueError(f"Unsupported LLM provider: {config.llm_provider}")
 
+
+@functools.lru_cache(maxsize=4)
+def _build_extractor(
+    provider: str,
+    model: str | None,
+    base_url: str | None,
+    api_key: str | None,
+) -> LLMExtractor:
+    """Build an extractor for the given provider settings.
+
+    Results are memoized on the full settings tuple, so a change of
+    model, URL, or API key produces a fresh extractor. Failed builds
+    (e.g., missing API key) raise and are not cached.
+
+    Args:
+        provider: The LLM provider name.
+        model: Model name, for providers that take one.
+        base_url: API base URL, for providers that take one.
+        api_key: API key, for providers that require one.
+
+    Returns:
+        An LLMExtractor instance for the provider.
+
+    Raises:
+        ValueError: If the provider is not supported or is misconfigured.
+    """
+    if provider == "openai":
+        from src.extractor.openai_llm import OpenAIExtractor
+
+        return OpenAIExtractor(api_key=api_key)
+
+    if provider == "ollama":
+        from src.extractor.ollama_llm import OllamaExtractor
+
+        return OllamaExtractor(model=model, base_url=base_url)
+
+    if provider == "gemini":
+        from src.extractor.gemini_llm import GeminiExtractor
+
+        return GeminiExtractor(api_key=api_key, model=model)
+
+    raise ValueError(f"Unsupported LLM provider: {provider}")
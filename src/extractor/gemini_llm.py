@@ -13,9 +13,6 @@ import json
 import os
 from typing import Any, Final
 
-from google import genai
-from google.genai import types
-
 from src.extractor.base import LLMExtractor
 from src.schema import KnowledgeGraph
 
@@ -197,7 +194,17 @@ class GeminiExtractor(LLMExtractor):
             raise ValueError("GEMINI_API_KEY environment variable is not set")
 
         self.model = model or DEFAULT_MODEL
+
+        # Imported here so the SDK loads only when Gemini is the provider
+        from google import genai
+        from google.genai import types
+
         self.client = genai.Client(api_key=self.api_key)
+        self._generate_config = types.GenerateContentConfig(
+            temperature=0,
+            system_instruction=SYSTEM_PROMPT,
+            response_mime_type="application/json",
+        )
 
     def extract(self, text: str) -> KnowledgeGraph:
         """Extract a Knowledge Graph from raw text using Gemini.
@@ -214,11 +221,7 @@ class GeminiExtractor(LLMExtractor):
         response = self.client.models.generate_content(
             model=self.model,
             contents=text,
-            config=types.GenerateContentConfig(
-                temperature=0,
-                system_instruction=SYSTEM_PROMPT,
-                response_mime_type="application/json",
-            ),
+            config=self._generate_config,
         )
 
         content = response.text
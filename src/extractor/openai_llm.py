@@ -13,8 +13,6 @@ import json
 import os
 from typing import Any, Final
 
-from openai import OpenAI
-
 from src.extractor.base import LLMExtractor
 from src.schema import KnowledgeGraph
 
@@ -188,6 +186,9 @@ class OpenAIExtractor(LLMExtractor):
         if not self.api_key:
             raise ValueError("OPENAI_API_KEY environment variable is not set")
 
+        # Imported here so the SDK loads only when OpenAI is the provider
+        from openai import OpenAI
+
         self.client = OpenAI(api_key=self.api_key)
 
     def extract(self, text: str) -> KnowledgeGraph:
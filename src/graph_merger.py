@@ -7,6 +7,7 @@ Key features:
 - Re-numbers IDs to prevent collisions across chunks
 - Deduplicates nodes based on (type, name) pairs
 - Updates relationship references to point to deduplicated nodes
+- Incremental merging via GraphMerger for per-chunk progress snapshots
 """
 
 from src.schema import KnowledgeGraph, Node, Relationship
@@ -51,83 +52,127 @@ def merge_graphs(graphs: list[KnowledgeGraph]) -> KnowledgeGraph:
     if not graphs:
         raise ValueError("Cannot merge empty list of graphs")
 
-    if len(graphs) == 1:
-        return graphs[0]
+    merger = GraphMerger()
+    for graph in graphs:
+        merger.add(graph)
+    return merger.result()
 
-    # Use schema version from first graph
-    schema_version = graphs[0].schema_version
 
-    # Track unique nodes by (type, name) -> canonical ID
-    # This deduplicates nodes that appear in multiple chunks
-    node_key_to_id: dict[tuple[str, str], str] = {}
+class GraphMerger:
+    """Incrementally merge Knowledge Graphs, one chunk at a time.
 
-    # Track all unique nodes
-    unique_nodes: list[Node] = []
+    Maintains the deduplication state (a dict from (type, name) to
+    canonical ID and a set of seen relationship keys) across calls, so
+    each added graph is processed once in time proportional to its own
+    size. This lets callers take a merged snapshot after every chunk
+    without re-merging all previous chunks.
 
-    # Track ID mappings: (chunk_index, old_id) -> new_id
-    id_mapping: dict[tuple[int, str], str] = {}
+    Merging follows the same rules as merge_graphs: IDs are renumbered
+    with a type prefix, nodes with the same (type, name) are merged, and
+    relationships are rewritten to the canonical IDs and deduplicated.
+    """
 
-    # Counters for generating new unique IDs
-    type_counters: dict[str, int] = {
-        "Company": 0,
-        "RiskFactor": 0,
-        "DollarAmount": 0,
-    }
+    def __init__(self) -> None:
+        """Initialize an empty merger."""
+        self._first_graph: KnowledgeGraph | None = None
+        self._graph_count = 0
+
+        # Track unique nodes by (type, name) -> canonical ID
+        # This deduplicates nodes that appear in multiple chunks
+        self._node_key_to_id: dict[tuple[str, str], str] = {}
+        self._unique_nodes: list[Node] = []
+
+        # Counters for generating new unique IDs
+        self._type_counters: dict[str, int] = {
+            "Company": 0,
+            "RiskFactor": 0,
+            "DollarAmount": 0,
+        }
+
+        self._relationships: list[Relationship] = []
+        self._seen_relationships: set[tuple[str, str, str]] = set()
+
+    def add(self, graph: KnowledgeGraph) -> None:
+        """Merge one more graph into the accumulated result.
+
+        Args:
+            graph: A validated KnowledgeGraph, typically from one chunk.
+        """
+        if self._first_graph is None:
+            self._first_graph = graph
+        self._graph_count += 1
+
+        # ID mappings for this graph only: old_id -> new_id
+        id_mapping: dict[str, str] = {}
 
-    # First pass: collect and deduplicate nodes
-    for chunk_idx, graph in enumerate(graphs):
         for node in graph.nodes:
             node_key = (node.type, node.name)
 
-            if node_key in node_key_to_id:
+            existing_id = self._node_key_to_id.get(node_key)
+            if existing_id is not None:
                 # Node already exists - map this chunk's ID to existing ID
-                existing_id = node_key_to_id[node_key]
-                id_mapping[(chunk_idx, node.id)] = existing_id
-            else:
-                # New unique node - generate new ID
-                type_counters[node.type] = type_counters.get(node.type, 0) + 1
-                type_prefix = _get_type_prefix(node.type)
-                new_id = f"{type_prefix}_{type_counters[node.type]}"
-
-                # Store mapping
-                node_key_to_id[node_key] = new_id
-                id_mapping[(chunk_idx, node.id)] = new_id
-
-                # Create node with new ID
-                unique_nodes.append(Node(
-                    id=new_id,
-                    type=node.type,
-                    name=node.name,
-                ))
-
-    # Second pass: collect relationships with updated IDs
-    all_relationships: list[Relationship] = []
-    seen_relationships: set[tuple[str, str, str]] = set()
-
-    for chunk_idx, graph in enumerate(graphs):
+                id_mapping[node.id] = existing_id
+                continue
+
+            # New unique node - generate new ID
+            self._type_counters[node.type] = self._type_counters.get(node.type, 0) + 1
+            type_prefix = _get_type_prefix(node.type)
+            new_id = f"{type_prefix}_{self._type_counters[node.type]}"
+
+            self._node_key_to_id[node_key] = new_id
+            id_mapping[node.id] = new_id
+
+            # Create node with new ID. Inputs are already-validated
+            # graphs, so model_construct skips redundant validation.
+            self._unique_nodes.append(Node.model_construct(
+                id=new_id,
+                type=node.type,
+                name=node.name,
+            ))
+
         for rel in graph.relationships:
             # Map source and target to new IDs
-            new_source = id_mapping.get((chunk_idx, rel.source), rel.source)
-            new_target = id_mapping.get((chunk_idx, rel.target), rel.target)
+            new_source = id_mapping.get(rel.source, rel.source)
+            new_target = id_mapping.get(rel.target, rel.target)
 
             # Deduplicate relationships
             rel_key = (new_source, new_target, rel.relation)
-            if rel_key in seen_relationships:
+            if rel_key in self._seen_relationships:
                 continue
-            seen_relationships.add(rel_key)
+            self._seen_relationships.add(rel_key)
 
-            all_relationships.append(Relationship(
+            self._relationships.append(Relationship.model_construct(
                 source=new_source,
                 target=new_target,
                 relation=rel.relation,
                 confidence=rel.confidence,
             ))
 
-    return KnowledgeGraph(
-        schema_version=schema_version,
-        nodes=unique_nodes,
-        relationships=all_relationships,
-    )
+    def result(self) -> KnowledgeGraph:
+        """Return the merged graph for everything added so far.
+
+        A single added graph is returned unchanged, matching merge_graphs.
+        Otherwise a new KnowledgeGraph is returned whose lists are copies,
+        so later calls to add() do not alter previously returned graphs.
+        The schema_version is taken from the first added graph.
+
+        Returns:
+            The merged KnowledgeGraph.
+
+        Raises:
+            ValueError: If no graphs have been added.
+        """
+        if self._first_graph is None:
+            raise ValueError("Cannot merge empty list of graphs")
+
+        if self._graph_count == 1:
+            return self._first_graph
+
+        return KnowledgeGraph.model_construct(
+            schema_version=self._first_graph.schema_version,
+            nodes=list(self._unique_nodes),
+            relationships=list(self._relationships),
+        )
 
 
 def _get_type_prefix(node_type: str) -> str:
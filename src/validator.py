@@ -6,8 +6,23 @@ of a KnowledgeGraph instance beyond Pydantic schema validation.
 Includes auto-repair for common LLM extraction errors.
 """
 
+from collections import Counter
+from collections.abc import KeysView
+from typing import Final
+
 from src.schema import KnowledgeGraph, Relationship
 
+# Node types allowed at each end of a relation; relations not listed are
+# unconstrained. validate_and_repair_graph drops relationships that break these.
+_REL_SRC_TYPES: Final[dict[str, frozenset[str]]] = {
+    "OWNS": frozenset({"Company"}),
+}
+_REL_TGT_TYPES: Final[dict[str, frozenset[str]]] = {
+    "HAS_RISK": frozenset({"RiskFactor"}),
+    "REPORTS_AMOUNT": frozenset({"DollarAmount"}),
+    "OWNS": frozenset({"Company"}),
+}
+
 
 def validate_knowledge_graph(graph: KnowledgeGraph) -> None:
     """Validate the integrity of a KnowledgeGraph.
@@ -32,8 +47,8 @@ def validate_knowledge_graph(graph: KnowledgeGraph) -> None:
     if not graph.nodes:
         raise ValueError("KnowledgeGraph must contain at least one node")
 
-    _validate_unique_node_ids(graph)
-    _validate_relationship_references(graph)
+    node_ids = _validate_unique_node_ids(graph)
+    _validate_relationship_references(graph, node_ids)
     # Relationship type constraints are now auto-fixed, not validated
 
 
@@ -53,9 +68,8 @@ def validate_and_repair_graph(graph: KnowledgeGraph) -> KnowledgeGraph:
     if not graph.nodes:
         raise ValueError("KnowledgeGraph must contain at least one node")
     
-    # Build node map
-    node_map = {node.id: node for node in graph.nodes}
-    node_ids = set(node_map.keys())
+    # Map each node ID to its type once; doubles as the ID membership set
+    type_map = {node.id: node.type for node in graph.nodes}
     
     # Filter valid relationships
     valid_relationships: list[Relationship] = []
@@ -63,29 +77,21 @@ def validate_and_repair_graph(graph: KnowledgeGraph) -> KnowledgeGraph:
     
     for rel in graph.relationships:
         # Check if source and target exist
-        if rel.source not in node_ids or rel.target not in node_ids:
+        if rel.source not in type_map or rel.target not in type_map:
             removed_count += 1
             continue
         
-        source_type = node_map[rel.source].type
-        target_type = node_map[rel.target].type
-        
+        source_type = type_map[rel.source]
+        target_type = type_map[rel.target]
+
         # Validate relationship type constraints
         is_valid = True
-        
-        if rel.relation == "HAS_RISK":
-            # Target must be RiskFactor
-            if target_type != "RiskFactor":
-                is_valid = False
-        elif rel.relation == "REPORTS_AMOUNT":
-            # Target must be DollarAmount
-            if target_type != "DollarAmount":
-                is_valid = False
-        elif rel.relation == "OWNS":
-            # Both must be Company
-            if source_type != "Company" or target_type != "Company":
-                is_valid = False
-        
+
+        if (allowed := _REL_SRC_TYPES.get(rel.relation)) and source_type not in allowed:
+            is_valid = False
+        if (allowed := _REL_TGT_TYPES.get(rel.relation)) and target_type not in allowed:
+            is_valid = False
+
         if is_valid:
             valid_relationships.append(rel)
         else:
@@ -94,44 +100,43 @@ def validate_and_repair_graph(graph: KnowledgeGraph) -> KnowledgeGraph:
     if removed_count > 0:
         print(f"      ⚠️  Removed {removed_count} invalid relationships")
     
-    return KnowledgeGraph(
-        schema_version=graph.schema_version,
-        nodes=graph.nodes,
-        relationships=valid_relationships,
-    )
+    # Nodes and schema_version are unchanged, so copy rather than re-validate
+    return graph.model_copy(update={"relationships": valid_relationships})
 
 
-def _validate_unique_node_ids(graph: KnowledgeGraph) -> None:
+def _validate_unique_node_ids(graph: KnowledgeGraph) -> KeysView[str]:
     """Check that all node IDs in the graph are unique.
 
     Args:
         graph: The KnowledgeGraph instance to validate.
 
+    Returns:
+        The set of node IDs, for reuse by later checks.
+
     Raises:
         ValueError: If duplicate node IDs are found.
     """
-    seen_ids: set[str] = set()
-    duplicates: list[str] = []
-
-    for node in graph.nodes:
-        if node.id in seen_ids:
-            duplicates.append(node.id)
-        seen_ids.add(node.id)
+    id_counts = Counter(node.id for node in graph.nodes)
+    duplicates = [node_id for node_id, count in id_counts.items() if count > 1]
 
     if duplicates:
         raise ValueError(f"Duplicate node IDs found: {duplicates}")
 
+    return id_counts.keys()
+
 
-def _validate_relationship_references(graph: KnowledgeGraph) -> None:
+def _validate_relationship_references(
+    graph: KnowledgeGraph, node_ids: KeysView[str]
+) -> None:
     """Check that all relationship sources and targets reference existing nodes.
 
     Args:
         graph: The KnowledgeGraph instance to validate.
+        node_ids: The set of node IDs in the graph.
 
     Raises:
         ValueError: If a relationship references a non-existent node ID.
     """
-    node_ids: set[str] = {node.id for node in graph.nodes}
     invalid_references: list[str] = []
 
     for rel in graph.relationships:
@@ -39,13 +39,16 @@ def render_graph(graph: KnowledgeGraph, output_path: Path = OUTPUT_PATH) -> None
     Raises:
         OSError: If the output directory cannot be created or file cannot be written.
     """
-    G = _build_networkx_graph(graph)
-    _render_and_save(G, graph, output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    _draw_and_save(build_nx_graph(graph), output_path)
 
 
-def _build_networkx_graph(graph: KnowledgeGraph) -> nx.DiGraph:
+def build_nx_graph(graph: KnowledgeGraph) -> nx.DiGraph:
     """Build a directed NetworkX graph from a KnowledgeGraph.
 
+    Each node carries ``label`` (the node name) and ``type`` attributes;
+    each edge carries a ``label`` attribute with the relation.
+
     Args:
         graph: The KnowledgeGraph instance to convert.
 
@@ -71,27 +74,24 @@ def _build_networkx_graph(graph: KnowledgeGraph) -> nx.DiGraph:
     return G
 
 
-def _render_and_save(
-    G: nx.DiGraph,
-    graph: KnowledgeGraph,
-    output_path: Path,
-) -> None:
-    """Render the NetworkX graph and save to an image file.
+def _draw_and_save(G: nx.DiGraph, output_path: Path) -> None:
+    """Draw a graph built by build_nx_graph and save it to an image file.
+
+    Node colors and labels come from the ``type`` and ``label`` node
+    attributes, and edge labels from the ``label`` edge attribute.
 
     Args:
         G: The NetworkX DiGraph to render.
-        graph: The original KnowledgeGraph (used for color mapping).
-        output_path: Path where the image will be saved.
+        output_path: Path where the image will be saved. Its parent
+            directory must already exist.
     """
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-
     fig, ax = plt.subplots(figsize=(12, 8))
 
     pos = nx.spring_layout(G, seed=42)
 
-    node_colors = [NODE_COLORS.get(node.type, "gray") for node in graph.nodes]
+    node_colors = [NODE_COLORS.get(node_type, "gray") for _, node_type in G.nodes(data="type")]
 
-    node_labels = {node.id: node.name for node in graph.nodes}
+    node_labels = {node_id: label for node_id, label in G.nodes(data="label") if label is not None}
 
     nx.draw_networkx_nodes(
         G,
@@ -120,7 +120,7 @@ def _render_and_save(
         ax=ax,
     )
 
-    edge_labels = {(rel.source, rel.target): rel.relation for rel in graph.relationships}
+    edge_labels = {(source, target): label for source, target, label in G.edges(data="label")}
     nx.draw_networkx_edge_labels(
         G,
         pos,
@@ -4,16 +4,68 @@ This module provides functionality to render a KnowledgeGraph
 as a Mermaid flowchart diagram for lightweight visualization.
 """
 
+import functools
+import hashlib
+from importlib import resources
 from pathlib import Path
 
-from src.schema import KnowledgeGraph, Node
+from src.schema import KnowledgeGraph, Node, Relationship
 
 # Default output path for the Mermaid diagram
 OUTPUT_PATH: Path = Path("visuals/graph.mmd")
 
+# Suffix appended to an output file name for its content digest sidecar
+DIGEST_SUFFIX: str = ".sha"
 
+# File names of the shared assets written next to generated HTML pages
+HTML_STYLESHEET_NAME: str = "style.css"
+HTML_SCRIPT_NAME: str = "mermaid_init.js"
+MERMAID_SCRIPT_NAME: str = "mermaid.min.js"
+
+# Mermaid.js CDN location used when no bundled copy is available
+MERMAID_CDN_URL: str = "https://cdn.jsdelivr.net/npm/mermaid/dist/mermaid.min.js"
+
+# Location of the optional vendored Mermaid.js inside the src package
+BUNDLED_MERMAID_RESOURCE: str = "assets/mermaid.min.js"
+
+
+def _write_if_changed(output_path: Path, content: bytes | bytearray) -> None:
+    """Write content to a file unless an identical copy is already on disk.
+
+    A BLAKE2b digest of the content is stored in a sidecar file next to
+    the output. When the output exists with the expected size and the
+    stored digest matches, the write is skipped entirely. The size check
+    catches outputs that were truncated or edited by hand since the last
+    render.
+
+    Args:
+        output_path: Path of the file to write.
+        content: Encoded file content.
+
+    Raises:
+        OSError: If the output or digest file cannot be written.
+    """
+    digest = hashlib.blake2b(content, digest_size=16).hexdigest()
+    digest_path = output_path.with_name(output_path.name + DIGEST_SUFFIX)
+
+    if (
+        output_path.exists()
+        and output_path.stat().st_size == len(content)
+        and digest_path.exists()
+        and digest_path.read_text(encoding="utf-8") == digest
+    ):
+        return
+
+    output_path.write_bytes(content)
+    digest_path.write_text(digest, encoding="utf-8")
+
+
+@functools.lru_cache(maxsize=4096)
 def _escape_mermaid_label(text: str) -> str:
     """Escape special characters in text for Mermaid compatibility.
+
+    Results are memoized, since the same names and contexts recur across
+    nodes and renders.
     
     Args:
         text: Raw text that may contain special characters.
@@ -72,15 +124,18 @@ def _get_node_shape(node: Node) -> str:
     if len(label) > 80:
         label = label[:77] + "..."
 
-    if node.type == "Company":
-        return f'{node.id}["{label}"]'
-    elif node.type == "RiskFactor":
-        return f'{node.id}("{label}")'
-    elif node.type == "DollarAmount":
-        return f'{node.id}[/"{label}"/]'
-    else:
-        # Fallback to rectangle
-        return f'{node.id}["{label}"]'
+    match node.type:
+        case "Company":
+            prefix, suffix = '["', '"]'
+        case "RiskFactor":
+            prefix, suffix = '("', '")'
+        case "DollarAmount":
+            prefix, suffix = '[/"', '"/]'
+        case _:
+            # Fallback to rectangle
+            prefix, suffix = '["', '"]'
+
+    return f"{node.id}{prefix}{label}{suffix}"
 
 
 def render_mermaid(graph: KnowledgeGraph, output_path: Path = OUTPUT_PATH) -> None:
@@ -101,65 +156,86 @@ def render_mermaid(graph: KnowledgeGraph, output_path: Path = OUTPUT_PATH) -> No
 
     Returns:
         None. The Mermaid diagram is saved to the specified output path.
+        The write is skipped if the file already holds identical content.
 
     Raises:
         OSError: If the output directory cannot be created or file cannot be written.
     """
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    lines: list[str] = []
+    # Encode line by line into a single buffer and write the bytes directly,
+    # avoiding a full-document str copy followed by a second encode pass
+    buffer = bytearray()
+    for line in _build_flowchart_lines(graph, "TD"):
+        buffer += line.encode("utf-8")
+        buffer += b"\n"
 
-    # Mermaid flowchart header
-    lines.append("flowchart TD")
-    lines.append("")
+    _write_if_changed(output_path, buffer)
 
-    # Add node definitions
-    lines.append("    %% Node definitions")
-    for node in graph.nodes:
-        node_syntax = _get_node_shape(node)
-        lines.append(f"    {node_syntax}")
 
-    lines.append("")
+def _build_flowchart_lines(graph: KnowledgeGraph, direction: str) -> list[str]:
+    """Build the lines of a Mermaid flowchart for a KnowledgeGraph.
 
-    # Add relationship edges
-    lines.append("    %% Relationships")
-    for rel in graph.relationships:
-        lines.append(f"    {rel.source} -->|{rel.relation}| {rel.target}")
+    Node and edge lines are produced by list comprehensions over the
+    graph's nodes and relationships rather than explicit append loops,
+    which keeps the per-element work in the interpreter's fast path
+    for large graphs.
 
-    # Write to file
-    content = "\n".join(lines) + "\n"
-    output_path.write_text(content, encoding="utf-8")
+    Args:
+        graph: A validated KnowledgeGraph instance.
+        direction: Mermaid flowchart direction (e.g., "TD" or "LR").
 
+    Returns:
+        List of Mermaid lines without trailing newlines.
+    """
+    return [
+        f"flowchart {direction}",
+        "",
+        "    %% Node definitions",
+        *_format_node_lines(graph.nodes),
+        "",
+        "    %% Relationships",
+        *_format_edge_lines(graph.relationships),
+    ]
 
-def _generate_mermaid_content(graph: KnowledgeGraph) -> str:
-    """Generate Mermaid diagram content from a KnowledgeGraph.
+
+def _format_node_lines(nodes: list[Node]) -> list[str]:
+    """Format node definition lines for a Mermaid flowchart.
 
     Args:
-        graph: A validated KnowledgeGraph instance.
+        nodes: Nodes to format.
 
     Returns:
-        Mermaid diagram content as a string.
+        One indented Mermaid node definition per node.
     """
-    lines: list[str] = []
+    return [f"    {_get_node_shape(node)}" for node in nodes]
 
-    # Mermaid flowchart header
-    lines.append("flowchart TD")
-    lines.append("")
 
-    # Add node definitions
-    lines.append("    %% Node definitions")
-    for node in graph.nodes:
-        node_syntax = _get_node_shape(node)
-        lines.append(f"    {node_syntax}")
+def _format_edge_lines(relationships: list[Relationship]) -> list[str]:
+    """Format relationship edge lines for a Mermaid flowchart.
 
-    lines.append("")
+    Args:
+        relationships: Relationships to format.
 
-    # Add relationship edges
-    lines.append("    %% Relationships")
-    for rel in graph.relationships:
-        lines.append(f"    {rel.source} -->|{rel.relation}| {rel.target}")
+    Returns:
+        One indented Mermaid edge per relationship.
+    """
+    return [
+        f"    {rel.source} -->|{rel.relation}| {rel.target}"
+        for rel in relationships
+    ]
+
+
+def _generate_mermaid_content(graph: KnowledgeGraph) -> str:
+    """Generate Mermaid diagram content from a KnowledgeGraph.
+
+    Args:
+        graph: A validated KnowledgeGraph instance.
 
-    return "\n".join(lines)
+    Returns:
+        Mermaid diagram content as a string.
+    """
+    return "\n".join(_build_flowchart_lines(graph, "TD"))
 
 
 def _group_connected_nodes(graph: KnowledgeGraph, page_size: int = 50) -> list[list[str]]:
@@ -359,6 +435,11 @@ def render_mermaid_html(graph: KnowledgeGraph, output_path: Path) -> None:
     Creates a full horizontal scrollable view with zoom and pan controls.
     Works for both small and large graphs.
 
+    The page is not self-contained: it links the shared ``style.css`` and
+    ``mermaid_init.js`` (and ``mermaid.min.js`` when a bundled copy
+    exists), which are written next to it and must stay in the same
+    directory when the page is moved or served.
+
     Args:
         graph: A validated KnowledgeGraph instance to visualize.
         output_path: Path where the HTML file will be saved.
@@ -371,315 +452,554 @@ def render_mermaid_html(graph: KnowledgeGraph, output_path: Path) -> None:
     """
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    node_count = len(graph.nodes)
-    rel_count = len(graph.relationships)
-    
     # Use the full horizontal scrollable view for all graphs
     _render_fullgraph_html(graph, output_path)
-    return
 
-    # For smaller graphs, render full diagram
-    mermaid_content = _generate_mermaid_content(graph)
 
-    # Count stats for display
-    node_count = len(graph.nodes)
-    rel_count = len(graph.relationships)
-    
-    # HTML template - scrollable full-page layout for large graphs
-    html_template = f'''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Financial Detective - Knowledge Graph ({node_count} nodes)</title>
-    <style>
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-        html {{
-            scroll-behavior: smooth;
-        }}
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            background: #f5f5f5;
-            color: #333;
-        }}
-        
-        /* Fixed header */
-        header {{
-            position: fixed;
-            top: 0;
-            left: 0;
-            right: 0;
-            z-index: 1000;
-            background: linear-gradient(135deg, #1a1a2e 0%, #16213e 100%);
-            color: white;
-            padding: 1rem 2rem;
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            box-shadow: 0 4px 20px rgba(0,0,0,0.3);
-        }}
-        header h1 {{
-            font-size: 1.5rem;
-            font-weight: 700;
-        }}
-        .stats {{
-            display: flex;
-            gap: 1.5rem;
-            font-size: 0.9rem;
-        }}
-        .stat {{
-            background: rgba(255,255,255,0.15);
-            padding: 0.5rem 1rem;
-            border-radius: 6px;
-        }}
-        .stat-value {{
-            font-weight: 700;
-            font-size: 1.1rem;
-        }}
-        
-        /* Controls bar */
-        .controls {{
-            position: fixed;
-            top: 70px;
-            left: 0;
-            right: 0;
-            z-index: 999;
-            background: white;
-            padding: 0.75rem 2rem;
-            display: flex;
-            gap: 1rem;
-            align-items: center;
-            border-bottom: 1px solid #ddd;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-        }}
-        .controls button {{
-            padding: 0.5rem 1rem;
-            border: none;
-            border-radius: 6px;
-            cursor: pointer;
-            font-size: 0.9rem;
-            transition: all 0.2s;
-        }}
-        .controls button:hover {{
-            transform: translateY(-1px);
-        }}
-        .btn-primary {{
-            background: #2563eb;
-            color: white;
-        }}
-        .btn-secondary {{
-            background: #e5e7eb;
-            color: #374151;
-        }}
-        .zoom-info {{
-            margin-left: auto;
-            color: #666;
-            font-size: 0.85rem;
-        }}
-        
-        /* Main diagram area - scrollable */
-        main {{
-            margin-top: 130px;
-            padding: 2rem;
-            min-height: calc(100vh - 130px);
-        }}
-        .diagram-wrapper {{
-            background: white;
-            border-radius: 12px;
-            box-shadow: 0 4px 20px rgba(0,0,0,0.1);
-            padding: 2rem;
-            overflow: auto;
-        }}
-        .mermaid {{
-            min-width: max-content;
-        }}
-        .mermaid svg {{
-            max-width: none !important;
-            height: auto !important;
-        }}
-        
-        /* Node styling */
-        .node rect {{
-            stroke-width: 2px !important;
-        }}
-        .node .label {{
-            font-size: 14px !important;
-        }}
-        .edgeLabel {{
-            font-size: 12px !important;
-            font-weight: 600 !important;
-            background: white !important;
-            padding: 2px 6px !important;
-            border-radius: 4px !important;
-        }}
-        
-        /* Legend */
-        .legend {{
-            position: fixed;
-            bottom: 20px;
-            right: 20px;
-            background: white;
-            padding: 1rem;
-            border-radius: 8px;
-            box-shadow: 0 4px 15px rgba(0,0,0,0.15);
-            font-size: 0.85rem;
-            z-index: 100;
-        }}
-        .legend h3 {{
-            margin-bottom: 0.5rem;
-            font-size: 0.9rem;
-            color: #666;
-        }}
-        .legend-item {{
-            display: flex;
-            align-items: center;
-            gap: 0.5rem;
-            margin: 0.3rem 0;
-        }}
-        .legend-shape {{
-            width: 20px;
-            height: 14px;
-            border: 2px solid #333;
-        }}
-        .shape-rect {{ border-radius: 2px; }}
-        .shape-rounded {{ border-radius: 7px; }}
-        .shape-parallelogram {{ 
-            transform: skewX(-10deg);
-            width: 24px;
-        }}
-        
-        /* Scroll indicator */
-        .scroll-hint {{
-            text-align: center;
-            padding: 1rem;
-            color: #666;
-            font-size: 0.9rem;
-        }}
-    </style>
-</head>
-<body>
-    <header>
-        <h1>📊 Financial Detective</h1>
-        <div class="stats">
-            <div class="stat">
-                <span class="stat-value">{node_count}</span> Nodes
-            </div>
-            <div class="stat">
-                <span class="stat-value">{rel_count}</span> Relationships
-            </div>
-        </div>
-    </header>
-    
-    <div class="controls">
-        <button class="btn-primary" onclick="zoomIn()">🔍 Zoom In</button>
-        <button class="btn-primary" onclick="zoomOut()">🔍 Zoom Out</button>
-        <button class="btn-secondary" onclick="resetZoom()">↺ Reset</button>
-        <button class="btn-secondary" onclick="scrollToTop()">⬆ Top</button>
-        <button class="btn-secondary" onclick="scrollToBottom()">⬇ Bottom</button>
-        <span class="zoom-info">Scroll to navigate • Use zoom buttons to resize</span>
-    </div>
-    
-    <main>
-        <div class="scroll-hint">⬇ Scroll down to explore the full graph ⬇</div>
-        <div class="diagram-wrapper" id="diagram">
-            <pre class="mermaid" id="mermaid-diagram">
-{mermaid_content}
-            </pre>
-        </div>
-        <div class="scroll-hint">⬆ Scroll up to return to the top ⬆</div>
-    </main>
-    
-    <div class="legend">
-        <h3>Legend</h3>
-        <div class="legend-item">
-            <div class="legend-shape shape-rect"></div>
-            <span>Company</span>
-        </div>
-        <div class="legend-item">
-            <div class="legend-shape shape-rounded"></div>
-            <span>Risk Factor</span>
-        </div>
-        <div class="legend-item">
-            <div class="legend-shape shape-parallelogram"></div>
-            <span>Dollar Amount</span>
-        </div>
-    </div>
+# Dark-theme stylesheet shared by every full-graph HTML page
+_FULLGRAPH_CSS: str = """\
+* { margin: 0; padding: 0; box-sizing: border-box; }
+html, body {
+    height: 100%;
+    width: 100%;
+    overflow: hidden;
+}
+body {
+    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+    background: #0d1117;
+    display: flex;
+    flex-direction: column;
+}
 
-    <script src="https://cdn.jsdelivr.net/npm/mermaid/dist/mermaid.min.js"></script>
-    <script>
-        let currentZoom = 1;
-        
-        mermaid.initialize({{
-            startOnLoad: true,
-            theme: 'default',
-            maxTextSize: 500000,
-            maxEdges: 5000,
-            flowchart: {{
-                useMaxWidth: false,
-                htmlLabels: true,
-                curve: 'basis',
-                nodeSpacing: 50,
-                rankSpacing: 70,
-                padding: 15
-            }},
-            themeVariables: {{
-                fontSize: '14px',
-                fontFamily: '-apple-system, BlinkMacSystemFont, Segoe UI, Roboto, sans-serif'
-            }}
-        }});
-        
-        function zoomIn() {{
-            currentZoom = Math.min(currentZoom + 0.2, 3);
-            applyZoom();
-        }}
-        
-        function zoomOut() {{
-            currentZoom = Math.max(currentZoom - 0.2, 0.3);
-            applyZoom();
-        }}
-        
-        function resetZoom() {{
-            currentZoom = 1;
-            applyZoom();
-        }}
-        
-        function applyZoom() {{
-            const svg = document.querySelector('.mermaid svg');
-            if (svg) {{
-                svg.style.transform = `scale(${{currentZoom}})`;
-                svg.style.transformOrigin = 'top left';
-            }}
-        }}
-        
-        function scrollToTop() {{
-            window.scrollTo({{ top: 0, behavior: 'smooth' }});
-        }}
-        
-        function scrollToBottom() {{
-            window.scrollTo({{ top: document.body.scrollHeight, behavior: 'smooth' }});
-        }}
-    </script>
-</body>
-</html>
-'''
+/* Compact header */
+header {
+    background: linear-gradient(135deg, #161b22 0%, #0d1117 100%);
+    color: white;
+    padding: 0.5rem 1rem;
+    display: flex;
+    justify-content: space-between;
+    align-items: center;
+    box-shadow: 0 2px 10px rgba(0,0,0,0.5);
+    flex-shrink: 0;
+    border-bottom: 1px solid #30363d;
+}
+header h1 { 
+    font-size: 1rem; 
+    font-weight: 600;
+    color: #58a6ff;
+}
+.stats {
+    display: flex;
+    gap: 0.75rem;
+    font-size: 0.75rem;
+}
+.stat {
+    background: rgba(88,166,255,0.15);
+    padding: 0.25rem 0.6rem;
+    border-radius: 4px;
+    border: 1px solid rgba(88,166,255,0.3);
+}
+.stat-value { font-weight: 700; color: #58a6ff; }
+
+/* Controls bar - more compact */
+.controls {
+    background: #161b22;
+    padding: 0.4rem 1rem;
+    display: flex;
+    gap: 0.5rem;
+    align-items: center;
+    border-bottom: 1px solid #30363d;
+    flex-shrink: 0;
+    flex-wrap: wrap;
+}
+.controls button {
+    padding: 0.35rem 0.7rem;
+    border: none;
+    border-radius: 4px;
+    cursor: pointer;
+    font-size: 0.75rem;
+    font-weight: 500;
+    transition: all 0.15s;
+}
+.controls button:hover {
+    transform: translateY(-1px);
+}
+.btn-zoom {
+    background: #238636;
+    color: white;
+}
+.btn-zoom:hover {
+    background: #2ea043;
+}
+.btn-secondary {
+    background: #21262d;
+    color: #c9d1d9;
+    border: 1px solid #30363d;
+}
+.btn-secondary:hover {
+    background: #30363d;
+}
+.btn-fit {
+    background: #1f6feb;
+    color: white;
+}
+.btn-fit:hover {
+    background: #388bfd;
+}
+.zoom-display {
+    background: #0d1117;
+    color: #58a6ff;
+    padding: 0.3rem 0.6rem;
+    border-radius: 4px;
+    font-weight: 600;
+    font-size: 0.75rem;
+    min-width: 55px;
+    text-align: center;
+    border: 1px solid #30363d;
+}
+.separator {
+    width: 1px;
+    height: 20px;
+    background: #30363d;
+    margin: 0 0.25rem;
+}
+.hint {
+    margin-left: auto;
+    color: #8b949e;
+    font-size: 0.7rem;
+}
+.zoom-slider {
+    width: 100px;
+    height: 4px;
+    -webkit-appearance: none;
+    background: #30363d;
+    border-radius: 2px;
+    outline: none;
+}
+.zoom-slider::-webkit-slider-thumb {
+    -webkit-appearance: none;
+    width: 14px;
+    height: 14px;
+    background: #58a6ff;
+    border-radius: 50%;
+    cursor: pointer;
+}
+
+/* Main diagram area - full viewport */
+.diagram-wrapper {
+    flex: 1;
+    overflow: auto;
+    background: #0d1117;
+    cursor: grab;
+    position: relative;
+}
+.diagram-wrapper:active {
+    cursor: grabbing;
+}
+.diagram-container {
+    display: inline-block;
+    padding: 1rem;
+    min-width: 100%;
+    min-height: 100%;
+    transform-origin: 0 0;
+    transition: transform 0.05s ease-out;
+}
+.mermaid {
+    background: #161b22;
+    border-radius: 8px;
+    padding: 1rem;
+    box-shadow: 0 0 30px rgba(0,0,0,0.5);
+    display: inline-block;
+    border: 1px solid #30363d;
+}
+.mermaid svg {
+    max-width: none !important;
+    height: auto !important;
+}
+/* Style the SVG nodes for dark theme */
+.mermaid .node rect, .mermaid .node polygon {
+    fill: #21262d !important;
+    stroke: #58a6ff !important;
+}
+.mermaid .node .label {
+    color: #c9d1d9 !important;
+}
+.mermaid .edgePath path {
+    stroke: #8b949e !important;
+}
+.mermaid .edgeLabel {
+    background-color: #161b22 !important;
+    color: #8b949e !important;
+}
 
-    output_path.write_text(html_template, encoding="utf-8")
+/* Floating Legend - collapsible */
+.legend {
+    position: fixed;
+    bottom: 15px;
+    right: 15px;
+    background: #161b22;
+    padding: 0.6rem;
+    border-radius: 6px;
+    box-shadow: 0 4px 15px rgba(0,0,0,0.4);
+    font-size: 0.7rem;
+    z-index: 100;
+    border: 1px solid #30363d;
+    max-width: 140px;
+}
+.legend h3 { 
+    margin-bottom: 0.4rem; 
+    color: #58a6ff; 
+    font-size: 0.75rem;
+    font-weight: 600;
+    cursor: pointer;
+}
+.legend-item { 
+    display: flex; 
+    align-items: center; 
+    gap: 0.4rem; 
+    margin: 0.2rem 0;
+    color: #8b949e;
+}
+.legend-shape { 
+    width: 14px; 
+    height: 10px; 
+    border: 1.5px solid #58a6ff; 
+    background: #21262d;
+}
+.shape-rect { border-radius: 2px; }
+.shape-rounded { border-radius: 4px; }
+.shape-parallelogram { transform: skewX(-10deg); width: 18px; }
+
+/* Loading */
+.loading {
+    display: flex;
+    flex-direction: column;
+    align-items: center;
+    justify-content: center;
+    height: 100%;
+    color: #8b949e;
+    font-size: 1rem;
+    gap: 1rem;
+}
+.loading-spinner {
+    width: 40px;
+    height: 40px;
+    border: 3px solid #30363d;
+    border-top-color: #58a6ff;
+    border-radius: 50%;
+    animation: spin 0.8s linear infinite;
+}
+@keyframes spin {
+    to { transform: rotate(360deg); }
+}
+
+/* Quick zoom panel */
+.quick-zoom {
+    position: fixed;
+    left: 15px;
+    bottom: 15px;
+    background: #161b22;
+    padding: 0.5rem;
+    border-radius: 6px;
+    border: 1px solid #30363d;
+    display: flex;
+    flex-direction: column;
+    gap: 0.3rem;
+    z-index: 100;
+}
+.quick-zoom button {
+    width: 32px;
+    height: 32px;
+    border: none;
+    background: #21262d;
+    color: #c9d1d9;
+    border-radius: 4px;
+    cursor: pointer;
+    font-size: 1rem;
+    display: flex;
+    align-items: center;
+    justify-content: center;
+}
+.quick-zoom button:hover {
+    background: #30363d;
+}
+"""
+
+# Mermaid initialization, zoom/pan and keyboard handling for full-graph pages
+_FULLGRAPH_JS: str = """\
+let zoom = 1;
+const minZoom = 0.05;
+const maxZoom = 2;
+const zoomStep = 0.05;
+
+const wrapper = document.getElementById('wrapper');
+const container = document.getElementById('container');
+const loading = document.getElementById('loading');
+const diagram = document.getElementById('diagram');
+const zoomSlider = document.getElementById('zoomSlider');
+
+// Initialize Mermaid with dark theme
+mermaid.initialize({
+    startOnLoad: false,
+    theme: 'dark',
+    maxTextSize: 2000000,
+    maxEdges: 20000,
+    flowchart: {
+        useMaxWidth: false,
+        htmlLabels: true,
+        curve: 'basis',
+        nodeSpacing: 20,
+        rankSpacing: 40,
+        padding: 15
+    },
+    themeVariables: {
+        fontSize: '10px',
+        primaryColor: '#21262d',
+        primaryTextColor: '#c9d1d9',
+        primaryBorderColor: '#58a6ff',
+        lineColor: '#8b949e',
+        secondaryColor: '#30363d',
+        tertiaryColor: '#161b22'
+    }
+});
+
+// Render the diagram
+async function renderDiagram() {
+    try {
+        const content = diagram.textContent.trim();
+        const { svg } = await mermaid.render('rendered-graph', content);
+        diagram.innerHTML = svg;
+        diagram.style.display = 'block';
+        loading.style.display = 'none';
+
+        // Auto-fit to screen after render with slight delay
+        setTimeout(() => {
+            fitToScreen();
+            wrapper.scrollTo(0, 0);
+        }, 200);
+    } catch (e) {
+        loading.innerHTML = '<div style="color:#f85149;">Error rendering: ' + e.message + '</div><div style="margin-top:1rem;font-size:0.8rem;color:#8b949e;">Try refreshing the page or use a different browser.</div>';
+    }
+}
+
+// Update zoom display and slider
+function updateZoom() {
+    container.style.transform = `scale(${zoom})`;
+    const percent = Math.round(zoom * 100);
+    document.getElementById('zoomLevel').textContent = percent + '%';
+    zoomSlider.value = percent;
+}
+
+// Set zoom directly
+function setZoom(newZoom) {
+    zoom = Math.max(minZoom, Math.min(maxZoom, newZoom));
+    updateZoom();
+}
+
+// Set zoom from slider
+function setZoomFromSlider(value) {
+    setZoom(value / 100);
+}
+
+function zoomIn() {
+    const step = zoom < 0.2 ? 0.02 : (zoom < 0.5 ? 0.05 : 0.1);
+    setZoom(zoom + step);
+}
+
+function zoomOut() {
+    const step = zoom < 0.2 ? 0.02 : (zoom < 0.5 ? 0.05 : 0.1);
+    setZoom(zoom - step);
+}
+
+function resetZoom() {
+    zoom = 1;
+    updateZoom();
+    wrapper.scrollTo(0, 0);
+}
+
+function fitToScreen() {
+    const svg = diagram.querySelector('svg');
+    if (!svg) return;
+
+    const bbox = svg.getBBox ? svg.getBBox() : null;
+    const svgWidth = bbox ? bbox.width : (svg.viewBox?.baseVal?.width || svg.clientWidth);
+    const svgHeight = bbox ? bbox.height : (svg.viewBox?.baseVal?.height || svg.clientHeight);
+
+    const wrapperWidth = wrapper.clientWidth - 40;
+    const wrapperHeight = wrapper.clientHeight - 40;
+
+    const scaleX = wrapperWidth / svgWidth;
+    const scaleY = wrapperHeight / svgHeight;
+
+    zoom = Math.max(minZoom, Math.min(scaleX, scaleY, 1));
+
+    updateZoom();
+
+    setTimeout(() => {
+        const containerWidth = container.scrollWidth * zoom;
+        const containerHeight = container.scrollHeight * zoom;
+        const scrollX = Math.max(0, (containerWidth - wrapperWidth) / 2);
+        const scrollY = Math.max(0, (containerHeight - wrapperHeight) / 2);
+        wrapper.scrollTo(scrollX, scrollY);
+    }, 50);
+}
+
+// Scroll navigation
+function scrollTo(direction) {
+    const amount = 300;
+    switch(direction) {
+        case 'left': wrapper.scrollBy(-amount, 0); break;
+        case 'right': wrapper.scrollBy(amount, 0); break;
+        case 'top': wrapper.scrollBy(0, -amount); break;
+        case 'bottom': wrapper.scrollBy(0, amount); break;
+    }
+}
+
+// Mouse wheel zoom (with Ctrl or Meta key)
+wrapper.addEventListener('wheel', (e) => {
+    if (e.ctrlKey || e.metaKey) {
+        e.preventDefault();
+        const delta = e.deltaY > 0 ? -1 : 1;
+        const step = zoom < 0.2 ? 0.01 : (zoom < 0.5 ? 0.02 : 0.05);
+        setZoom(zoom + (delta * step));
+    }
+}, { passive: false });
+
+// Drag to pan
+let isDragging = false;
+let startX, startY, scrollLeft, scrollTop;
+
+wrapper.addEventListener('mousedown', (e) => {
+    isDragging = true;
+    startX = e.pageX - wrapper.offsetLeft;
+    startY = e.pageY - wrapper.offsetTop;
+    scrollLeft = wrapper.scrollLeft;
+    scrollTop = wrapper.scrollTop;
+    wrapper.style.cursor = 'grabbing';
+});
+
+wrapper.addEventListener('mouseleave', () => {
+    isDragging = false;
+    wrapper.style.cursor = 'grab';
+});
+
+wrapper.addEventListener('mouseup', () => {
+    isDragging = false;
+    wrapper.style.cursor = 'grab';
+});
+
+wrapper.addEventListener('mousemove', (e) => {
+    if (!isDragging) return;
+    e.preventDefault();
+    const x = e.pageX - wrapper.offsetLeft;
+    const y = e.pageY - wrapper.offsetTop;
+    wrapper.scrollLeft = scrollLeft - (x - startX);
+    wrapper.scrollTop = scrollTop - (y - startY);
+});
+
+// Keyboard navigation
+document.addEventListener('keydown', (e) => {
+    if (e.target.tagName === 'INPUT') return;
+
+    const scrollAmount = e.shiftKey ? 200 : 50;
+
+    switch(e.key) {
+        case '+': case '=': zoomIn(); e.preventDefault(); break;
+        case '-': case '_': zoomOut(); e.preventDefault(); break;
+        case '0': resetZoom(); e.preventDefault(); break;
+        case 'f': case 'F': fitToScreen(); e.preventDefault(); break;
+        case 'ArrowLeft': wrapper.scrollBy(-scrollAmount, 0); e.preventDefault(); break;
+        case 'ArrowRight': wrapper.scrollBy(scrollAmount, 0); e.preventDefault(); break;
+        case 'ArrowUp': wrapper.scrollBy(0, -scrollAmount); e.preventDefault(); break;
+        case 'ArrowDown': wrapper.scrollBy(0, scrollAmount); e.preventDefault(); break;
+        case 'Home': wrapper.scrollTo(0, 0); e.preventDefault(); break;
+        case 'End': wrapper.scrollTo(wrapper.scrollWidth, wrapper.scrollHeight); e.preventDefault(); break;
+    }
+});
+
+// Touch support for mobile
+let touchStartX, touchStartY;
+wrapper.addEventListener('touchstart', (e) => {
+    if (e.touches.length === 1) {
+        touchStartX = e.touches[0].pageX;
+        touchStartY = e.touches[0].pageY;
+    }
+}, { passive: true });
+
+wrapper.addEventListener('touchmove', (e) => {
+    if (e.touches.length === 1) {
+        const dx = touchStartX - e.touches[0].pageX;
+        const dy = touchStartY - e.touches[0].pageY;
+        wrapper.scrollBy(dx, dy);
+        touchStartX = e.touches[0].pageX;
+        touchStartY = e.touches[0].pageY;
+    }
+}, { passive: true });
+
+// Start rendering
+renderDiagram();
+"""
+
+
+def _write_html_assets(output_dir: Path) -> None:
+    """Write the shared stylesheet and script next to generated HTML pages.
+
+    The assets go through the same digest check as the page itself, so
+    repeated renders into the same directory leave unchanged files alone
+    and browsers can cache them across visualizations.
+
+    Args:
+        output_dir: Directory containing the generated HTML page.
+
+    Raises:
+        OSError: If an asset file cannot be written.
+    """
+    for name, content in (
+        (HTML_STYLESHEET_NAME, _FULLGRAPH_CSS),
+        (HTML_SCRIPT_NAME, _FULLGRAPH_JS),
+    ):
+        _write_if_changed(output_dir / name, content.encode("utf-8"))
+
+
+def _resolve_mermaid_script(output_dir: Path) -> str:
+    """Resolve the Mermaid.js script source for a generated HTML page.
+
+    The repository does not ship Mermaid.js, so the CDN URL is used by
+    default. If a copy has been placed at src/assets/mermaid.min.js, it
+    is written next to the HTML page (and refreshed whenever the bundled
+    file changes) and referenced locally instead.
+
+    Args:
+        output_dir: Directory containing the generated HTML page.
+
+    Returns:
+        The value for the Mermaid <script> tag's src attribute.
+
+    Raises:
+        OSError: If the bundled script cannot be copied.
+    """
+    bundled = resources.files("src").joinpath(BUNDLED_MERMAID_RESOURCE)
+    if not bundled.is_file():
+        return MERMAID_CDN_URL
+
+    _write_if_changed(output_dir / MERMAID_SCRIPT_NAME, bundled.read_bytes())
+    return MERMAID_SCRIPT_NAME
 
 
 def _render_fullgraph_html(graph: KnowledgeGraph, output_path: Path) -> None:
     """Render the full graph as a horizontal scrollable HTML with zoom controls.
     
     Uses a modern dark theme with enhanced zoom/pan controls, auto-fit on load,
-    and keyboard navigation support.
+    and keyboard navigation support. Styles and scripts are referenced from
+    shared asset files written alongside the HTML page.
     
     Args:
         graph: The full KnowledgeGraph.
         output_path: Path where the HTML file will be saved.
     """
+    _write_html_assets(output_path.parent)
+    mermaid_script = _resolve_mermaid_script(output_path.parent)
+
     node_count = len(graph.nodes)
     rel_count = len(graph.relationships)
     
@@ -692,273 +1012,7 @@ def _render_fullgraph_html(graph: KnowledgeGraph, output_path: Path) -> None:
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>Financial Detective - Knowledge Graph ({node_count} nodes)</title>
-    <style>
-        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
-        html, body {{
-            height: 100%;
-            width: 100%;
-            overflow: hidden;
-        }}
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            background: #0d1117;
-            display: flex;
-            flex-direction: column;
-        }}
-        
-        /* Compact header */
-        header {{
-            background: linear-gradient(135deg, #161b22 0%, #0d1117 100%);
-            color: white;
-            padding: 0.5rem 1rem;
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.5);
-            flex-shrink: 0;
-            border-bottom: 1px solid #30363d;
-        }}
-        header h1 {{ 
-            font-size: 1rem; 
-            font-weight: 600;
-            color: #58a6ff;
-        }}
-        .stats {{
-            display: flex;
-            gap: 0.75rem;
-            font-size: 0.75rem;
-        }}
-        .stat {{
-            background: rgba(88,166,255,0.15);
-            padding: 0.25rem 0.6rem;
-            border-radius: 4px;
-            border: 1px solid rgba(88,166,255,0.3);
-        }}
-        .stat-value {{ font-weight: 700; color: #58a6ff; }}
-        
-        /* Controls bar - more compact */
-        .controls {{
-            background: #161b22;
-            padding: 0.4rem 1rem;
-            display: flex;
-            gap: 0.5rem;
-            align-items: center;
-            border-bottom: 1px solid #30363d;
-            flex-shrink: 0;
-            flex-wrap: wrap;
-        }}
-        .controls button {{
-            padding: 0.35rem 0.7rem;
-            border: none;
-            border-radius: 4px;
-            cursor: pointer;
-            font-size: 0.75rem;
-            font-weight: 500;
-            transition: all 0.15s;
-        }}
-        .controls button:hover {{
-            transform: translateY(-1px);
-        }}
-        .btn-zoom {{
-            background: #238636;
-            color: white;
-        }}
-        .btn-zoom:hover {{
-            background: #2ea043;
-        }}
-        .btn-secondary {{
-            background: #21262d;
-            color: #c9d1d9;
-            border: 1px solid #30363d;
-        }}
-        .btn-secondary:hover {{
-            background: #30363d;
-        }}
-        .btn-fit {{
-            background: #1f6feb;
-            color: white;
-        }}
-        .btn-fit:hover {{
-            background: #388bfd;
-        }}
-        .zoom-display {{
-            background: #0d1117;
-            color: #58a6ff;
-            padding: 0.3rem 0.6rem;
-            border-radius: 4px;
-            font-weight: 600;
-            font-size: 0.75rem;
-            min-width: 55px;
-            text-align: center;
-            border: 1px solid #30363d;
-        }}
-        .separator {{
-            width: 1px;
-            height: 20px;
-            background: #30363d;
-            margin: 0 0.25rem;
-        }}
-        .hint {{
-            margin-left: auto;
-            color: #8b949e;
-            font-size: 0.7rem;
-        }}
-        .zoom-slider {{
-            width: 100px;
-            height: 4px;
-            -webkit-appearance: none;
-            background: #30363d;
-            border-radius: 2px;
-            outline: none;
-        }}
-        .zoom-slider::-webkit-slider-thumb {{
-            -webkit-appearance: none;
-            width: 14px;
-            height: 14px;
-            background: #58a6ff;
-            border-radius: 50%;
-            cursor: pointer;
-        }}
-        
-        /* Main diagram area - full viewport */
-        .diagram-wrapper {{
-            flex: 1;
-            overflow: auto;
-            background: #0d1117;
-            cursor: grab;
-            position: relative;
-        }}
-        .diagram-wrapper:active {{
-            cursor: grabbing;
-        }}
-        .diagram-container {{
-            display: inline-block;
-            padding: 1rem;
-            min-width: 100%;
-            min-height: 100%;
-            transform-origin: 0 0;
-            transition: transform 0.05s ease-out;
-        }}
-        .mermaid {{
-            background: #161b22;
-            border-radius: 8px;
-            padding: 1rem;
-            box-shadow: 0 0 30px rgba(0,0,0,0.5);
-            display: inline-block;
-            border: 1px solid #30363d;
-        }}
-        .mermaid svg {{
-            max-width: none !important;
-            height: auto !important;
-        }}
-        /* Style the SVG nodes for dark theme */
-        .mermaid .node rect, .mermaid .node polygon {{
-            fill: #21262d !important;
-            stroke: #58a6ff !important;
-        }}
-        .mermaid .node .label {{
-            color: #c9d1d9 !important;
-        }}
-        .mermaid .edgePath path {{
-            stroke: #8b949e !important;
-        }}
-        .mermaid .edgeLabel {{
-            background-color: #161b22 !important;
-            color: #8b949e !important;
-        }}
-        
-        /* Floating Legend - collapsible */
-        .legend {{
-            position: fixed;
-            bottom: 15px;
-            right: 15px;
-            background: #161b22;
-            padding: 0.6rem;
-            border-radius: 6px;
-            box-shadow: 0 4px 15px rgba(0,0,0,0.4);
-            font-size: 0.7rem;
-            z-index: 100;
-            border: 1px solid #30363d;
-            max-width: 140px;
-        }}
-        .legend h3 {{ 
-            margin-bottom: 0.4rem; 
-            color: #58a6ff; 
-            font-size: 0.75rem;
-            font-weight: 600;
-            cursor: pointer;
-        }}
-        .legend-item {{ 
-            display: flex; 
-            align-items: center; 
-            gap: 0.4rem; 
-            margin: 0.2rem 0;
-            color: #8b949e;
-        }}
-        .legend-shape {{ 
-            width: 14px; 
-            height: 10px; 
-            border: 1.5px solid #58a6ff; 
-            background: #21262d;
-        }}
-        .shape-rect {{ border-radius: 2px; }}
-        .shape-rounded {{ border-radius: 4px; }}
-        .shape-parallelogram {{ transform: skewX(-10deg); width: 18px; }}
-        
-        /* Loading */
-        .loading {{
-            display: flex;
-            flex-direction: column;
-            align-items: center;
-            justify-content: center;
-            height: 100%;
-            color: #8b949e;
-            font-size: 1rem;
-            gap: 1rem;
-        }}
-        .loading-spinner {{
-            width: 40px;
-            height: 40px;
-            border: 3px solid #30363d;
-            border-top-color: #58a6ff;
-            border-radius: 50%;
-            animation: spin 0.8s linear infinite;
-        }}
-        @keyframes spin {{
-            to {{ transform: rotate(360deg); }}
-        }}
-        
-        /* Quick zoom panel */
-        .quick-zoom {{
-            position: fixed;
-            left: 15px;
-            bottom: 15px;
-            background: #161b22;
-            padding: 0.5rem;
-            border-radius: 6px;
-            border: 1px solid #30363d;
-            display: flex;
-            flex-direction: column;
-            gap: 0.3rem;
-            z-index: 100;
-        }}
-        .quick-zoom button {{
-            width: 32px;
-            height: 32px;
-            border: none;
-            background: #21262d;
-            color: #c9d1d9;
-            border-radius: 4px;
-            cursor: pointer;
-            font-size: 1rem;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-        }}
-        .quick-zoom button:hover {{
-            background: #30363d;
-        }}
-    </style>
+    <link rel="stylesheet" href="{HTML_STYLESHEET_NAME}">
 </head>
 <body>
     <header>
@@ -1010,225 +1064,13 @@ def _render_fullgraph_html(graph: KnowledgeGraph, output_path: Path) -> None:
         <div class="legend-item"><div class="legend-shape shape-parallelogram"></div><span>Dollar Amount</span></div>
     </div>
 
-    <script src="https://cdn.jsdelivr.net/npm/mermaid/dist/mermaid.min.js"></script>
-    <script>
-        let zoom = 1;
-        const minZoom = 0.05;
-        const maxZoom = 2;
-        const zoomStep = 0.05;
-        
-        const wrapper = document.getElementById('wrapper');
-        const container = document.getElementById('container');
-        const loading = document.getElementById('loading');
-        const diagram = document.getElementById('diagram');
-        const zoomSlider = document.getElementById('zoomSlider');
-        
-        // Initialize Mermaid with dark theme
-        mermaid.initialize({{
-            startOnLoad: false,
-            theme: 'dark',
-            maxTextSize: 2000000,
-            maxEdges: 20000,
-            flowchart: {{
-                useMaxWidth: false,
-                htmlLabels: true,
-                curve: 'basis',
-                nodeSpacing: 20,
-                rankSpacing: 40,
-                padding: 15
-            }},
-            themeVariables: {{
-                fontSize: '10px',
-                primaryColor: '#21262d',
-                primaryTextColor: '#c9d1d9',
-                primaryBorderColor: '#58a6ff',
-                lineColor: '#8b949e',
-                secondaryColor: '#30363d',
-                tertiaryColor: '#161b22'
-            }}
-        }});
-        
-        // Render the diagram
-        async function renderDiagram() {{
-            try {{
-                const content = diagram.textContent.trim();
-                const {{ svg }} = await mermaid.render('rendered-graph', content);
-                diagram.innerHTML = svg;
-                diagram.style.display = 'block';
-                loading.style.display = 'none';
-                
-                // Auto-fit to screen after render with slight delay
-                setTimeout(() => {{
-                    fitToScreen();
-                    wrapper.scrollTo(0, 0);
-                }}, 200);
-            }} catch (e) {{
-                loading.innerHTML = '<div style="color:#f85149;">Error rendering: ' + e.message + '</div><div style="margin-top:1rem;font-size:0.8rem;color:#8b949e;">Try refreshing the page or use a different browser.</div>';
-            }}
-        }}
-        
-        // Update zoom display and slider
-        function updateZoom() {{
-            container.style.transform = `scale(${{zoom}})`;
-            const percent = Math.round(zoom * 100);
-            document.getElementById('zoomLevel').textContent = percent + '%';
-            zoomSlider.value = percent;
-        }}
-        
-        // Set zoom directly
-        function setZoom(newZoom) {{
-            zoom = Math.max(minZoom, Math.min(maxZoom, newZoom));
-            updateZoom();
-        }}
-        
-        // Set zoom from slider
-        function setZoomFromSlider(value) {{
-            setZoom(value / 100);
-        }}
-        
-        function zoomIn() {{
-            const step = zoom < 0.2 ? 0.02 : (zoom < 0.5 ? 0.05 : 0.1);
-            setZoom(zoom + step);
-        }}
-        
-        function zoomOut() {{
-            const step = zoom < 0.2 ? 0.02 : (zoom < 0.5 ? 0.05 : 0.1);
-            setZoom(zoom - step);
-        }}
-        
-        function resetZoom() {{
-            zoom = 1;
-            updateZoom();
-            wrapper.scrollTo(0, 0);
-        }}
-        
-        function fitToScreen() {{
-            const svg = diagram.querySelector('svg');
-            if (!svg) return;
-            
-            const bbox = svg.getBBox ? svg.getBBox() : null;
-            const svgWidth = bbox ? bbox.width : (svg.viewBox?.baseVal?.width || svg.clientWidth);
-            const svgHeight = bbox ? bbox.height : (svg.viewBox?.baseVal?.height || svg.clientHeight);
-            
-            const wrapperWidth = wrapper.clientWidth - 40;
-            const wrapperHeight = wrapper.clientHeight - 40;
-            
-            const scaleX = wrapperWidth / svgWidth;
-            const scaleY = wrapperHeight / svgHeight;
-            
-            zoom = Math.max(minZoom, Math.min(scaleX, scaleY, 1));
-            
-            updateZoom();
-            
-            setTimeout(() => {{
-                const containerWidth = container.scrollWidth * zoom;
-                const containerHeight = container.scrollHeight * zoom;
-                const scrollX = Math.max(0, (containerWidth - wrapperWidth) / 2);
-                const scrollY = Math.max(0, (containerHeight - wrapperHeight) / 2);
-                wrapper.scrollTo(scrollX, scrollY);
-            }}, 50);
-        }}
-        
-        // Scroll navigation
-        function scrollTo(direction) {{
-            const amount = 300;
-            switch(direction) {{
-                case 'left': wrapper.scrollBy(-amount, 0); break;
-                case 'right': wrapper.scrollBy(amount, 0); break;
-                case 'top': wrapper.scrollBy(0, -amount); break;
-                case 'bottom': wrapper.scrollBy(0, amount); break;
-            }}
-        }}
-        
-        // Mouse wheel zoom (with Ctrl or Meta key)
-        wrapper.addEventListener('wheel', (e) => {{
-            if (e.ctrlKey || e.metaKey) {{
-                e.preventDefault();
-                const delta = e.deltaY > 0 ? -1 : 1;
-                const step = zoom < 0.2 ? 0.01 : (zoom < 0.5 ? 0.02 : 0.05);
-                setZoom(zoom + (delta * step));
-            }}
-        }}, {{ passive: false }});
-        
-        // Drag to pan
-        let isDragging = false;
-        let startX, startY, scrollLeft, scrollTop;
-        
-        wrapper.addEventListener('mousedown', (e) => {{
-            isDragging = true;
-            startX = e.pageX - wrapper.offsetLeft;
-            startY = e.pageY - wrapper.offsetTop;
-            scrollLeft = wrapper.scrollLeft;
-            scrollTop = wrapper.scrollTop;
-            wrapper.style.cursor = 'grabbing';
-        }});
-        
-        wrapper.addEventListener('mouseleave', () => {{
-            isDragging = false;
-            wrapper.style.cursor = 'grab';
-        }});
-        
-        wrapper.addEventListener('mouseup', () => {{
-            isDragging = false;
-            wrapper.style.cursor = 'grab';
-        }});
-        
-        wrapper.addEventListener('mousemove', (e) => {{
-            if (!isDragging) return;
-            e.preventDefault();
-            const x = e.pageX - wrapper.offsetLeft;
-            const y = e.pageY - wrapper.offsetTop;
-            wrapper.scrollLeft = scrollLeft - (x - startX);
-            wrapper.scrollTop = scrollTop - (y - startY);
-        }});
-        
-        // Keyboard navigation
-        document.addEventListener('keydown', (e) => {{
-            if (e.target.tagName === 'INPUT') return;
-            
-            const scrollAmount = e.shiftKey ? 200 : 50;
-            
-            switch(e.key) {{
-                case '+': case '=': zoomIn(); e.preventDefault(); break;
-                case '-': case '_': zoomOut(); e.preventDefault(); break;
-                case '0': resetZoom(); e.preventDefault(); break;
-                case 'f': case 'F': fitToScreen(); e.preventDefault(); break;
-                case 'ArrowLeft': wrapper.scrollBy(-scrollAmount, 0); e.preventDefault(); break;
-                case 'ArrowRight': wrapper.scrollBy(scrollAmount, 0); e.preventDefault(); break;
-                case 'ArrowUp': wrapper.scrollBy(0, -scrollAmount); e.preventDefault(); break;
-                case 'ArrowDown': wrapper.scrollBy(0, scrollAmount); e.preventDefault(); break;
-                case 'Home': wrapper.scrollTo(0, 0); e.preventDefault(); break;
-                case 'End': wrapper.scrollTo(wrapper.scrollWidth, wrapper.scrollHeight); e.preventDefault(); break;
-            }}
-        }});
-        
-        // Touch support for mobile
-        let touchStartX, touchStartY;
-        wrapper.addEventListener('touchstart', (e) => {{
-            if (e.touches.length === 1) {{
-                touchStartX = e.touches[0].pageX;
-                touchStartY = e.touches[0].pageY;
-            }}
-        }}, {{ passive: true }});
-        
-        wrapper.addEventListener('touchmove', (e) => {{
-            if (e.touches.length === 1) {{
-                const dx = touchStartX - e.touches[0].pageX;
-                const dy = touchStartY - e.touches[0].pageY;
-                wrapper.scrollBy(dx, dy);
-                touchStartX = e.touches[0].pageX;
-                touchStartY = e.touches[0].pageY;
-            }}
-        }}, {{ passive: true }});
-        
-        // Start rendering
-        renderDiagram();
-    </script>
+    <script src="{mermaid_script}" defer></script>
+    <script src="{HTML_SCRIPT_NAME}" defer></script>
 </body>
 </html>
 '''
     
-    output_path.write_text(html_template, encoding="utf-8")
+    _write_if_changed(output_path, html_template.encode("utf-8"))
 
 
 def _generate_mermaid_content_horizontal(graph: KnowledgeGraph) -> str:
@@ -1240,24 +1082,6 @@ def _generate_mermaid_content_horizontal(graph: KnowledgeGraph) -> str:
     Returns:
         Mermaid diagram content as a string with left-to-right layout.
     """
-    lines: list[str] = []
-
-    # Mermaid flowchart header - Left to Right for horizontal scrolling
-    lines.append("flowchart LR")
-    lines.append("")
-
-    # Add node definitions
-    lines.append("    %% Node definitions")
-    for node in graph.nodes:
-        node_syntax = _get_node_shape(node)
-        lines.append(f"    {node_syntax}")
-
-    lines.append("")
-
-    # Add relationship edges
-    lines.append("    %% Relationships")
-    for rel in graph.relationships:
-        lines.append(f"    {rel.source} -->|{rel.relation}| {rel.target}")
-
-    return "\n".join(lines)
+    # Left to Right layout for horizontal scrolling
+    return "\n".join(_build_flowchart_lines(graph, "LR"))
 
@@ -0,0 +1,202 @@
+"""Shared pytest fixtures for the Financial Detective test suite."""
+
+import os
+import shutil
+import tempfile
+from collections.abc import Iterator
+from functools import partial
+from pathlib import Path
+
+import pytest
+
+from src.config import clear_config_cache
+from src.extractor.factory import _build_extractor
+from src.schema import KnowledgeGraph, Node
+from tests.helpers import (
+    FINANCIAL_REPORT,
+    LARGE_BYTES,
+    StubExtractor,
+    fast_write,
+    kg,
+)
+
+
+# Per-run tmpfs basetemp created by pytest_configure, removed on unconfigure
+_TMPFS_BASETEMP = pytest.StashKey[Path]()
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config: pytest.Config) -> None:
+    """Register the custom markers used by this suite.
+
+    When no ``--basetemp`` is given and ``/dev/shm`` is writable, this also
+    points ``--basetemp`` at a fresh per-run directory on tmpfs, so rendered
+    artifacts never touch disk. The process environment is left untouched,
+    and the directory is removed again in pytest_unconfigure; pass an
+    explicit ``--basetemp`` to keep artifacts for inspection. xdist workers
+    receive the controller's basetemp and skip this step.
+    """
+    config.addinivalue_line(
+        "markers", "io: filesystem-bound test, safe to run in parallel with xdist"
+    )
+    tmpfs_root = Path("/dev/shm")
+    if (
+        config.option.basetemp is None
+        and tmpfs_root.is_dir()
+        and os.access(tmpfs_root, os.W_OK)
+    ):
+        basetemp = Path(tempfile.mkdtemp(prefix="pytest-", dir=tmpfs_root))
+        config.option.basetemp = str(basetemp)
+        config.stash[_TMPFS_BASETEMP] = basetemp
+
+
+def pytest_unconfigure(config: pytest.Config) -> None:
+    """Remove the tmpfs basetemp created by pytest_configure, if any."""
+    basetemp = config.stash.get(_TMPFS_BASETEMP, None)
+    if basetemp is not None:
+        shutil.rmtree(basetemp, ignore_errors=True)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_schema_validators() -> None:
+    """Run one trivial payload through the KnowledgeGraph validator.
+
+    Pays the first-call validation cost once per session (and once per
+    xdist worker) so it is not charged to whichever test happens to run
+    first in ``--durations`` reports.
+    """
+    KnowledgeGraph.model_validate(
+        {
+            "schema_version": "1.0.0",
+            "nodes": [{"id": "c1", "type": "Company", "name": "Acme"}],
+            "relationships": [{"source": "c1", "target": "c1", "relation": "OWNS"}],
+        }
+    )
+
+
+@pytest.fixture(autouse=True)
+def _clear_config_cache() -> Iterator[None]:
+    """Reset the cached configuration and extractors around every test.
+
+    load_config() and the extractor factory memoize their results, so
+    tests that patch os.environ must start from empty caches and must
+    not leak their config into later tests.
+    """
+    clear_config_cache()
+    _build_extractor.cache_clear()
+    yield
+    clear_config_cache()
+    _build_extractor.cache_clear()
+
+
+@pytest.fixture(scope="session")
+def sample_graph() -> KnowledgeGraph:
+    """Single-company graph shared by the whole session.
+
+    Built once; tests must treat it as read-only.
+    """
+    return KnowledgeGraph(
+        schema_version="1.0.0",
+        nodes=[Node(id="c1", type="Company", name="Acme")],
+        relationships=[],
+    )
+
+
+@pytest.fixture
+def extractor_stub(sample_graph: KnowledgeGraph) -> StubExtractor:
+    """Extractor stub returning ``sample_graph`` and recording input texts."""
+    return StubExtractor(sample_graph)
+
+
+@pytest.fixture(scope="session")
+def viz_graph() -> KnowledgeGraph:
+    """Largest visualizer sample: two nodes of each type, five relationships.
+
+    Built once; tests must treat it as read-only.
+    """
+    return kg(
+        nodes=[
+            {"id": "company_1", "type": "Company", "name": "Acme Corp"},
+            {"id": "company_2", "type": "Company", "name": "Beta Inc"},
+            {"id": "risk_1", "type": "RiskFactor", "name": "Market Risk"},
+            {"id": "risk_2", "type": "RiskFactor", "name": "Credit Risk"},
+            {"id": "amount_1", "type": "DollarAmount", "name": "$500,000"},
+            {"id": "amount_2", "type": "DollarAmount", "name": "$1,000,000"},
+        ],
+        relationships=[
+            {"source": "company_1", "target": "company_2", "relation": "OWNS"},
+            {"source": "company_1", "target": "risk_1", "relation": "HAS_RISK"},
+            {"source": "company_2", "target": "risk_2", "relation": "HAS_RISK"},
+            {"source": "company_1", "target": "amount_1", "relation": "REPORTS_AMOUNT"},
+            {"source": "company_2", "target": "amount_2", "relation": "REPORTS_AMOUNT"},
+        ],
+    )
+
+
+@pytest.fixture(scope="session")
+def rendered_png(
+    tmp_path_factory: pytest.TempPathFactory, viz_graph: KnowledgeGraph
+) -> Path:
+    """``viz_graph`` rendered to PNG once per session; treat as read-only.
+
+    Tests only check the PNG header and size, never pixels, so the image
+    is saved with minimal zlib compression.
+    """
+    # Imported here so suites that never render do not load matplotlib
+    from src import visualizer
+
+    output_path = tmp_path_factory.mktemp("viz_png") / "graph.png"
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(
+            visualizer.plt,
+            "savefig",
+            partial(visualizer.plt.savefig, pil_kwargs={"compress_level": 1}),
+        )
+        visualizer.render_graph(viz_graph, output_path)
+    return output_path
+
+
+@pytest.fixture(scope="session")
+def rendered_mmd(
+    tmp_path_factory: pytest.TempPathFactory, viz_graph: KnowledgeGraph
+) -> Path:
+    """``viz_graph`` rendered to a Mermaid file once per session; treat as read-only."""
+    from src.visualizer_mermaid import render_mermaid
+
+    output_path = tmp_path_factory.mktemp("viz_mmd") / "graph.mmd"
+    render_mermaid(viz_graph, output_path)
+    return output_path
+
+
+@pytest.fixture(scope="session")
+def rendered_html(
+    tmp_path_factory: pytest.TempPathFactory, viz_graph: KnowledgeGraph
+) -> Path:
+    """``viz_graph`` rendered to an HTML page once per session; treat as read-only."""
+    from src.visualizer_mermaid import render_mermaid_html
+
+    output_path = tmp_path_factory.mktemp("viz_html") / "graph.html"
+    render_mermaid_html(viz_graph, output_path)
+    return output_path
+
+
+@pytest.fixture(scope="session")
+def text_files(tmp_path_factory: pytest.TempPathFactory) -> dict[str, Path]:
+    """Read-only sample text files, written once per test session.
+
+    Keys: ``large`` (10,000 lines), ``utf8`` (currency symbols),
+    ``emoji`` and ``financial`` (a short annual report).
+    """
+    root = tmp_path_factory.mktemp("text_files")
+    paths: dict[str, Path] = {"large": root / "large.txt"}
+    fast_write(paths["large"], LARGE_BYTES)
+
+    samples = {
+        "utf8": "Currency: ₹1,00,000 and €100 and £50 and $100",
+        "emoji": "Status: ✓ Complete 🚀",
+        "financial": FINANCIAL_REPORT,
+    }
+    for name, content in samples.items():
+        paths[name] = root / f"{name}.txt"
+        paths[name].write_text(content, encoding="utf-8")
+    return paths
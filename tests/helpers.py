@@ -0,0 +1,128 @@
+"""Plain helpers and sample data shared by the test modules.
+
+Fixtures and pytest hooks live in conftest.py; everything here is
+ordinary Python imported explicitly by the tests that need it.
+"""
+
+import os
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from src.schema import KnowledgeGraph, Node, Relationship
+
+
+def make_node(
+    id: str, type: str, name: str, context: str | None = None
+) -> Node:
+    """Build a Node from trusted test literals, skipping validation."""
+    return Node.model_construct(id=id, type=type, name=name, context=context)
+
+
+def make_rel(
+    source: str, target: str, relation: str, confidence: float | None = None
+) -> Relationship:
+    """Build a Relationship from trusted test literals, skipping validation."""
+    return Relationship.model_construct(
+        source=source, target=target, relation=relation, confidence=confidence
+    )
+
+
+def make_graph(
+    nodes: list[Node] | None = None,
+    relationships: list[Relationship] | None = None,
+    schema_version: str = "1.0.0",
+) -> KnowledgeGraph:
+    """Build a KnowledgeGraph from trusted test objects, skipping validation."""
+    return KnowledgeGraph.model_construct(
+        schema_version=schema_version,
+        nodes=nodes if nodes is not None else [],
+        relationships=relationships if relationships is not None else [],
+    )
+
+
+def kg(
+    nodes: list[dict[str, Any]],
+    relationships: list[dict[str, Any]],
+    schema_version: str = "1.0.0",
+) -> KnowledgeGraph:
+    """Validate a KnowledgeGraph from plain dict payloads in a single call."""
+    return KnowledgeGraph.model_validate(
+        {
+            "schema_version": schema_version,
+            "nodes": nodes,
+            "relationships": relationships,
+        }
+    )
+
+
+# Large sample kept as both bytes (written raw) and str (compared against)
+LARGE_TEXT_LINES = 10000
+LARGE_TEXT = "This is a line.\n" * LARGE_TEXT_LINES
+LARGE_BYTES = LARGE_TEXT.encode("utf-8")
+
+FINANCIAL_REPORT = """ANNUAL REPORT 2024
+
+Company: Acme Corporation
+Revenue: $1,234,567,890
+Net Income: $123,456,789
+
+Risk Factors:
+- Market volatility
+- Regulatory changes
+- Currency fluctuations
+
+Management Discussion:
+The company reported strong growth...
+"""
+
+
+def fast_write(path: Path, data: bytes) -> None:
+    """Write bytes with raw os calls, bypassing Python's buffered file layer."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+class StubExtractor:
+    """Lightweight extractor stub that records calls and replays results.
+
+    ``results`` may be a single graph or exception used for every call, a
+    list consumed one entry per call in call order, or a callable invoked
+    with the text. Lists are only deterministic with one worker, and
+    running past the end of one raises AssertionError.
+    """
+
+    def __init__(
+        self,
+        results: (
+            KnowledgeGraph
+            | Exception
+            | list[KnowledgeGraph | Exception]
+            | Callable[[str], KnowledgeGraph]
+        ),
+    ) -> None:
+        self.calls: list[str] = []
+        self._results = iter(results) if isinstance(results, list) else None
+        self._result = results
+
+    def extract(self, text: str) -> KnowledgeGraph:
+        self.calls.append(text)
+        if self._results is None:
+            result = self._result
+        else:
+            try:
+                result = next(self._results)
+            except StopIteration:
+                raise AssertionError(
+                    f"StubExtractor has no result left for call {len(self.calls)}"
+                ) from None
+        if isinstance(result, Exception):
+            raise result
+        if callable(result):
+            return result(text)
+        return result
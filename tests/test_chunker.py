@@ -2,7 +2,7 @@
 
 import pytest
 
-from src.chunker import estimate_tokens, split_text
+from src.chunker import CHARS_PER_TOKEN, estimate_tokens, split_text
 
 
 class TestEstimateTokens:
@@ -31,6 +31,11 @@ class TestEstimateTokens:
         tokens = estimate_tokens(text)
         assert tokens == 1
 
+    def test_uses_chars_per_token_ratio(self) -> None:
+        """Estimate should divide character count by CHARS_PER_TOKEN."""
+        text = "a" * (CHARS_PER_TOKEN * 7 + 1)
+        assert estimate_tokens(text) == 7
+
 
 class TestSplitText:
     """Tests for the split_text function."""
@@ -128,3 +133,12 @@ class TestSplitText:
         # All chunks should be non-empty
         for chunk in chunks:
             assert len(chunk) > 0
+
+    def test_chunk_ends_at_last_paragraph_break_in_window(self) -> None:
+        """A chunk should end at the last paragraph break inside its window."""
+        text = "Alpha alpha.\n\nBeta beta.\n\n" + "Gamma " * 20
+        chunks = split_text(text, chunk_size=8, overlap=1)
+
+        # First window is 32 chars; the last paragraph break before it
+        # closes "Beta beta.", so later text must not leak into chunk 1
+        assert chunks[0] == "Alpha alpha.\n\nBeta beta."
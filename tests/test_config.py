@@ -10,8 +10,9 @@ Tests configuration loading from environment variables:
 from unittest.mock import patch
 
 import pytest
+from pydantic import ValidationError
 
-from src.config import Config, load_config
+from src.config import Config, clear_config_cache, load_config
 
 
 class TestConfig:
@@ -52,12 +53,28 @@ class TestConfig:
         config = Config()
         assert config.chunk_overlap_tokens == 200
 
+    def test_default_chunk_max_concurrency(self) -> None:
+        """Default chunk concurrency should be 8 in-flight requests."""
+        config = Config()
+        assert config.chunk_max_concurrency == 8
+
     def test_api_keys_default_to_none(self) -> None:
         """API keys should default to None."""
         config = Config()
         assert config.openai_api_key is None
         assert config.gemini_api_key is None
 
+    def test_chunk_enabled_parses_strings(self) -> None:
+        """Config should parse string chunk_enabled values directly."""
+        assert Config(chunk_enabled="yes").chunk_enabled is True  # type: ignore[arg-type]
+        assert Config(chunk_enabled="no").chunk_enabled is False  # type: ignore[arg-type]
+
+    def test_config_is_frozen(self) -> None:
+        """Config instances should reject attribute assignment."""
+        config = Config()
+        with pytest.raises(ValidationError):
+            config.chunk_enabled = False  # type: ignore[misc]
+
     def test_extra_fields_forbidden(self) -> None:
         """Extra fields should raise validation error."""
         with pytest.raises(Exception):
@@ -67,184 +84,81 @@ class TestConfig:
 class TestLoadConfig:
     """Tests for the load_config function."""
 
-    @patch.dict("os.environ", {}, clear=True)
     def test_load_config_with_defaults(self) -> None:
         """load_config should return config with defaults when no env vars set."""
-        config = load_config()
+        config = load_config({})
 
         assert config.llm_provider == "openai"
         assert config.ollama_model == "llama3:latest"
         assert config.gemini_model == "gemini-2.0-flash"
         assert config.chunk_enabled is True
 
-    @patch.dict(
-        "os.environ",
-        {"LLM_PROVIDER": "ollama"},
-        clear=True,
-    )
-    def test_load_config_llm_provider(self) -> None:
-        """load_config should read LLM_PROVIDER from environment."""
-        config = load_config()
-
-        assert config.llm_provider == "ollama"
-
-    @patch.dict(
-        "os.environ",
-        {"LLM_PROVIDER": "gemini"},
-        clear=True,
-    )
-    def test_load_config_gemini_provider(self) -> None:
-        """load_config should read gemini as LLM_PROVIDER."""
-        config = load_config()
-
-        assert config.llm_provider == "gemini"
-
-    @patch.dict(
-        "os.environ",
-        {"OPENAI_API_KEY": "sk-test-key-123"},
-        clear=True,
-    )
-    def test_load_config_openai_api_key(self) -> None:
-        """load_config should read OPENAI_API_KEY from environment."""
-        config = load_config()
-
-        assert config.openai_api_key == "sk-test-key-123"
-
-    @patch.dict(
-        "os.environ",
-        {"GEMINI_API_KEY": "gemini-key-456"},
-        clear=True,
-    )
-    def test_load_config_gemini_api_key(self) -> None:
-        """load_config should read GEMINI_API_KEY from environment."""
-        config = load_config()
-
-        assert config.gemini_api_key == "gemini-key-456"
-
-    @patch.dict(
-        "os.environ",
-        {"OLLAMA_MODEL": "mistral:latest"},
-        clear=True,
-    )
-    def test_load_config_ollama_model(self) -> None:
-        """load_config should read OLLAMA_MODEL from environment."""
-        config = load_config()
-
-        assert config.ollama_model == "mistral:latest"
-
-    @patch.dict(
-        "os.environ",
-        {"OLLAMA_BASE_URL": "http://custom:8080"},
-        clear=True,
-    )
-    def test_load_config_ollama_base_url(self) -> None:
-        """load_config should read OLLAMA_BASE_URL from environment."""
-        config = load_config()
-
-        assert config.ollama_base_url == "http://custom:8080"
-
-    @patch.dict(
-        "os.environ",
-        {"GEMINI_MODEL": "gemini-1.5-pro"},
-        clear=True,
-    )
-    def test_load_config_gemini_model(self) -> None:
-        """load_config should read GEMINI_MODEL from environment."""
-        config = load_config()
-
-        assert config.gemini_model == "gemini-1.5-pro"
-
-    @patch.dict(
-        "os.environ",
-        {"CHUNK_ENABLED": "false"},
-        clear=True,
-    )
-    def test_load_config_chunk_enabled_false(self) -> None:
-        """load_config should parse CHUNK_ENABLED=false as boolean False."""
-        config = load_config()
-
-        assert config.chunk_enabled is False
-
-    @patch.dict(
-        "os.environ",
-        {"CHUNK_ENABLED": "true"},
-        clear=True,
-    )
-    def test_load_config_chunk_enabled_true(self) -> None:
-        """load_config should parse CHUNK_ENABLED=true as boolean True."""
-        config = load_config()
-
-        assert config.chunk_enabled is True
-
-    @patch.dict(
-        "os.environ",
-        {"CHUNK_ENABLED": "1"},
-        clear=True,
-    )
-    def test_load_config_chunk_enabled_one(self) -> None:
-        """load_config should parse CHUNK_ENABLED=1 as boolean True."""
-        config = load_config()
-
-        assert config.chunk_enabled is True
-
-    @patch.dict(
-        "os.environ",
-        {"CHUNK_ENABLED": "yes"},
-        clear=True,
-    )
-    def test_load_config_chunk_enabled_yes(self) -> None:
-        """load_config should parse CHUNK_ENABLED=yes as boolean True."""
-        config = load_config()
-
-        assert config.chunk_enabled is True
-
-    @patch.dict(
-        "os.environ",
-        {"CHUNK_ENABLED": "0"},
-        clear=True,
-    )
-    def test_load_config_chunk_enabled_zero(self) -> None:
-        """load_config should parse CHUNK_ENABLED=0 as boolean False."""
-        config = load_config()
-
-        assert config.chunk_enabled is False
-
-    @patch.dict(
-        "os.environ",
-        {"CHUNK_SIZE_TOKENS": "8000"},
-        clear=True,
-    )
-    def test_load_config_chunk_size(self) -> None:
-        """load_config should read CHUNK_SIZE_TOKENS from environment."""
-        config = load_config()
-
-        assert config.chunk_size_tokens == 8000
+    @pytest.mark.parametrize(
+        ("env", "field", "expected"),
+        [
+            ({"LLM_PROVIDER": "ollama"}, "llm_provider", "ollama"),
+            ({"LLM_PROVIDER": "gemini"}, "llm_provider", "gemini"),
+            ({"OPENAI_API_KEY": "sk-test"}, "openai_api_key", "sk-test"),
+            ({"GEMINI_API_KEY": "gemini-key-456"}, "gemini_api_key", "gemini-key-456"),
+            ({"OLLAMA_MODEL": "mistral:latest"}, "ollama_model", "mistral:latest"),
+            (
+                {"OLLAMA_BASE_URL": "http://custom:8080"},
+                "ollama_base_url",
+                "http://custom:8080",
+            ),
+            ({"GEMINI_MODEL": "gemini-1.5-pro"}, "gemini_model", "gemini-1.5-pro"),
+            ({"CHUNK_SIZE_TOKENS": "8000"}, "chunk_size_tokens", 8000),
+            ({"CHUNK_OVERLAP_TOKENS": "500"}, "chunk_overlap_tokens", 500),
+            ({"CHUNK_MAX_CONCURRENCY": "2"}, "chunk_max_concurrency", 2),
+            ({"LLM_PROVIDER": "ollama"}, "chunk_max_concurrency", 1),
+            ({"LLM_PROVIDER": "gemini"}, "chunk_max_concurrency", 8),
+            (
+                {"LLM_PROVIDER": "ollama", "CHUNK_MAX_CONCURRENCY": "4"},
+                "chunk_max_concurrency",
+                4,
+            ),
+        ],
+    )
+    def test_load_config_reads_variable(
+        self, env: dict[str, str], field: str, expected: object
+    ) -> None:
+        """load_config should read each variable into its Config field."""
+        config = load_config(env)
+
+        assert getattr(config, field) == expected
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            ("false", False),
+            ("true", True),
+            ("1", True),
+            ("yes", True),
+            ("0", False),
+            ("FALSE", False),
+            ("TRUE", True),
+            ("on", True),
+            ("Y", True),
+            ("off", False),
+        ],
+    )
+    def test_load_config_chunk_enabled(self, value: str, expected: bool) -> None:
+        """CHUNK_ENABLED should parse case-insensitively to a boolean."""
+        config = load_config({"CHUNK_ENABLED": value})
+
+        assert config.chunk_enabled is expected
 
-    @patch.dict(
-        "os.environ",
-        {"CHUNK_OVERLAP_TOKENS": "500"},
-        clear=True,
-    )
-    def test_load_config_chunk_overlap(self) -> None:
-        """load_config should read CHUNK_OVERLAP_TOKENS from environment."""
-        config = load_config()
-
-        assert config.chunk_overlap_tokens == 500
-
-    @patch.dict(
-        "os.environ",
-        {
-            "LLM_PROVIDER": "gemini",
-            "GEMINI_API_KEY": "key",
-            "GEMINI_MODEL": "gemini-1.5-flash",
-            "CHUNK_ENABLED": "false",
-            "CHUNK_SIZE_TOKENS": "2000",
-        },
-        clear=True,
-    )
     def test_load_config_all_values(self) -> None:
         """load_config should read all environment variables correctly."""
-        config = load_config()
+        config = load_config(
+            {
+                "LLM_PROVIDER": "gemini",
+                "GEMINI_API_KEY": "key",
+                "GEMINI_MODEL": "gemini-1.5-flash",
+                "CHUNK_ENABLED": "false",
+                "CHUNK_SIZE_TOKENS": "2000",
+            }
+        )
 
         assert config.llm_provider == "gemini"
         assert config.gemini_api_key == "key"
@@ -252,25 +166,37 @@ class TestLoadConfig:
         assert config.chunk_enabled is False
         assert config.chunk_size_tokens == 2000
 
-    @patch.dict(
-        "os.environ",
-        {"CHUNK_ENABLED": "FALSE"},
-        clear=True,
-    )
-    def test_load_config_chunk_enabled_case_insensitive(self) -> None:
-        """CHUNK_ENABLED parsing should be case-insensitive."""
-        config = load_config()
+    @patch.dict("os.environ", {"LLM_PROVIDER": "gemini"}, clear=True)
+    def test_load_config_explicit_env_ignores_os_environ(self) -> None:
+        """An explicit env mapping should be used instead of os.environ."""
+        config = load_config({"LLM_PROVIDER": "ollama"})
 
-        assert config.chunk_enabled is False
+        assert config.llm_provider == "ollama"
+        assert load_config().llm_provider == "gemini"
 
-    @patch.dict(
-        "os.environ",
-        {"CHUNK_ENABLED": "TRUE"},
-        clear=True,
-    )
-    def test_load_config_chunk_enabled_uppercase_true(self) -> None:
-        """CHUNK_ENABLED=TRUE should be parsed as True."""
-        config = load_config()
+    @patch.dict("os.environ", {}, clear=True)
+    def test_load_config_explicit_env_not_cached(self) -> None:
+        """Explicit env mappings should produce fresh instances."""
+        assert load_config({}) is not load_config({})
 
-        assert config.chunk_enabled is True
+    @patch.dict("os.environ", {"LLM_PROVIDER": "ollama"}, clear=True)
+    def test_load_config_is_cached(self) -> None:
+        """Repeated calls should return the same Config instance."""
+        first = load_config()
+
+        with patch.dict("os.environ", {"LLM_PROVIDER": "gemini"}):
+            second = load_config()
 
+        assert second is first
+        assert second.llm_provider == "ollama"
+
+    @patch.dict("os.environ", {"LLM_PROVIDER": "ollama"}, clear=True)
+    def test_clear_config_cache_rereads_environment(self) -> None:
+        """clear_config_cache should force the environment to be read again."""
+        load_config()
+
+        with patch.dict("os.environ", {"LLM_PROVIDER": "gemini"}):
+            clear_config_cache()
+            config = load_config()
+
+        assert config.llm_provider == "gemini"
@@ -7,37 +7,37 @@ Tests extract_knowledge_graph function with mocked factory:
 - Tests chunking integration
 """
 
+import threading
+import time
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch, call
 
 import pytest
 
+from src.chunker import split_text
 from src.extractor import extract_knowledge_graph
 from src.schema import KnowledgeGraph, Node, Relationship
+from tests.helpers import StubExtractor
 
 
 class TestExtractKnowledgeGraph:
     """Tests for extract_knowledge_graph function."""
 
     @patch("src.extractor.create_extractor")
-    def test_delegates_to_extractor(self, mock_create_extractor: MagicMock) -> None:
+    def test_delegates_to_extractor(
+        self,
+        mock_create_extractor: MagicMock,
+        extractor_stub: StubExtractor,
+        sample_graph: KnowledgeGraph,
+    ) -> None:
         """extract_knowledge_graph should delegate to extractor.extract."""
-        mock_extractor = MagicMock()
-        mock_create_extractor.return_value = mock_extractor
-
-        expected_graph = KnowledgeGraph(
-            schema_version="1.0.0",
-            nodes=[
-                Node(id="company_1", type="Company", name="Acme Corp"),
-            ],
-            relationships=[],
-        )
-        mock_extractor.extract.return_value = expected_graph
+        mock_create_extractor.return_value = extractor_stub
 
         result = extract_knowledge_graph("Sample financial text")
 
         mock_create_extractor.assert_called_once()
-        mock_extractor.extract.assert_called_once_with("Sample financial text")
-        assert result is expected_graph
+        assert extractor_stub.calls == ["Sample financial text"]
+        assert result is sample_graph
 
     @patch("src.extractor.create_extractor")
     def test_returns_knowledge_graph_unchanged(self, mock_create_extractor: MagicMock) -> None:
@@ -86,20 +86,18 @@ class TestExtractKnowledgeGraph:
             extract_knowledge_graph("Sample text")
 
     @patch("src.extractor.create_extractor")
-    def test_passes_text_to_extractor(self, mock_create_extractor: MagicMock) -> None:
+    def test_passes_text_to_extractor(
+        self,
+        mock_create_extractor: MagicMock,
+        extractor_stub: StubExtractor,
+    ) -> None:
         """Input text should be passed to extractor.extract unchanged."""
-        mock_extractor = MagicMock()
-        mock_create_extractor.return_value = mock_extractor
-        mock_extractor.extract.return_value = KnowledgeGraph(
-            schema_version="1.0.0",
-            nodes=[Node(id="c1", type="Company", name="Test")],
-            relationships=[],
-        )
+        mock_create_extractor.return_value = extractor_stub
 
         input_text = "Reliance Industries reported revenue of ₹9,500 crore."
         extract_knowledge_graph(input_text)
 
-        mock_extractor.extract.assert_called_once_with(input_text)
+        assert extractor_stub.calls == [input_text]
 
 
 class TestExtractKnowledgeGraphChunking:
@@ -111,30 +109,24 @@ class TestExtractKnowledgeGraphChunking:
         self,
         mock_create_extractor: MagicMock,
         mock_load_config: MagicMock,
+        sample_graph: KnowledgeGraph,
     ) -> None:
         """Text smaller than chunk size should not be chunked."""
-        mock_config = MagicMock()
-        mock_config.chunk_enabled = True
-        mock_config.chunk_size_tokens = 1000
-        mock_config.chunk_overlap_tokens = 100
-        mock_load_config.return_value = mock_config
-
-        mock_extractor = MagicMock()
-        mock_create_extractor.return_value = mock_extractor
-
-        expected_graph = KnowledgeGraph(
-            schema_version="1.0.0",
-            nodes=[Node(id="c1", type="Company", name="Test")],
-            relationships=[],
+        mock_load_config.return_value = SimpleNamespace(
+            chunk_enabled=True,
+            chunk_size_tokens=1000,
+            chunk_overlap_tokens=100,
         )
-        mock_extractor.extract.return_value = expected_graph
+
+        extractor = StubExtractor(sample_graph)
+        mock_create_extractor.return_value = extractor
 
         # Small text (less than 1000 tokens = 4000 chars)
         result = extract_knowledge_graph("Short text")
 
         # Should call extract once (no chunking)
-        mock_extractor.extract.assert_called_once()
-        assert result is expected_graph
+        assert len(extractor.calls) == 1
+        assert result is sample_graph
 
     @patch("src.extractor.load_config")
     @patch("src.extractor.create_extractor")
@@ -144,14 +136,12 @@ class TestExtractKnowledgeGraphChunking:
         mock_load_config: MagicMock,
     ) -> None:
         """Text larger than chunk size should be chunked."""
-        mock_config = MagicMock()
-        mock_config.chunk_enabled = True
-        mock_config.chunk_size_tokens = 50  # Small for testing (200 chars)
-        mock_config.chunk_overlap_tokens = 10
-        mock_load_config.return_value = mock_config
-
-        mock_extractor = MagicMock()
-        mock_create_extractor.return_value = mock_extractor
+        mock_load_config.return_value = SimpleNamespace(
+            chunk_enabled=True,
+            chunk_size_tokens=50,  # Small for testing (200 chars)
+            chunk_overlap_tokens=10,
+            chunk_max_concurrency=1,  # List results are replayed in call order
+        )
 
         # Return different graphs for each chunk
         graph1 = KnowledgeGraph(
@@ -164,17 +154,20 @@ class TestExtractKnowledgeGraphChunking:
             nodes=[Node(id="c2", type="Company", name="Company B")],
             relationships=[],
         )
-        mock_extractor.extract.side_effect = [graph1, graph2]
-
         # Large text (more than 200 chars = 50 tokens)
         large_text = "This is a large text. " * 50  # ~1100 chars
+        chunk_count = len(split_text(large_text, 50, 10))
+
+        extractor = StubExtractor([graph1] + [graph2] * (chunk_count - 1))
+        mock_create_extractor.return_value = extractor
 
         result = extract_knowledge_graph(large_text)
 
-        # Should call extract multiple times (chunking)
-        assert mock_extractor.extract.call_count >= 2
+        # Should call extract once per chunk
+        assert chunk_count >= 2
+        assert len(extractor.calls) == chunk_count
         # Result should be merged graph
-        assert len(result.nodes) >= 1
+        assert [n.name for n in result.nodes] == ["Company A", "Company B"]
 
     @patch("src.extractor.load_config")
     @patch("src.extractor.create_extractor")
@@ -182,21 +175,13 @@ class TestExtractKnowledgeGraphChunking:
         self,
         mock_create_extractor: MagicMock,
         mock_load_config: MagicMock,
+        sample_graph: KnowledgeGraph,
     ) -> None:
         """When chunking is disabled, large text should not be chunked."""
-        mock_config = MagicMock()
-        mock_config.chunk_enabled = False  # Disabled
-        mock_load_config.return_value = mock_config
+        mock_load_config.return_value = SimpleNamespace(chunk_enabled=False)
 
-        mock_extractor = MagicMock()
-        mock_create_extractor.return_value = mock_extractor
-
-        expected_graph = KnowledgeGraph(
-            schema_version="1.0.0",
-            nodes=[Node(id="c1", type="Company", name="Test")],
-            relationships=[],
-        )
-        mock_extractor.extract.return_value = expected_graph
+        extractor = StubExtractor(sample_graph)
+        mock_create_extractor.return_value = extractor
 
         # Large text
         large_text = "This is a large text. " * 100
@@ -204,8 +189,8 @@ class TestExtractKnowledgeGraphChunking:
         result = extract_knowledge_graph(large_text)
 
         # Should call extract once (no chunking)
-        mock_extractor.extract.assert_called_once()
-        assert result is expected_graph
+        assert len(extractor.calls) == 1
+        assert result is sample_graph
 
     @patch("src.extractor.load_config")
     @patch("src.extractor.create_extractor")
@@ -215,14 +200,12 @@ class TestExtractKnowledgeGraphChunking:
         mock_load_config: MagicMock,
     ) -> None:
         """Failed chunks should be skipped, processing should continue."""
-        mock_config = MagicMock()
-        mock_config.chunk_enabled = True
-        mock_config.chunk_size_tokens = 50
-        mock_config.chunk_overlap_tokens = 10
-        mock_load_config.return_value = mock_config
-
-        mock_extractor = MagicMock()
-        mock_create_extractor.return_value = mock_extractor
+        mock_load_config.return_value = SimpleNamespace(
+            chunk_enabled=True,
+            chunk_size_tokens=50,
+            chunk_overlap_tokens=10,
+            chunk_max_concurrency=1,  # List results are replayed in call order
+        )
 
         # First chunk fails, second succeeds
         graph2 = KnowledgeGraph(
@@ -230,18 +213,19 @@ class TestExtractKnowledgeGraphChunking:
             nodes=[Node(id="c1", type="Company", name="Success")],
             relationships=[],
         )
-        mock_extractor.extract.side_effect = [
-            ValueError("First chunk failed"),
-            graph2,
-        ]
-
         large_text = "This is a large text. " * 50
+        chunk_count = len(split_text(large_text, 50, 10))
+
+        extractor = StubExtractor(
+            [ValueError("First chunk failed")] + [graph2] * (chunk_count - 1)
+        )
+        mock_create_extractor.return_value = extractor
 
         # Should not raise, should return partial result
         result = extract_knowledge_graph(large_text)
 
-        assert len(result.nodes) >= 1
-        assert result.nodes[0].name == "Success"
+        assert len(extractor.calls) == chunk_count
+        assert [n.name for n in result.nodes] == ["Success"]
 
     @patch("src.extractor.load_config")
     @patch("src.extractor.create_extractor")
@@ -251,17 +235,16 @@ class TestExtractKnowledgeGraphChunking:
         mock_load_config: MagicMock,
     ) -> None:
         """If all chunks fail, should raise error."""
-        mock_config = MagicMock()
-        mock_config.chunk_enabled = True
-        mock_config.chunk_size_tokens = 50
-        mock_config.chunk_overlap_tokens = 10
-        mock_load_config.return_value = mock_config
-
-        mock_extractor = MagicMock()
-        mock_create_extractor.return_value = mock_extractor
+        mock_load_config.return_value = SimpleNamespace(
+            chunk_enabled=True,
+            chunk_size_tokens=50,
+            chunk_overlap_tokens=10,
+            chunk_max_concurrency=8,
+        )
 
         # All chunks fail
-        mock_extractor.extract.side_effect = ValueError("All failed")
+        extractor = StubExtractor(ValueError("All failed"))
+        mock_create_extractor.return_value = extractor
 
         large_text = "This is a large text. " * 50
 
@@ -274,23 +257,18 @@ class TestExtractKnowledgeGraphChunking:
         self,
         mock_create_extractor: MagicMock,
         mock_load_config: MagicMock,
+        sample_graph: KnowledgeGraph,
     ) -> None:
         """Progress callback should be invoked for each chunk."""
-        mock_config = MagicMock()
-        mock_config.chunk_enabled = True
-        mock_config.chunk_size_tokens = 50
-        mock_config.chunk_overlap_tokens = 10
-        mock_load_config.return_value = mock_config
-
-        mock_extractor = MagicMock()
-        mock_create_extractor.return_value = mock_extractor
-
-        graph = KnowledgeGraph(
-            schema_version="1.0.0",
-            nodes=[Node(id="c1", type="Company", name="Test")],
-            relationships=[],
+        mock_load_config.return_value = SimpleNamespace(
+            chunk_enabled=True,
+            chunk_size_tokens=50,
+            chunk_overlap_tokens=10,
+            chunk_max_concurrency=8,
         )
-        mock_extractor.extract.return_value = graph
+
+        extractor = StubExtractor(sample_graph)
+        mock_create_extractor.return_value = extractor
 
         callback = MagicMock()
         large_text = "This is a large text. " * 50
@@ -308,14 +286,12 @@ class TestExtractKnowledgeGraphChunking:
         mock_load_config: MagicMock,
     ) -> None:
         """Overlap >= chunk size should raise ValueError."""
-        mock_config = MagicMock()
-        mock_config.chunk_enabled = True
-        mock_config.chunk_size_tokens = 100
-        mock_config.chunk_overlap_tokens = 100  # Invalid: overlap >= chunk size
-        mock_load_config.return_value = mock_config
-
-        mock_extractor = MagicMock()
-        mock_create_extractor.return_value = mock_extractor
+        mock_load_config.return_value = SimpleNamespace(
+            chunk_enabled=True,
+            chunk_size_tokens=100,
+            chunk_overlap_tokens=100,  # Invalid: overlap >= chunk size
+        )
+        mock_create_extractor.return_value = StubExtractor([])
 
         large_text = "This is a large text. " * 100
 
@@ -330,14 +306,12 @@ class TestExtractKnowledgeGraphChunking:
         mock_load_config: MagicMock,
     ) -> None:
         """Merged graph should deduplicate nodes with same (type, name)."""
-        mock_config = MagicMock()
-        mock_config.chunk_enabled = True
-        mock_config.chunk_size_tokens = 50
-        mock_config.chunk_overlap_tokens = 10
-        mock_load_config.return_value = mock_config
-
-        mock_extractor = MagicMock()
-        mock_create_extractor.return_value = mock_extractor
+        mock_load_config.return_value = SimpleNamespace(
+            chunk_enabled=True,
+            chunk_size_tokens=50,
+            chunk_overlap_tokens=10,
+            chunk_max_concurrency=1,  # List results are replayed in call order
+        )
 
         # Both chunks have same company
         graph1 = KnowledgeGraph(
@@ -350,12 +324,185 @@ class TestExtractKnowledgeGraphChunking:
             nodes=[Node(id="c1", type="Company", name="Shared Corp")],  # Duplicate
             relationships=[],
         )
-        mock_extractor.extract.side_effect = [graph1, graph2]
-
         large_text = "This is a large text. " * 50
+        chunk_count = len(split_text(large_text, 50, 10))
+
+        extractor = StubExtractor([graph1] + [graph2] * (chunk_count - 1))
+        mock_create_extractor.return_value = extractor
 
         result = extract_knowledge_graph(large_text)
 
         # Should have only 1 node (deduplicated)
         assert len(result.nodes) == 1
         assert result.nodes[0].name == "Shared Corp"
+
+    @patch("src.extractor.load_config")
+    @patch("src.extractor.create_extractor")
+    def test_progress_snapshots_accumulate_deduplicated_nodes(
+        self,
+        mock_create_extractor: MagicMock,
+        mock_load_config: MagicMock,
+    ) -> None:
+        """Each progress snapshot should hold the deduplicated nodes so far."""
+        mock_load_config.return_value = SimpleNamespace(
+            chunk_enabled=True,
+            chunk_size_tokens=50,
+            chunk_overlap_tokens=10,
+            chunk_max_concurrency=8,
+        )
+
+        graph = KnowledgeGraph(
+            schema_version="1.0.0",
+            nodes=[Node(id="c1", type="Company", name="Shared Corp")],
+            relationships=[],
+        )
+        extractor = StubExtractor(graph)
+        mock_create_extractor.return_value = extractor
+
+        snapshots: list[KnowledgeGraph] = []
+        large_text = "This is a large text. " * 50
+
+        result = extract_knowledge_graph(
+            large_text,
+            on_chunk_complete=lambda g, i, total: snapshots.append(g),
+        )
+
+        assert len(snapshots) == len(extractor.calls)
+        assert all(len(snapshot.nodes) == 1 for snapshot in snapshots)
+        assert len(result.nodes) == 1
+
+    @patch("src.extractor.load_config")
+    @patch("src.extractor.create_extractor")
+    def test_chunks_extracted_concurrently(
+        self,
+        mock_create_extractor: MagicMock,
+        mock_load_config: MagicMock,
+    ) -> None:
+        """Chunks should be in flight at the same time, up to the limit."""
+        mock_load_config.return_value = SimpleNamespace(
+            chunk_enabled=True,
+            chunk_size_tokens=50,
+            chunk_overlap_tokens=10,
+            chunk_max_concurrency=2,
+        )
+
+        # Each call waits for a second concurrent call; sequential
+        # processing would break the barrier and fail every chunk.
+        barrier = threading.Barrier(2, timeout=5)
+        graph = KnowledgeGraph(
+            schema_version="1.0.0",
+            nodes=[Node(id="c1", type="Company", name="Test")],
+            relationships=[],
+        )
+
+        def extract(text: str) -> KnowledgeGraph:
+            barrier.wait()
+            return graph
+
+        extractor = StubExtractor(extract)
+        mock_create_extractor.return_value = extractor
+
+        large_text = "This is a large text. " * 40
+        chunk_count = len(split_text(large_text, 50, 10))
+        # An odd count would leave the last call waiting without a partner
+        assert chunk_count % 2 == 0
+
+        completed: list[int] = []
+        result = extract_knowledge_graph(
+            large_text,
+            on_chunk_complete=lambda g, i, total: completed.append(i),
+        )
+
+        assert completed == list(range(1, chunk_count + 1))
+        assert len(result.nodes) == 1
+
+    @patch("src.extractor.load_config")
+    @patch("src.extractor.create_extractor")
+    def test_merge_order_independent_of_completion_order(
+        self,
+        mock_create_extractor: MagicMock,
+        mock_load_config: MagicMock,
+    ) -> None:
+        """Merged IDs and callbacks should follow chunk order, not finish order."""
+        mock_load_config.return_value = SimpleNamespace(
+            chunk_enabled=True,
+            chunk_size_tokens=50,
+            chunk_overlap_tokens=10,
+            chunk_max_concurrency=8,
+        )
+
+        large_text = "This is a large text. " * 50
+        first_chunk_text = split_text(large_text, 50, 10)[0]
+
+        def extract(text: str) -> KnowledgeGraph:
+            if text == first_chunk_text:
+                # First chunk finishes last
+                time.sleep(0.2)
+                name = "First Corp"
+            else:
+                name = "Later Corp"
+            return KnowledgeGraph(
+                schema_version="1.0.0",
+                nodes=[Node(id="c1", type="Company", name=name)],
+                relationships=[],
+            )
+
+        extractor = StubExtractor(extract)
+        mock_create_extractor.return_value = extractor
+
+        indices: list[int] = []
+        result = extract_knowledge_graph(
+            large_text,
+            on_chunk_complete=lambda g, i, total: indices.append(i),
+        )
+
+        assert indices == sorted(indices)
+        assert [(n.id, n.name) for n in result.nodes] == [
+            ("company_1", "First Corp"),
+            ("company_2", "Later Corp"),
+        ]
+
+    @patch("src.extractor.load_config")
+    @patch("src.extractor.create_extractor")
+    def test_callback_error_cancels_queued_chunks(
+        self,
+        mock_create_extractor: MagicMock,
+        mock_load_config: MagicMock,
+    ) -> None:
+        """A failing callback should stop extraction without waiting on the queue."""
+        mock_load_config.return_value = SimpleNamespace(
+            chunk_enabled=True,
+            chunk_size_tokens=50,
+            chunk_overlap_tokens=10,
+            chunk_max_concurrency=2,
+        )
+
+        large_text = "This is a large text. " * 100
+        chunks = split_text(large_text, 50, 10)
+        release = threading.Event()
+        graph = KnowledgeGraph(
+            schema_version="1.0.0",
+            nodes=[Node(id="c1", type="Company", name="Test")],
+            relationships=[],
+        )
+
+        def extract(text: str) -> KnowledgeGraph:
+            # Every chunk after the first stalls like a slow LLM call
+            if text != chunks[0]:
+                release.wait(timeout=5)
+            return graph
+
+        def fail(graph: KnowledgeGraph, index: int, total: int) -> None:
+            raise RuntimeError("stop")
+
+        extractor = StubExtractor(extract)
+        mock_create_extractor.return_value = extractor
+
+        try:
+            with pytest.raises(RuntimeError, match="stop"):
+                extract_knowledge_graph(large_text, on_chunk_complete=fail)
+        finally:
+            release.set()
+
+        # Only the chunks already handed to the two workers ever started
+        assert len(extractor.calls) <= 3 < len(chunks)
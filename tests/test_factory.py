@@ -7,10 +7,15 @@ Tests create_extractor function:
 - Uses mocked environment variables (no real API keys or services required)
 """
 
+import os
+import subprocess
+import sys
+from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
+from src.config import clear_config_cache
 from src.extractor.factory import create_extractor
 from src.extractor.gemini_llm import GeminiExtractor
 from src.extractor.ollama_llm import OllamaExtractor
@@ -157,3 +162,52 @@ class TestCreateExtractor:
         assert isinstance(extractor, OllamaExtractor)
         assert extractor.base_url == "http://localhost:11434"
 
+    @patch.dict(
+        "os.environ",
+        {"LLM_PROVIDER": "ollama", "OLLAMA_MODEL": "llama3"},
+        clear=True,
+    )
+    def test_repeated_calls_reuse_extractor(self) -> None:
+        """Identical provider settings should return the cached extractor."""
+        first = create_extractor()
+        second = create_extractor()
+
+        assert second is first
+
+    @patch.dict(
+        "os.environ",
+        {"LLM_PROVIDER": "ollama", "OLLAMA_MODEL": "llama3"},
+        clear=True,
+    )
+    def test_changed_settings_build_new_extractor(self) -> None:
+        """A change in provider settings should build a new extractor."""
+        first = create_extractor()
+
+        with patch.dict("os.environ", {"OLLAMA_MODEL": "mistral"}):
+            clear_config_cache()
+            second = create_extractor()
+
+        assert second is not first
+        assert second.model == "mistral"
+
+    def test_unused_provider_sdks_not_imported(self) -> None:
+        """Building the Ollama extractor should not load OpenAI or Gemini SDKs."""
+        code = (
+            "import sys\n"
+            "from src.extractor import extract_knowledge_graph\n"
+            "from src.extractor.factory import create_extractor\n"
+            "create_extractor()\n"
+            "loaded = [m for m in ('openai', 'google.genai') if m in sys.modules]\n"
+            "assert not loaded, loaded\n"
+        )
+        env = {"LLM_PROVIDER": "ollama", "PATH": os.environ.get("PATH", "")}
+
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=Path(__file__).resolve().parent.parent,
+            env=env,
+            capture_output=True,
+            text=True,
+        )
+
+        assert result.returncode == 0, result.stderr
@@ -8,10 +8,32 @@ Tests graph merging functionality:
 - ID re-numbering and deduplication
 """
 
+import re
+
 import pytest
 
-from src.graph_merger import merge_graphs
-from src.schema import KnowledgeGraph, Node, Relationship
+from src.graph_merger import GraphMerger, merge_graphs
+from src.schema import KnowledgeGraph
+from tests.helpers import make_graph, make_node, make_rel
+
+NODE_TYPES = ("Company", "RiskFactor", "DollarAmount")
+_EMPTY_RE = re.compile(r"Cannot merge empty list of graphs")
+_COMPANIES = tuple((f"c{i}", f"Company {i}") for i in range(5))
+
+# Shared empty input; merging never mutates its inputs, and the tuples
+# make any accidental mutation fail loudly.
+EMPTY_GRAPH = KnowledgeGraph.model_construct(
+    schema_version="1.0.0", nodes=(), relationships=()
+)
+
+
+@pytest.fixture(scope="module")
+def company_graphs() -> list[KnowledgeGraph]:
+    """Five single-company graphs shared read-only across this module."""
+    return [
+        make_graph(nodes=[make_node(id=cid, type="Company", name=name)])
+        for cid, name in _COMPANIES
+    ]
 
 
 class TestMergeGraphs:
@@ -19,15 +41,13 @@ class TestMergeGraphs:
 
     def test_empty_list_raises_error(self) -> None:
         """Empty list should raise ValueError."""
-        with pytest.raises(ValueError, match="Cannot merge empty list of graphs"):
+        with pytest.raises(ValueError, match=_EMPTY_RE):
             merge_graphs([])
 
     def test_single_graph_returned_unchanged(self) -> None:
         """Single graph should be returned as-is."""
-        graph = KnowledgeGraph(
-            schema_version="1.0.0",
-            nodes=[Node(id="c1", type="Company", name="Acme Corp")],
-            relationships=[],
+        graph = make_graph(
+            nodes=[make_node(id="c1", type="Company", name="Acme Corp")],
         )
         
         result = merge_graphs([graph])
@@ -36,16 +56,13 @@ class TestMergeGraphs:
 
     def test_two_graphs_merged_correctly(self) -> None:
         """Two graphs should merge nodes and relationships."""
-        graph1 = KnowledgeGraph(
-            schema_version="1.0.0",
-            nodes=[Node(id="c1", type="Company", name="Acme Corp")],
-            relationships=[],
+        graph1 = make_graph(
+            nodes=[make_node(id="c1", type="Company", name="Acme Corp")],
         )
-        graph2 = KnowledgeGraph(
-            schema_version="1.0.0",
-            nodes=[Node(id="c2", type="Company", name="Beta Inc")],
+        graph2 = make_graph(
+            nodes=[make_node(id="c2", type="Company", name="Beta Inc")],
             relationships=[
-                Relationship(source="c2", target="c1", relation="OWNS")
+                make_rel(source="c2", target="c1", relation="OWNS")
             ],
         )
         
@@ -55,177 +72,112 @@ class TestMergeGraphs:
         assert len(result.nodes) == 2
         assert len(result.relationships) == 1
 
-    def test_multiple_graphs_merged_correctly(self) -> None:
+    def test_multiple_graphs_merged_correctly(
+        self, company_graphs: list[KnowledgeGraph]
+    ) -> None:
         """Multiple graphs should merge all nodes and relationships."""
-        graphs = [
-            KnowledgeGraph(
-                schema_version="1.0.0",
-                nodes=[Node(id=f"c{i}", type="Company", name=f"Company {i}")],
-                relationships=[],
-            )
-            for i in range(5)
-        ]
-        
-        result = merge_graphs(graphs)
+        result = merge_graphs(company_graphs)
         
         assert len(result.nodes) == 5
         assert len(result.relationships) == 0
 
     def test_schema_version_from_first_graph(self) -> None:
         """Schema version should come from the first graph."""
-        graph1 = KnowledgeGraph(
-            schema_version="1.0.0",
-            nodes=[],
-            relationships=[],
-        )
-        graph2 = KnowledgeGraph(
-            schema_version="2.0.0",
-            nodes=[],
-            relationships=[],
-        )
+        graph2 = make_graph(schema_version="2.0.0")
         
-        result = merge_graphs([graph1, graph2])
+        result = merge_graphs([EMPTY_GRAPH, graph2])
         
         assert result.schema_version == "1.0.0"
 
     def test_nodes_renumbered_with_type_prefix(self) -> None:
         """Nodes should be renumbered with type-based prefixes."""
-        graph1 = KnowledgeGraph(
-            schema_version="1.0.0",
+        graph1 = make_graph(
             nodes=[
-                Node(id="n1", type="Company", name="First"),
-                Node(id="n2", type="Company", name="Second"),
+                make_node(id="n1", type="Company", name="First"),
+                make_node(id="n2", type="Company", name="Second"),
             ],
-            relationships=[],
         )
-        graph2 = KnowledgeGraph(
-            schema_version="1.0.0",
+        graph2 = make_graph(
             nodes=[
-                Node(id="n3", type="Company", name="Third"),
+                make_node(id="n3", type="Company", name="Third"),
             ],
-            relationships=[],
         )
         
         result = merge_graphs([graph1, graph2])
         
-        assert len(result.nodes) == 3
-        # IDs are renumbered with type prefix
-        assert result.nodes[0].id == "company_1"
-        assert result.nodes[1].id == "company_2"
-        assert result.nodes[2].id == "company_3"
-        # Names are preserved
-        assert result.nodes[0].name == "First"
-        assert result.nodes[1].name == "Second"
-        assert result.nodes[2].name == "Third"
+        # IDs are renumbered with type prefix; names are preserved
+        assert [(n.id, n.name) for n in result.nodes] == [
+            ("company_1", "First"),
+            ("company_2", "Second"),
+            ("company_3", "Third"),
+        ]
 
     def test_relationships_concatenated_in_order(self) -> None:
         """Relationships should be concatenated in graph order."""
-        graph1 = KnowledgeGraph(
-            schema_version="1.0.0",
-            nodes=[],
+        graph1 = make_graph(
             relationships=[
-                Relationship(source="a", target="b", relation="OWNS"),
+                make_rel(source="a", target="b", relation="OWNS"),
             ],
         )
-        graph2 = KnowledgeGraph(
-            schema_version="1.0.0",
-            nodes=[],
+        graph2 = make_graph(
             relationships=[
-                Relationship(source="c", target="d", relation="HAS_RISK"),
+                make_rel(source="c", target="d", relation="HAS_RISK"),
             ],
         )
         
         result = merge_graphs([graph1, graph2])
         
-        assert len(result.relationships) == 2
-        assert result.relationships[0].source == "a"
-        assert result.relationships[1].source == "c"
+        assert [r.source for r in result.relationships] == ["a", "c"]
 
     def test_empty_graphs_merge_to_empty(self) -> None:
         """Merging empty graphs should produce empty graph."""
-        graphs = [
-            KnowledgeGraph(schema_version="1.0.0", nodes=[], relationships=[]),
-            KnowledgeGraph(schema_version="1.0.0", nodes=[], relationships=[]),
-        ]
-        
-        result = merge_graphs(graphs)
+        result = merge_graphs([EMPTY_GRAPH, EMPTY_GRAPH])
         
         assert len(result.nodes) == 0
         assert len(result.relationships) == 0
 
     def test_mixed_empty_and_nonempty_graphs(self) -> None:
         """Empty and non-empty graphs should merge correctly."""
-        graph1 = KnowledgeGraph(
-            schema_version="1.0.0",
-            nodes=[],
-            relationships=[],
-        )
-        graph2 = KnowledgeGraph(
-            schema_version="1.0.0",
-            nodes=[Node(id="c1", type="Company", name="Acme")],
-            relationships=[],
-        )
-        graph3 = KnowledgeGraph(
-            schema_version="1.0.0",
-            nodes=[],
-            relationships=[],
+        graph = make_graph(
+            nodes=[make_node(id="c1", type="Company", name="Acme")],
         )
         
-        result = merge_graphs([graph1, graph2, graph3])
+        result = merge_graphs([EMPTY_GRAPH, graph, EMPTY_GRAPH])
         
-        assert len(result.nodes) == 1
         # ID is renumbered
-        assert result.nodes[0].id == "company_1"
-        assert result.nodes[0].name == "Acme"
-
-    def test_duplicate_nodes_deduplicated_by_type_and_name(self) -> None:
-        """Duplicate nodes (same type and name) should be deduplicated."""
-        graph1 = KnowledgeGraph(
-            schema_version="1.0.0",
-            nodes=[Node(id="c1", type="Company", name="Acme Corp")],
-            relationships=[],
-        )
-        graph2 = KnowledgeGraph(
-            schema_version="1.0.0",
-            nodes=[Node(id="c1", type="Company", name="Acme Corp")],
-            relationships=[],
-        )
-        
-        result = merge_graphs([graph1, graph2])
-        
-        # Nodes with same (type, name) are deduplicated
-        assert len(result.nodes) == 1
-        assert result.nodes[0].name == "Acme Corp"
+        assert [(n.id, n.name) for n in result.nodes] == [("company_1", "Acme")]
 
-    def test_different_names_not_deduplicated(self) -> None:
-        """Nodes with different names should not be deduplicated."""
-        graph1 = KnowledgeGraph(
-            schema_version="1.0.0",
-            nodes=[Node(id="c1", type="Company", name="Acme Corp")],
-            relationships=[],
+    @pytest.mark.parametrize(
+        ("second_type", "second_name", "expected_count"),
+        [
+            ("Company", "Acme Corp", 1),  # Same (type, name): deduplicated
+            ("Company", "Beta Inc", 2),  # Different name
+            ("RiskFactor", "Acme Corp", 2),  # Different type
+        ],
+    )
+    def test_nodes_deduplicated_by_type_and_name(
+        self, second_type: str, second_name: str, expected_count: int
+    ) -> None:
+        """Only nodes sharing both type and name should be deduplicated."""
+        graph1 = make_graph(
+            nodes=[make_node(id="c1", type="Company", name="Acme Corp")],
         )
-        graph2 = KnowledgeGraph(
-            schema_version="1.0.0",
-            nodes=[Node(id="c1", type="Company", name="Beta Inc")],
-            relationships=[],
+        graph2 = make_graph(
+            nodes=[make_node(id="c1", type=second_type, name=second_name)],
         )
-        
+
         result = merge_graphs([graph1, graph2])
-        
-        # Different names = different nodes
-        assert len(result.nodes) == 2
+
+        assert len(result.nodes) == expected_count
+        assert result.nodes[0].name == "Acme Corp"
 
     def test_returns_new_graph_instance(self) -> None:
         """Merged result should be a new KnowledgeGraph instance."""
-        graph1 = KnowledgeGraph(
-            schema_version="1.0.0",
-            nodes=[Node(id="c1", type="Company", name="Acme")],
-            relationships=[],
+        graph1 = make_graph(
+            nodes=[make_node(id="c1", type="Company", name="Acme")],
         )
-        graph2 = KnowledgeGraph(
-            schema_version="1.0.0",
-            nodes=[Node(id="c2", type="Company", name="Beta")],
-            relationships=[],
+        graph2 = make_graph(
+            nodes=[make_node(id="c2", type="Company", name="Beta")],
         )
         
         result = merge_graphs([graph1, graph2])
@@ -236,50 +188,45 @@ class TestMergeGraphs:
     def test_relationship_references_updated_after_renumbering(self) -> None:
         """Relationship source/target within same chunk should be updated to new IDs."""
         # Both nodes and relationship in same graph/chunk
-        graph1 = KnowledgeGraph(
-            schema_version="1.0.0",
+        graph1 = make_graph(
             nodes=[
-                Node(id="old_c1", type="Company", name="Parent Corp"),
-                Node(id="old_c2", type="Company", name="Child Inc"),
+                make_node(id="old_c1", type="Company", name="Parent Corp"),
+                make_node(id="old_c2", type="Company", name="Child Inc"),
             ],
             relationships=[
-                Relationship(source="old_c2", target="old_c1", relation="OWNS")
+                make_rel(source="old_c2", target="old_c1", relation="OWNS")
             ],
         )
-        graph2 = KnowledgeGraph(
-            schema_version="1.0.0",
-            nodes=[Node(id="c3", type="Company", name="Third Corp")],
-            relationships=[],
+        graph2 = make_graph(
+            nodes=[make_node(id="c3", type="Company", name="Third Corp")],
         )
         
         result = merge_graphs([graph1, graph2])
         
-        assert len(result.relationships) == 1
         # Relationship references should be updated to new IDs
-        assert result.relationships[0].source == "company_2"
-        assert result.relationships[0].target == "company_1"
+        assert [(r.source, r.target, r.relation) for r in result.relationships] == [
+            ("company_2", "company_1", "OWNS")
+        ]
 
     def test_deduplication_updates_relationship_references(self) -> None:
         """Relationships should reference deduplicated node IDs."""
         # Both chunks have the same company
-        graph1 = KnowledgeGraph(
-            schema_version="1.0.0",
+        graph1 = make_graph(
             nodes=[
-                Node(id="c1", type="Company", name="Shared Corp"),
-                Node(id="r1", type="RiskFactor", name="Market Risk"),
+                make_node(id="c1", type="Company", name="Shared Corp"),
+                make_node(id="r1", type="RiskFactor", name="Market Risk"),
             ],
             relationships=[
-                Relationship(source="c1", target="r1", relation="HAS_RISK")
+                make_rel(source="c1", target="r1", relation="HAS_RISK")
             ],
         )
-        graph2 = KnowledgeGraph(
-            schema_version="1.0.0",
+        graph2 = make_graph(
             nodes=[
-                Node(id="c1", type="Company", name="Shared Corp"),  # Duplicate
-                Node(id="a1", type="DollarAmount", name="$1M"),
+                make_node(id="c1", type="Company", name="Shared Corp"),  # Duplicate
+                make_node(id="a1", type="DollarAmount", name="$1M"),
             ],
             relationships=[
-                Relationship(source="c1", target="a1", relation="REPORTS_AMOUNT")
+                make_rel(source="c1", target="a1", relation="REPORTS_AMOUNT")
             ],
         )
         
@@ -288,53 +235,40 @@ class TestMergeGraphs:
         # 3 unique nodes (company deduplicated, risk, amount)
         assert len(result.nodes) == 3
         # Both relationships should point to company_1
-        assert len(result.relationships) == 2
-        assert result.relationships[0].source == "company_1"
-        assert result.relationships[1].source == "company_1"
+        assert [r.source for r in result.relationships] == ["company_1", "company_1"]
 
     def test_different_node_types_have_different_prefixes(self) -> None:
         """Different node types should have different ID prefixes."""
-        graph = KnowledgeGraph(
-            schema_version="1.0.0",
+        graph = make_graph(
             nodes=[
-                Node(id="x", type="Company", name="Corp A"),
-                Node(id="y", type="RiskFactor", name="Risk A"),
-                Node(id="z", type="DollarAmount", name="$100"),
+                make_node(id=f"tmp{i}", type=node_type, name=f"{node_type} A")
+                for i, node_type in enumerate(NODE_TYPES)
             ],
-            relationships=[],
         )
         # Use merge with two identical graphs to trigger renumbering
         result = merge_graphs([graph, graph])
-        
-        # Due to deduplication, should have 3 nodes
-        assert len(result.nodes) == 3
-        
-        # Check prefixes
-        ids = {n.id for n in result.nodes}
-        assert "company_1" in ids
-        assert "risk_1" in ids
-        assert "amount_1" in ids
+
+        # Due to deduplication, one node per type with its own prefix
+        assert [n.id for n in result.nodes] == ["company_1", "risk_1", "amount_1"]
 
     def test_duplicate_relationships_deduplicated(self) -> None:
         """Duplicate relationships (same source, target, relation) should be deduplicated."""
-        graph1 = KnowledgeGraph(
-            schema_version="1.0.0",
+        graph1 = make_graph(
             nodes=[
-                Node(id="c1", type="Company", name="Corp"),
-                Node(id="r1", type="RiskFactor", name="Risk"),
+                make_node(id="c1", type="Company", name="Corp"),
+                make_node(id="r1", type="RiskFactor", name="Risk"),
             ],
             relationships=[
-                Relationship(source="c1", target="r1", relation="HAS_RISK")
+                make_rel(source="c1", target="r1", relation="HAS_RISK")
             ],
         )
-        graph2 = KnowledgeGraph(
-            schema_version="1.0.0",
+        graph2 = make_graph(
             nodes=[
-                Node(id="c1", type="Company", name="Corp"),
-                Node(id="r1", type="RiskFactor", name="Risk"),
+                make_node(id="c1", type="Company", name="Corp"),
+                make_node(id="r1", type="RiskFactor", name="Risk"),
             ],
             relationships=[
-                Relationship(source="c1", target="r1", relation="HAS_RISK")  # Duplicate
+                make_rel(source="c1", target="r1", relation="HAS_RISK")  # Duplicate
             ],
         )
         
@@ -342,3 +276,93 @@ class TestMergeGraphs:
         
         # Duplicate relationship should be deduplicated
         assert len(result.relationships) == 1
+
+    def test_merged_graph_round_trips_through_json(self) -> None:
+        """Merged output should serialize and re-validate cleanly."""
+        graph1 = make_graph(
+            nodes=[
+                make_node(id="c1", type="Company", name="Corp"),
+                make_node(id="r1", type="RiskFactor", name="Risk"),
+            ],
+            relationships=[
+                make_rel(source="c1", target="r1", relation="HAS_RISK", confidence=0.9)
+            ],
+        )
+        graph2 = make_graph(
+            nodes=[make_node(id="a1", type="DollarAmount", name="$5M")],
+        )
+
+        result = merge_graphs([graph1, graph2])
+        restored = KnowledgeGraph.model_validate_json(result.model_dump_json())
+
+        assert restored == result
+
+
+class TestGraphMerger:
+    """Tests for incremental merging with GraphMerger."""
+
+    def test_result_without_graphs_raises_error(self) -> None:
+        """Requesting a result before adding graphs should raise ValueError."""
+        with pytest.raises(ValueError, match=_EMPTY_RE):
+            GraphMerger().result()
+
+    def test_incremental_merge_matches_merge_graphs(self) -> None:
+        """Adding graphs one at a time should equal merging them at once."""
+        graph1 = make_graph(
+            nodes=[
+                make_node(id="c1", type="Company", name="Corp"),
+                make_node(id="r1", type="RiskFactor", name="Risk"),
+            ],
+            relationships=[make_rel(source="c1", target="r1", relation="HAS_RISK")],
+        )
+        graph2 = make_graph(
+            nodes=[
+                make_node(id="c9", type="Company", name="Corp"),
+                make_node(id="a1", type="DollarAmount", name="$5M"),
+            ],
+            relationships=[
+                make_rel(source="c9", target="a1", relation="REPORTS_AMOUNT")
+            ],
+        )
+        merger = GraphMerger()
+
+        merger.add(graph1)
+        merger.add(graph2)
+
+        assert merger.result() == merge_graphs([graph1, graph2])
+
+    def test_snapshot_not_changed_by_later_adds(self) -> None:
+        """A returned result should not change when more graphs are added."""
+        graphs = [
+            make_graph(
+                nodes=[make_node(id="c1", type="Company", name=f"Company {i}")],
+            )
+            for i in range(3)
+        ]
+        merger = GraphMerger()
+        merger.add(graphs[0])
+        merger.add(graphs[1])
+
+        snapshot = merger.result()
+        merger.add(graphs[2])
+
+        assert len(snapshot.nodes) == 2
+        assert len(merger.result().nodes) == 3
+
+    def test_many_duplicate_nodes_collapse_to_one(self) -> None:
+        """500 chunks repeating the same node should merge into a single node."""
+        graph = make_graph(
+            nodes=[
+                make_node(id="c1", type="Company", name="Shared Corp"),
+                make_node(id="r1", type="RiskFactor", name="Shared Risk"),
+            ],
+            relationships=[make_rel(source="c1", target="r1", relation="HAS_RISK")],
+        )
+        merger = GraphMerger()
+
+        for _ in range(500):
+            merger.add(graph)
+        result = merger.result()
+
+        assert [n.id for n in result.nodes] == ["company_1", "risk_1"]
+        assert len(result.relationships) == 1
@@ -12,6 +12,14 @@ from pathlib import Path
 import pytest
 
 from src.input_loader import load_raw_text
+from tests.helpers import LARGE_TEXT, LARGE_TEXT_LINES
+
+pytestmark = pytest.mark.io
+
+
+def _stub_read_text(monkeypatch: pytest.MonkeyPatch, content: str) -> None:
+    """Make Path.read_text return ``content`` without touching the disk."""
+    monkeypatch.setattr(Path, "read_text", lambda self, *args, **kwargs: content)
 
 
 class TestLoadRawText:
@@ -26,45 +34,35 @@ class TestLoadRawText:
 
         assert result == "Hello, World!"
 
-    def test_preserves_line_breaks(self, tmp_path: Path) -> None:
+    def test_preserves_line_breaks(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """load_raw_text should preserve line breaks."""
-        test_file = tmp_path / "test.txt"
-        test_file.write_text("Line 1\nLine 2\nLine 3", encoding="utf-8")
+        _stub_read_text(monkeypatch, "Line 1\nLine 2\nLine 3")
 
-        result = load_raw_text(test_file)
+        result = load_raw_text(Path("dummy.txt"))
 
         assert result == "Line 1\nLine 2\nLine 3"
         assert result.count("\n") == 2
 
-    def test_preserves_formatting(self, tmp_path: Path) -> None:
+    def test_preserves_formatting(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """load_raw_text should preserve all formatting."""
-        test_file = tmp_path / "test.txt"
         content = "  Indented\n\t\tTabbed\n\nDouble newline"
-        test_file.write_text(content, encoding="utf-8")
+        _stub_read_text(monkeypatch, content)
 
-        result = load_raw_text(test_file)
+        result = load_raw_text(Path("dummy.txt"))
 
         assert result == content
 
-    def test_handles_utf8_characters(self, tmp_path: Path) -> None:
+    def test_handles_utf8_characters(self, text_files: dict[str, Path]) -> None:
         """load_raw_text should handle UTF-8 encoded characters."""
-        test_file = tmp_path / "test.txt"
-        content = "Currency: ₹1,00,000 and €100 and £50 and $100"
-        test_file.write_text(content, encoding="utf-8")
-
-        result = load_raw_text(test_file)
+        result = load_raw_text(text_files["utf8"])
 
         assert "₹" in result
         assert "€" in result
         assert "£" in result
 
-    def test_handles_unicode_emoji(self, tmp_path: Path) -> None:
+    def test_handles_unicode_emoji(self, text_files: dict[str, Path]) -> None:
         """load_raw_text should handle Unicode emoji."""
-        test_file = tmp_path / "test.txt"
-        content = "Status: ✓ Complete 🚀"
-        test_file.write_text(content, encoding="utf-8")
-
-        result = load_raw_text(test_file)
+        result = load_raw_text(text_files["emoji"])
 
         assert "✓" in result
         assert "🚀" in result
@@ -83,37 +81,16 @@ class TestLoadRawText:
 
         assert result == ""
 
-    def test_large_file(self, tmp_path: Path) -> None:
+    def test_large_file(self, text_files: dict[str, Path]) -> None:
         """load_raw_text should handle large files."""
-        test_file = tmp_path / "large.txt"
-        large_content = "This is a line.\n" * 10000
-        test_file.write_text(large_content, encoding="utf-8")
-
-        result = load_raw_text(test_file)
+        result = load_raw_text(text_files["large"])
 
-        assert len(result) == len(large_content)
-        assert result.count("\n") == 10000
+        assert result == LARGE_TEXT
+        assert result.count("\n") == LARGE_TEXT_LINES
 
-    def test_financial_report_content(self, tmp_path: Path) -> None:
+    def test_financial_report_content(self, text_files: dict[str, Path]) -> None:
         """load_raw_text should handle typical financial report content."""
-        test_file = tmp_path / "report.txt"
-        content = """ANNUAL REPORT 2024
-
-Company: Acme Corporation
-Revenue: $1,234,567,890
-Net Income: $123,456,789
-
-Risk Factors:
-- Market volatility
-- Regulatory changes
-- Currency fluctuations
-
-Management Discussion:
-The company reported strong growth...
-"""
-        test_file.write_text(content, encoding="utf-8")
-
-        result = load_raw_text(test_file)
+        result = load_raw_text(text_files["financial"])
 
         assert "Acme Corporation" in result
         assert "$1,234,567,890" in result
@@ -140,13 +117,12 @@ The company reported strong growth...
 
         assert result == "Nested content"
 
-    def test_special_chars_in_content(self, tmp_path: Path) -> None:
+    def test_special_chars_in_content(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """load_raw_text should handle special characters."""
-        test_file = tmp_path / "test.txt"
         content = "Special chars: <>&\"'[]{}|\\/"
-        test_file.write_text(content, encoding="utf-8")
+        _stub_read_text(monkeypatch, content)
 
-        result = load_raw_text(test_file)
+        result = load_raw_text(Path("dummy.txt"))
 
         assert result == content
 
@@ -7,10 +7,19 @@ Tests Pydantic schema validation:
 - Extra field rejection (extra="forbid")
 """
 
+from typing import Any, Literal, get_args, get_origin
+
 import pytest
 from pydantic import ValidationError
 
 from src.schema import KnowledgeGraph, Node, Relationship
+from tests.helpers import kg
+
+_SAMPLE_JSON = (
+    b'{"schema_version":"1.0.0",'
+    b'"nodes":[{"id":"c1","type":"Company","name":"Acme"}],'
+    b'"relationships":[]}'
+)
 
 
 class TestNode:
@@ -54,25 +63,26 @@ class TestNode:
 
         assert node.context == "Parent holding company"
 
-    def test_invalid_type_rejected(self) -> None:
-        """Invalid node type should raise ValidationError."""
-        with pytest.raises(ValidationError):
-            Node(id="x1", type="InvalidType", name="Test")  # type: ignore[arg-type]
-
-    def test_missing_id_rejected(self) -> None:
-        """Node without id should raise ValidationError."""
-        with pytest.raises(ValidationError):
-            Node(type="Company", name="Test")  # type: ignore[call-arg]
-
-    def test_missing_name_rejected(self) -> None:
-        """Node without name should raise ValidationError."""
+    def test_type_declared_as_literal(self) -> None:
+        """Node.type should stay a Literal so pydantic-core's literal validator is used."""
+        annotation = Node.model_fields["type"].annotation
+
+        assert get_origin(annotation) is Literal
+        assert get_args(annotation) == ("Company", "RiskFactor", "DollarAmount")
+
+    @pytest.mark.parametrize(
+        "fields",
+        [
+            pytest.param({"id": "x1", "type": "InvalidType", "name": "Test"}, id="invalid-type"),
+            pytest.param({"type": "Company", "name": "Test"}, id="missing-id"),
+            pytest.param({"id": "c1", "type": "Company"}, id="missing-name"),
+            pytest.param({"id": "c1", "name": "Test"}, id="missing-type"),
+        ],
+    )
+    def test_invalid_fields_rejected(self, fields: dict[str, Any]) -> None:
+        """Invalid or missing node fields should raise ValidationError."""
         with pytest.raises(ValidationError):
-            Node(id="c1", type="Company")  # type: ignore[call-arg]
-
-    def test_missing_type_rejected(self) -> None:
-        """Node without type should raise ValidationError."""
-        with pytest.raises(ValidationError):
-            Node(id="c1", name="Test")  # type: ignore[call-arg]
+            Node(**fields)
 
     def test_extra_field_rejected(self) -> None:
         """Extra fields should be rejected (extra='forbid')."""
@@ -84,7 +94,8 @@ class TestNode:
                 extra_field="not allowed",  # type: ignore[call-arg]
             )
 
-        assert "extra_field" in str(exc_info.value).lower() or "extra" in str(exc_info.value).lower()
+        errors = exc_info.value.errors()
+        assert any(e["type"] == "extra_forbidden" and "extra_field" in e["loc"] for e in errors)
 
 
 class TestRelationship:
@@ -111,9 +122,9 @@ class TestRelationship:
 
         assert rel.relation == "OWNS"
 
-    def test_all_valid_relation_types(self) -> None:
-        """All defined relation types should be accepted."""
-        valid_relations = [
+    @pytest.mark.parametrize(
+        "relation",
+        [
             "OWNS",
             "HAS_RISK",
             "REPORTS_AMOUNT",
@@ -132,16 +143,20 @@ class TestRelationship:
             "COMMITTED_TO",
             "COMPLIES_WITH",
             "SUBJECT_TO",
-        ]
+        ],
+    )
+    def test_valid_relation_type(self, relation: str) -> None:
+        """Each defined relation type should be accepted."""
+        rel = Relationship(source="a", target="b", relation=relation)  # type: ignore[arg-type]
 
-        for relation in valid_relations:
-            rel = Relationship(source="a", target="b", relation=relation)  # type: ignore[arg-type]
-            assert rel.relation == relation
+        assert rel.relation == relation
 
-    def test_invalid_relation_rejected(self) -> None:
-        """Invalid relation type should raise ValidationError."""
-        with pytest.raises(ValidationError):
-            Relationship(source="a", target="b", relation="INVALID_RELATION")  # type: ignore[arg-type]
+    def test_relation_declared_as_literal(self) -> None:
+        """Relationship.relation should stay a Literal rather than an Enum."""
+        annotation = Relationship.model_fields["relation"].annotation
+
+        assert get_origin(annotation) is Literal
+        assert all(isinstance(value, str) for value in get_args(annotation))
 
     def test_confidence_is_optional(self) -> None:
         """Confidence field should be optional."""
@@ -163,24 +178,23 @@ class TestRelationship:
         assert rel_zero.confidence == 0.0
         assert rel_one.confidence == 1.0
 
-    def test_missing_source_rejected(self) -> None:
-        """Relationship without source should raise ValidationError."""
-        with pytest.raises(ValidationError):
-            Relationship(target="b", relation="OWNS")  # type: ignore[call-arg]
-
-    def test_missing_target_rejected(self) -> None:
-        """Relationship without target should raise ValidationError."""
+    @pytest.mark.parametrize(
+        "fields",
+        [
+            pytest.param({"source": "a", "target": "b", "relation": "INVALID_RELATION"}, id="invalid-relation"),
+            pytest.param({"target": "b", "relation": "OWNS"}, id="missing-source"),
+            pytest.param({"source": "a", "relation": "OWNS"}, id="missing-target"),
+            pytest.param({"source": "a", "target": "b"}, id="missing-relation"),
+        ],
+    )
+    def test_invalid_fields_rejected(self, fields: dict[str, Any]) -> None:
+        """Invalid or missing relationship fields should raise ValidationError."""
         with pytest.raises(ValidationError):
-            Relationship(source="a", relation="OWNS")  # type: ignore[call-arg]
-
-    def test_missing_relation_rejected(self) -> None:
-        """Relationship without relation should raise ValidationError."""
-        with pytest.raises(ValidationError):
-            Relationship(source="a", target="b")  # type: ignore[call-arg]
+            Relationship(**fields)
 
     def test_extra_field_rejected(self) -> None:
         """Extra fields should be rejected (extra='forbid')."""
-        with pytest.raises(ValidationError):
+        with pytest.raises(ValidationError) as exc_info:
             Relationship(
                 source="a",
                 target="b",
@@ -188,20 +202,22 @@ class TestRelationship:
                 extra_field="not allowed",  # type: ignore[call-arg]
             )
 
+        errors = exc_info.value.errors()
+        assert any(e["type"] == "extra_forbidden" and "extra_field" in e["loc"] for e in errors)
+
 
 class TestKnowledgeGraph:
     """Tests for the KnowledgeGraph model."""
 
     def test_valid_knowledge_graph(self) -> None:
         """Valid KnowledgeGraph should be created successfully."""
-        graph = KnowledgeGraph(
-            schema_version="1.0.0",
+        graph = kg(
             nodes=[
-                Node(id="c1", type="Company", name="Acme"),
-                Node(id="r1", type="RiskFactor", name="Risk"),
+                {"id": "c1", "type": "Company", "name": "Acme"},
+                {"id": "r1", "type": "RiskFactor", "name": "Risk"},
             ],
             relationships=[
-                Relationship(source="c1", target="r1", relation="HAS_RISK"),
+                {"source": "c1", "target": "r1", "relation": "HAS_RISK"},
             ],
         )
 
@@ -220,24 +236,9 @@ class TestKnowledgeGraph:
         assert len(graph.nodes) == 0
         assert len(graph.relationships) == 0
 
-    def test_missing_schema_version_rejected(self) -> None:
-        """KnowledgeGraph without schema_version should raise ValidationError."""
-        with pytest.raises(ValidationError):
-            KnowledgeGraph(nodes=[], relationships=[])  # type: ignore[call-arg]
-
-    def test_missing_nodes_rejected(self) -> None:
-        """KnowledgeGraph without nodes should raise ValidationError."""
-        with pytest.raises(ValidationError):
-            KnowledgeGraph(schema_version="1.0.0", relationships=[])  # type: ignore[call-arg]
-
-    def test_missing_relationships_rejected(self) -> None:
-        """KnowledgeGraph without relationships should raise ValidationError."""
-        with pytest.raises(ValidationError):
-            KnowledgeGraph(schema_version="1.0.0", nodes=[])  # type: ignore[call-arg]
-
     def test_extra_field_rejected(self) -> None:
         """Extra fields should be rejected (extra='forbid')."""
-        with pytest.raises(ValidationError):
+        with pytest.raises(ValidationError) as exc_info:
             KnowledgeGraph(
                 schema_version="1.0.0",
                 nodes=[],
@@ -245,36 +246,49 @@ class TestKnowledgeGraph:
                 extra_field="not allowed",  # type: ignore[call-arg]
             )
 
-    def test_invalid_node_in_list_rejected(self) -> None:
-        """Invalid node in nodes list should raise ValidationError."""
+        errors = exc_info.value.errors()
+        assert any(e["type"] == "extra_forbidden" and "extra_field" in e["loc"] for e in errors)
+
+    @pytest.mark.parametrize(
+        "fields",
+        [
+            pytest.param({"nodes": [], "relationships": []}, id="missing-schema-version"),
+            pytest.param({"schema_version": "1.0.0", "relationships": []}, id="missing-nodes"),
+            pytest.param({"schema_version": "1.0.0", "nodes": []}, id="missing-relationships"),
+            pytest.param(
+                {
+                    "schema_version": "1.0.0",
+                    "nodes": [{"id": "x", "type": "InvalidType", "name": "Test"}],
+                    "relationships": [],
+                },
+                id="invalid-node-in-list",
+            ),
+            pytest.param(
+                {
+                    "schema_version": "1.0.0",
+                    "nodes": [],
+                    "relationships": [{"source": "a", "target": "b", "relation": "INVALID"}],
+                },
+                id="invalid-relationship-in-list",
+            ),
+        ],
+    )
+    def test_invalid_fields_rejected(self, fields: dict[str, Any]) -> None:
+        """Invalid or missing graph fields should raise ValidationError."""
         with pytest.raises(ValidationError):
-            KnowledgeGraph(
-                schema_version="1.0.0",
-                nodes=[{"id": "x", "type": "InvalidType", "name": "Test"}],  # type: ignore[list-item]
-                relationships=[],
-            )
-
-    def test_invalid_relationship_in_list_rejected(self) -> None:
-        """Invalid relationship in list should raise ValidationError."""
-        with pytest.raises(ValidationError):
-            KnowledgeGraph(
-                schema_version="1.0.0",
-                nodes=[],
-                relationships=[{"source": "a", "target": "b", "relation": "INVALID"}],  # type: ignore[list-item]
-            )
+            KnowledgeGraph(**fields)
 
     def test_graph_with_all_node_types(self) -> None:
         """Graph with all node types should be valid."""
-        graph = KnowledgeGraph(
-            schema_version="1.0.0",
+        graph = kg(
             nodes=[
-                Node(id="c1", type="Company", name="Acme Corp"),
-                Node(id="r1", type="RiskFactor", name="Market Risk"),
-                Node(id="a1", type="DollarAmount", name="$1M"),
+                {"id": "c1", "type": "Company", "name": "Acme Corp"},
+                {"id": "r1", "type": "RiskFactor", "name": "Market Risk"},
+                {"id": "a1", "type": "DollarAmount", "name": "$1M"},
             ],
             relationships=[
-                Relationship(source="c1", target="r1", relation="HAS_RISK"),
-                Relationship(source="c1", target="a1", relation="REPORTS_AMOUNT"),
+                {"source": "c1", "target": "r1", "relation": "HAS_RISK"},
+                {"source": "c1", "target": "a1", "relation": "REPORTS_AMOUNT"},
             ],
         )
 
@@ -329,3 +343,16 @@ class TestKnowledgeGraph:
         assert len(graph.nodes) == 1
         assert graph.nodes[0].name == "Acme"
 
+    def test_model_validate_from_json(self) -> None:
+        """KnowledgeGraph should deserialize directly from JSON bytes."""
+        graph = KnowledgeGraph.model_validate_json(_SAMPLE_JSON)
+
+        assert graph.schema_version == "1.0.0"
+        assert len(graph.nodes) == 1
+        assert graph.nodes[0].name == "Acme"
+
+    def test_json_round_trip(self) -> None:
+        """model_dump_json output should validate back to an equal graph."""
+        graph = KnowledgeGraph.model_validate_json(_SAMPLE_JSON)
+
+        assert KnowledgeGraph.model_validate_json(graph.model_dump_json()) == graph
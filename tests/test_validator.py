@@ -10,41 +10,76 @@ Tests validate_and_repair_graph function for:
 - Type constraint enforcement
 """
 
+from collections.abc import Callable
+from typing import Any
+
 import pytest
 
-from src.schema import KnowledgeGraph, Node, Relationship
+from src.schema import KnowledgeGraph, Relationship
 from src.validator import validate_knowledge_graph, validate_and_repair_graph
+from tests.helpers import kg
+
+
+@pytest.fixture(scope="module")
+def valid_graph() -> KnowledgeGraph:
+    """Valid three-node graph shared read-only across this module."""
+    return kg(
+        nodes=[
+            {"id": "company_1", "type": "Company", "name": "Acme Corp"},
+            {"id": "risk_1", "type": "RiskFactor", "name": "Market Volatility"},
+            {"id": "amount_1", "type": "DollarAmount", "name": "$1,000,000"},
+        ],
+        relationships=[
+            {"source": "company_1", "target": "risk_1", "relation": "HAS_RISK"},
+            {"source": "company_1", "target": "amount_1", "relation": "REPORTS_AMOUNT"},
+        ],
+    )
+
+
+GraphFactory = Callable[[list[dict[str, Any]]], KnowledgeGraph]
+
+
+@pytest.fixture(scope="module")
+def repair_graph() -> GraphFactory:
+    """Factory attaching relationships to one shared set of validated nodes.
+
+    Nodes: ``company_1`` and ``company_2`` (Company), ``risk_1``
+    (RiskFactor) and ``amount_1`` (DollarAmount). Each call returns a
+    copy, so tests never see each other's relationships.
+    """
+    base = kg(
+        nodes=[
+            {"id": "company_1", "type": "Company", "name": "Acme Corp"},
+            {"id": "company_2", "type": "Company", "name": "Beta Inc"},
+            {"id": "risk_1", "type": "RiskFactor", "name": "Market Risk"},
+            {"id": "amount_1", "type": "DollarAmount", "name": "$1M"},
+        ],
+        relationships=[],
+    )
+
+    def with_relationships(relationships: list[dict[str, Any]]) -> KnowledgeGraph:
+        return base.model_copy(
+            update={"relationships": [Relationship.model_validate(r) for r in relationships]}
+        )
+
+    return with_relationships
 
 
 class TestValidateKnowledgeGraph:
     """Tests for validate_knowledge_graph function."""
 
-    def test_valid_graph_passes(self) -> None:
+    def test_valid_graph_passes(self, valid_graph: KnowledgeGraph) -> None:
         """A valid KnowledgeGraph with unique IDs and valid references should pass."""
-        graph = KnowledgeGraph(
-            schema_version="1.0.0",
-            nodes=[
-                Node(id="company_1", type="Company", name="Acme Corp"),
-                Node(id="risk_1", type="RiskFactor", name="Market Volatility"),
-                Node(id="amount_1", type="DollarAmount", name="$1,000,000"),
-            ],
-            relationships=[
-                Relationship(source="company_1", target="risk_1", relation="HAS_RISK"),
-                Relationship(source="company_1", target="amount_1", relation="REPORTS_AMOUNT"),
-            ],
-        )
-
         # Should not raise any exception
-        validate_knowledge_graph(graph)
+        validate_knowledge_graph(valid_graph)
 
     def test_duplicate_node_ids_fail(self) -> None:
         """KnowledgeGraph with duplicate node IDs should raise ValueError."""
-        graph = KnowledgeGraph(
-            schema_version="1.0.0",
+        graph = kg(
             nodes=[
-                Node(id="company_1", type="Company", name="Acme Corp"),
-                Node(id="company_1", type="Company", name="Beta Inc"),  # Duplicate ID
-                Node(id="risk_1", type="RiskFactor", name="Market Volatility"),
+                {"id": "company_1", "type": "Company", "name": "Acme Corp"},
+                {"id": "company_1", "type": "Company", "name": "Beta Inc"},  # Duplicate ID
+                {"id": "risk_1", "type": "RiskFactor", "name": "Market Volatility"},
             ],
             relationships=[],
         )
@@ -52,16 +87,29 @@ class TestValidateKnowledgeGraph:
         with pytest.raises(ValueError, match="Duplicate node IDs found"):
             validate_knowledge_graph(graph)
 
+    def test_duplicate_node_ids_reported_once(self) -> None:
+        """Each duplicated ID should appear once in the error message."""
+        graph = kg(
+            nodes=[
+                {"id": "company_1", "type": "Company", "name": "Acme Corp"},
+                {"id": "company_1", "type": "Company", "name": "Beta Inc"},
+                {"id": "company_1", "type": "Company", "name": "Gamma LLC"},
+            ],
+            relationships=[],
+        )
+
+        with pytest.raises(ValueError, match=r"Duplicate node IDs found: \['company_1'\]$"):
+            validate_knowledge_graph(graph)
+
     def test_invalid_relationship_source_fails(self) -> None:
         """Relationship with non-existent source ID should raise ValueError."""
-        graph = KnowledgeGraph(
-            schema_version="1.0.0",
+        graph = kg(
             nodes=[
-                Node(id="company_1", type="Company", name="Acme Corp"),
-                Node(id="risk_1", type="RiskFactor", name="Market Volatility"),
+                {"id": "company_1", "type": "Company", "name": "Acme Corp"},
+                {"id": "risk_1", "type": "RiskFactor", "name": "Market Volatility"},
             ],
             relationships=[
-                Relationship(source="nonexistent", target="risk_1", relation="HAS_RISK"),
+                {"source": "nonexistent", "target": "risk_1", "relation": "HAS_RISK"},
             ],
         )
 
@@ -70,14 +118,13 @@ class TestValidateKnowledgeGraph:
 
     def test_invalid_relationship_target_fails(self) -> None:
         """Relationship with non-existent target ID should raise ValueError."""
-        graph = KnowledgeGraph(
-            schema_version="1.0.0",
+        graph = kg(
             nodes=[
-                Node(id="company_1", type="Company", name="Acme Corp"),
-                Node(id="risk_1", type="RiskFactor", name="Market Volatility"),
+                {"id": "company_1", "type": "Company", "name": "Acme Corp"},
+                {"id": "risk_1", "type": "RiskFactor", "name": "Market Volatility"},
             ],
             relationships=[
-                Relationship(source="company_1", target="nonexistent", relation="HAS_RISK"),
+                {"source": "company_1", "target": "nonexistent", "relation": "HAS_RISK"},
             ],
         )
 
@@ -86,8 +133,7 @@ class TestValidateKnowledgeGraph:
 
     def test_empty_nodes_fails(self) -> None:
         """KnowledgeGraph with no nodes should raise ValueError."""
-        graph = KnowledgeGraph(
-            schema_version="1.0.0",
+        graph = kg(
             nodes=[],
             relationships=[],
         )
@@ -99,35 +145,17 @@ class TestValidateKnowledgeGraph:
 class TestValidateAndRepairGraph:
     """Tests for validate_and_repair_graph function."""
 
-    def test_valid_graph_unchanged(self) -> None:
+    def test_valid_graph_unchanged(self, valid_graph: KnowledgeGraph) -> None:
         """A valid graph should be returned with all relationships intact."""
-        graph = KnowledgeGraph(
-            schema_version="1.0.0",
-            nodes=[
-                Node(id="company_1", type="Company", name="Acme Corp"),
-                Node(id="risk_1", type="RiskFactor", name="Market Volatility"),
-                Node(id="amount_1", type="DollarAmount", name="$1,000,000"),
-            ],
-            relationships=[
-                Relationship(source="company_1", target="risk_1", relation="HAS_RISK"),
-                Relationship(source="company_1", target="amount_1", relation="REPORTS_AMOUNT"),
-            ],
-        )
-
-        result = validate_and_repair_graph(graph)
+        result = validate_and_repair_graph(valid_graph)
 
         assert len(result.relationships) == 2
 
-    def test_removes_has_risk_to_company(self) -> None:
+    def test_removes_has_risk_to_company(self, repair_graph: GraphFactory) -> None:
         """HAS_RISK relationship targeting a Company should be removed."""
-        graph = KnowledgeGraph(
-            schema_version="1.0.0",
-            nodes=[
-                Node(id="company_1", type="Company", name="Acme Corp"),
-                Node(id="company_2", type="Company", name="Beta Inc"),
-            ],
-            relationships=[
-                Relationship(source="company_1", target="company_2", relation="HAS_RISK"),
+        graph = repair_graph(
+            [
+                {"source": "company_1", "target": "company_2", "relation": "HAS_RISK"},
             ],
         )
 
@@ -135,16 +163,11 @@ class TestValidateAndRepairGraph:
 
         assert len(result.relationships) == 0
 
-    def test_removes_has_risk_to_dollar_amount(self) -> None:
+    def test_removes_has_risk_to_dollar_amount(self, repair_graph: GraphFactory) -> None:
         """HAS_RISK relationship targeting a DollarAmount should be removed."""
-        graph = KnowledgeGraph(
-            schema_version="1.0.0",
-            nodes=[
-                Node(id="company_1", type="Company", name="Acme Corp"),
-                Node(id="amount_1", type="DollarAmount", name="$1M"),
-            ],
-            relationships=[
-                Relationship(source="company_1", target="amount_1", relation="HAS_RISK"),
+        graph = repair_graph(
+            [
+                {"source": "company_1", "target": "amount_1", "relation": "HAS_RISK"},
             ],
         )
 
@@ -152,16 +175,11 @@ class TestValidateAndRepairGraph:
 
         assert len(result.relationships) == 0
 
-    def test_removes_reports_amount_to_company(self) -> None:
+    def test_removes_reports_amount_to_company(self, repair_graph: GraphFactory) -> None:
         """REPORTS_AMOUNT relationship targeting a Company should be removed."""
-        graph = KnowledgeGraph(
-            schema_version="1.0.0",
-            nodes=[
-                Node(id="company_1", type="Company", name="Acme Corp"),
-                Node(id="company_2", type="Company", name="Beta Inc"),
-            ],
-            relationships=[
-                Relationship(source="company_1", target="company_2", relation="REPORTS_AMOUNT"),
+        graph = repair_graph(
+            [
+                {"source": "company_1", "target": "company_2", "relation": "REPORTS_AMOUNT"},
             ],
         )
 
@@ -169,16 +187,11 @@ class TestValidateAndRepairGraph:
 
         assert len(result.relationships) == 0
 
-    def test_removes_reports_amount_to_risk(self) -> None:
+    def test_removes_reports_amount_to_risk(self, repair_graph: GraphFactory) -> None:
         """REPORTS_AMOUNT relationship targeting a RiskFactor should be removed."""
-        graph = KnowledgeGraph(
-            schema_version="1.0.0",
-            nodes=[
-                Node(id="company_1", type="Company", name="Acme Corp"),
-                Node(id="risk_1", type="RiskFactor", name="Market Risk"),
-            ],
-            relationships=[
-                Relationship(source="company_1", target="risk_1", relation="REPORTS_AMOUNT"),
+        graph = repair_graph(
+            [
+                {"source": "company_1", "target": "risk_1", "relation": "REPORTS_AMOUNT"},
             ],
         )
 
@@ -186,16 +199,11 @@ class TestValidateAndRepairGraph:
 
         assert len(result.relationships) == 0
 
-    def test_removes_owns_with_non_company_source(self) -> None:
+    def test_removes_owns_with_non_company_source(self, repair_graph: GraphFactory) -> None:
         """OWNS relationship with non-Company source should be removed."""
-        graph = KnowledgeGraph(
-            schema_version="1.0.0",
-            nodes=[
-                Node(id="risk_1", type="RiskFactor", name="Risk"),
-                Node(id="company_1", type="Company", name="Acme Corp"),
-            ],
-            relationships=[
-                Relationship(source="risk_1", target="company_1", relation="OWNS"),
+        graph = repair_graph(
+            [
+                {"source": "risk_1", "target": "company_1", "relation": "OWNS"},
             ],
         )
 
@@ -203,16 +211,11 @@ class TestValidateAndRepairGraph:
 
         assert len(result.relationships) == 0
 
-    def test_removes_owns_with_non_company_target(self) -> None:
+    def test_removes_owns_with_non_company_target(self, repair_graph: GraphFactory) -> None:
         """OWNS relationship with non-Company target should be removed."""
-        graph = KnowledgeGraph(
-            schema_version="1.0.0",
-            nodes=[
-                Node(id="company_1", type="Company", name="Acme Corp"),
-                Node(id="risk_1", type="RiskFactor", name="Risk"),
-            ],
-            relationships=[
-                Relationship(source="company_1", target="risk_1", relation="OWNS"),
+        graph = repair_graph(
+            [
+                {"source": "company_1", "target": "risk_1", "relation": "OWNS"},
             ],
         )
 
@@ -220,16 +223,11 @@ class TestValidateAndRepairGraph:
 
         assert len(result.relationships) == 0
 
-    def test_valid_owns_between_companies_preserved(self) -> None:
+    def test_valid_owns_between_companies_preserved(self, repair_graph: GraphFactory) -> None:
         """OWNS relationship between two Companies should be preserved."""
-        graph = KnowledgeGraph(
-            schema_version="1.0.0",
-            nodes=[
-                Node(id="company_1", type="Company", name="Parent Corp"),
-                Node(id="company_2", type="Company", name="Subsidiary Inc"),
-            ],
-            relationships=[
-                Relationship(source="company_1", target="company_2", relation="OWNS"),
+        graph = repair_graph(
+            [
+                {"source": "company_1", "target": "company_2", "relation": "OWNS"},
             ],
         )
 
@@ -238,15 +236,11 @@ class TestValidateAndRepairGraph:
         assert len(result.relationships) == 1
         assert result.relationships[0].relation == "OWNS"
 
-    def test_removes_relationships_with_missing_source(self) -> None:
+    def test_removes_relationships_with_missing_source(self, repair_graph: GraphFactory) -> None:
         """Relationships with missing source node should be removed."""
-        graph = KnowledgeGraph(
-            schema_version="1.0.0",
-            nodes=[
-                Node(id="risk_1", type="RiskFactor", name="Market Risk"),
-            ],
-            relationships=[
-                Relationship(source="nonexistent", target="risk_1", relation="HAS_RISK"),
+        graph = repair_graph(
+            [
+                {"source": "nonexistent", "target": "risk_1", "relation": "HAS_RISK"},
             ],
         )
 
@@ -254,15 +248,11 @@ class TestValidateAndRepairGraph:
 
         assert len(result.relationships) == 0
 
-    def test_removes_relationships_with_missing_target(self) -> None:
+    def test_removes_relationships_with_missing_target(self, repair_graph: GraphFactory) -> None:
         """Relationships with missing target node should be removed."""
-        graph = KnowledgeGraph(
-            schema_version="1.0.0",
-            nodes=[
-                Node(id="company_1", type="Company", name="Acme Corp"),
-            ],
-            relationships=[
-                Relationship(source="company_1", target="nonexistent", relation="HAS_RISK"),
+        graph = repair_graph(
+            [
+                {"source": "company_1", "target": "nonexistent", "relation": "HAS_RISK"},
             ],
         )
 
@@ -272,8 +262,7 @@ class TestValidateAndRepairGraph:
 
     def test_empty_graph_raises_error(self) -> None:
         """Graph with no nodes should raise ValueError."""
-        graph = KnowledgeGraph(
-            schema_version="1.0.0",
+        graph = kg(
             nodes=[],
             relationships=[],
         )
@@ -281,19 +270,13 @@ class TestValidateAndRepairGraph:
         with pytest.raises(ValueError, match="KnowledgeGraph must contain at least one node"):
             validate_and_repair_graph(graph)
 
-    def test_preserves_valid_while_removing_invalid(self) -> None:
+    def test_preserves_valid_while_removing_invalid(self, repair_graph: GraphFactory) -> None:
         """Valid relationships should be preserved while invalid ones are removed."""
-        graph = KnowledgeGraph(
-            schema_version="1.0.0",
-            nodes=[
-                Node(id="company_1", type="Company", name="Acme Corp"),
-                Node(id="risk_1", type="RiskFactor", name="Market Risk"),
-                Node(id="amount_1", type="DollarAmount", name="$1M"),
-            ],
-            relationships=[
-                Relationship(source="company_1", target="risk_1", relation="HAS_RISK"),  # Valid
-                Relationship(source="company_1", target="amount_1", relation="HAS_RISK"),  # Invalid: amount not risk
-                Relationship(source="company_1", target="amount_1", relation="REPORTS_AMOUNT"),  # Valid
+        graph = repair_graph(
+            [
+                {"source": "company_1", "target": "risk_1", "relation": "HAS_RISK"},  # Valid
+                {"source": "company_1", "target": "amount_1", "relation": "HAS_RISK"},  # Invalid: amount not risk
+                {"source": "company_1", "target": "amount_1", "relation": "REPORTS_AMOUNT"},  # Valid
             ],
         )
 
@@ -304,16 +287,11 @@ class TestValidateAndRepairGraph:
         assert "HAS_RISK" in relations
         assert "REPORTS_AMOUNT" in relations
 
-    def test_other_relations_not_constrained(self) -> None:
+    def test_other_relations_not_constrained(self, repair_graph: GraphFactory) -> None:
         """Relationships like OPERATES, IMPACTED_BY should not be type-constrained."""
-        graph = KnowledgeGraph(
-            schema_version="1.0.0",
-            nodes=[
-                Node(id="company_1", type="Company", name="Acme Corp"),
-                Node(id="risk_1", type="RiskFactor", name="Regulation"),
-            ],
-            relationships=[
-                Relationship(source="company_1", target="risk_1", relation="IMPACTED_BY"),
+        graph = repair_graph(
+            [
+                {"source": "company_1", "target": "risk_1", "relation": "IMPACTED_BY"},
             ],
         )
 
@@ -324,11 +302,10 @@ class TestValidateAndRepairGraph:
 
     def test_preserves_node_structure(self) -> None:
         """Nodes should be preserved in the repaired graph."""
-        graph = KnowledgeGraph(
-            schema_version="1.0.0",
+        graph = kg(
             nodes=[
-                Node(id="company_1", type="Company", name="Acme Corp", context="Parent company"),
-                Node(id="risk_1", type="RiskFactor", name="Market Risk"),
+                {"id": "company_1", "type": "Company", "name": "Acme Corp", "context": "Parent company"},
+                {"id": "risk_1", "type": "RiskFactor", "name": "Market Risk"},
             ],
             relationships=[],
         )
@@ -340,15 +317,28 @@ class TestValidateAndRepairGraph:
 
     def test_preserves_schema_version(self) -> None:
         """Schema version should be preserved in the repaired graph."""
-        graph = KnowledgeGraph(
-            schema_version="2.0.0",
+        graph = kg(
             nodes=[
-                Node(id="company_1", type="Company", name="Acme Corp"),
+                {"id": "company_1", "type": "Company", "name": "Acme Corp"},
             ],
             relationships=[],
+            schema_version="2.0.0",
         )
 
         result = validate_and_repair_graph(graph)
 
         assert result.schema_version == "2.0.0"
 
+    def test_does_not_mutate_input_graph(self, repair_graph: GraphFactory) -> None:
+        """Repair should return a new graph and leave the input intact."""
+        graph = repair_graph(
+            [
+                {"source": "company_1", "target": "company_2", "relation": "HAS_RISK"},
+            ],
+        )
+
+        result = validate_and_repair_graph(graph)
+
+        assert result is not graph
+        assert result.relationships == []
+        assert len(graph.relationships) == 1
@@ -1,122 +1,109 @@
 """Unit tests for the visualizer module.
 
+Tests build_nx_graph function:
+- Nodes and edges carry the KnowledgeGraph labels and types
+
 Tests render_graph function:
 - Graph image file is created in specified directory
 - Output file is a valid PNG image
 
 Note: These tests require networkx which may have compatibility issues
-with Python 3.14. Tests are skipped if networkx cannot be imported.
+with Python 3.14. The module is skipped if networkx cannot be imported.
 """
 
+import os
 import sys
 from pathlib import Path
 
 import pytest
 
-from src.schema import KnowledgeGraph, Node, Relationship
+from src.schema import KnowledgeGraph, Node
 
-# Skip all tests in this module if networkx has compatibility issues
+# Skip the module at collection time if the plotting stack is unavailable.
+# networkx fails with AttributeError rather than ImportError on Python 3.14.
 try:
-    from src.visualizer import render_graph
-    NETWORKX_AVAILABLE = True
+    import matplotlib
+
+    # Non-interactive backend: the first render skips GUI toolkit probing
+    matplotlib.use("Agg")
+    from src import visualizer
+    from src.visualizer import build_nx_graph, render_graph
 except (ImportError, AttributeError):
-    NETWORKX_AVAILABLE = False
-    render_graph = None  # type: ignore
+    pytest.skip("networkx not compatible with Python 3.14", allow_module_level=True)
+
+pytestmark = pytest.mark.io
 
-pytestmark = pytest.mark.skipif(
-    not NETWORKX_AVAILABLE,
-    reason="networkx not compatible with Python 3.14"
+
+# Shared read-only sample graph, validated once at import time
+_G_ONE = KnowledgeGraph(
+    schema_version="1.0.0",
+    nodes=[Node(id="company_1", type="Company", name="Acme Corp")],
+    relationships=[],
 )
 
+# PNG files start with these magic bytes
+PNG_MAGIC = b"\x89PNG\r\n\x1a\n"
 
-class TestRenderGraph:
-    """Tests for render_graph function."""
 
-    def test_graph_image_is_created(self, tmp_path: Path) -> None:
-        """render_graph should create an image file at the specified path."""
-        graph = KnowledgeGraph(
-            schema_version="1.0.0",
-            nodes=[
-                Node(id="company_1", type="Company", name="Acme Corp"),
-                Node(id="risk_1", type="RiskFactor", name="Market Volatility"),
-                Node(id="amount_1", type="DollarAmount", name="$1,000,000"),
-            ],
-            relationships=[
-                Relationship(source="company_1", target="risk_1", relation="HAS_RISK"),
-                Relationship(source="company_1", target="amount_1", relation="REPORTS_AMOUNT"),
-            ],
-        )
+def _png_header(path: Path) -> bytes:
+    """Read the 8-byte PNG signature with raw os calls, skipping buffered IO."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return os.read(fd, len(PNG_MAGIC))
+    finally:
+        os.close(fd)
 
-        output_path = tmp_path / "output" / "graph.png"
 
-        render_graph(graph, output_path)
+class TestBuildNxGraph:
+    """Tests for build_nx_graph function."""
 
-        assert output_path.exists()
-        assert output_path.is_file()
+    def test_graph_with_all_node_types(self, viz_graph: KnowledgeGraph) -> None:
+        """Every node and relationship should become a node or edge."""
+        G = build_nx_graph(viz_graph)
 
-    def test_output_file_is_valid_png(self, tmp_path: Path) -> None:
-        """render_graph should create a valid PNG file with correct header."""
-        graph = KnowledgeGraph(
-            schema_version="1.0.0",
-            nodes=[
-                Node(id="company_1", type="Company", name="Acme Corp"),
-            ],
-            relationships=[],
-        )
+        assert G.number_of_nodes() == 6
+        assert G.number_of_edges() == 5
 
-        output_path = tmp_path / "graph.png"
+    def test_node_and_edge_attributes(self, viz_graph: KnowledgeGraph) -> None:
+        """Nodes should carry name and type; edges should carry the relation."""
+        G = build_nx_graph(viz_graph)
 
-        render_graph(graph, output_path)
+        assert G.nodes["company_1"] == {"label": "Acme Corp", "type": "Company"}
+        assert G.nodes["amount_2"] == {"label": "$1,000,000", "type": "DollarAmount"}
+        assert G.edges["company_1", "risk_1"]["label"] == "HAS_RISK"
 
-        # PNG files start with these magic bytes
-        png_header = b"\x89PNG\r\n\x1a\n"
-        with open(output_path, "rb") as f:
-            file_header = f.read(8)
+    def test_edges_are_directed(self, viz_graph: KnowledgeGraph) -> None:
+        """Edges should run from relationship source to target only."""
+        G = build_nx_graph(viz_graph)
 
-        assert file_header == png_header
+        assert G.has_edge("company_1", "company_2")
+        assert not G.has_edge("company_2", "company_1")
 
-    def test_creates_parent_directories(self, tmp_path: Path) -> None:
-        """render_graph should create parent directories if they don't exist."""
-        graph = KnowledgeGraph(
-            schema_version="1.0.0",
-            nodes=[
-                Node(id="company_1", type="Company", name="Acme Corp"),
-            ],
-            relationships=[],
-        )
 
-        nested_path = tmp_path / "deep" / "nested" / "dir" / "graph.png"
+class TestRenderGraph:
+    """Tests for render_graph function."""
 
-        render_graph(graph, nested_path)
+    def test_graph_image_is_created(self, rendered_png: Path) -> None:
+        """render_graph should create an image file at the specified path."""
+        assert rendered_png.exists()
+        assert rendered_png.is_file()
 
-        assert nested_path.exists()
-        assert nested_path.parent.exists()
-
-    def test_graph_with_all_node_types(self, tmp_path: Path) -> None:
-        """render_graph should handle all node types without error."""
-        graph = KnowledgeGraph(
-            schema_version="1.0.0",
-            nodes=[
-                Node(id="company_1", type="Company", name="Acme Corp"),
-                Node(id="company_2", type="Company", name="Beta Inc"),
-                Node(id="risk_1", type="RiskFactor", name="Market Risk"),
-                Node(id="risk_2", type="RiskFactor", name="Credit Risk"),
-                Node(id="amount_1", type="DollarAmount", name="$500,000"),
-                Node(id="amount_2", type="DollarAmount", name="$1,000,000"),
-            ],
-            relationships=[
-                Relationship(source="company_1", target="company_2", relation="OWNS"),
-                Relationship(source="company_1", target="risk_1", relation="HAS_RISK"),
-                Relationship(source="company_2", target="risk_2", relation="HAS_RISK"),
-                Relationship(source="company_1", target="amount_1", relation="REPORTS_AMOUNT"),
-                Relationship(source="company_2", target="amount_2", relation="REPORTS_AMOUNT"),
-            ],
-        )
+    def test_output_file_is_valid_png(self, rendered_png: Path) -> None:
+        """A graph with every node type should render to a non-trivial PNG."""
+        assert _png_header(rendered_png) == PNG_MAGIC
+        assert rendered_png.stat().st_size > 100
 
-        output_path = tmp_path / "full_graph.png"
+    def test_creates_parent_directories(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """render_graph should create parent directories if they don't exist."""
+        # Drawing is covered by rendered_png; only the directory handling matters here
+        monkeypatch.setattr(
+            visualizer, "_draw_and_save", lambda G, output_path: output_path.write_bytes(PNG_MAGIC)
+        )
+        nested_path = tmp_path / "deep" / "nested" / "dir" / "graph.png"
 
-        render_graph(graph, output_path)
+        render_graph(_G_ONE, nested_path)
 
-        assert output_path.exists()
-        # File should have some content (not empty)
-        assert output_path.stat().st_size > 0
+        assert nested_path.exists()
+        assert _png_header(nested_path) == PNG_MAGIC
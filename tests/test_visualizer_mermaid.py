@@ -7,10 +7,13 @@ Tests Mermaid diagram generation:
 - HTML file generation
 """
 
+import mmap
+import re
 from pathlib import Path
 
 import pytest
 
+from src import visualizer_mermaid
 from src.schema import KnowledgeGraph, Node, Relationship
 from src.visualizer_mermaid import (
     _escape_mermaid_label,
@@ -19,45 +22,60 @@ from src.visualizer_mermaid import (
     render_mermaid_html,
 )
 
+pytestmark = pytest.mark.io
+
+# Shared read-only sample graphs, validated once at import time
+_ACME = Node(id="c1", type="Company", name="Acme Corp")
+_RISK = Node(id="r1", type="RiskFactor", name="Market Risk")
+_G_EMPTY = KnowledgeGraph(schema_version="1.0.0", nodes=[], relationships=[])
+_G_ONE = KnowledgeGraph(schema_version="1.0.0", nodes=[_ACME], relationships=[])
+_G_CR = KnowledgeGraph(
+    schema_version="1.0.0",
+    nodes=[_ACME, _RISK],
+    relationships=[Relationship(source="c1", target="r1", relation="HAS_RISK")],
+)
 
-class TestEscapeMermaidLabel:
-    """Tests for _escape_mermaid_label function."""
-
-    def test_plain_text_unchanged(self) -> None:
-        """Plain text without special characters should be unchanged."""
-        assert _escape_mermaid_label("Acme Corp") == "Acme Corp"
-
-    def test_double_quotes_replaced(self) -> None:
-        """Double quotes should be replaced with single quotes."""
-        assert _escape_mermaid_label('Company "Best"') == "Company 'Best'"
-
-    def test_backticks_replaced(self) -> None:
-        """Backticks should be replaced with single quotes."""
-        assert _escape_mermaid_label("Code `example`") == "Code 'example'"
 
-    def test_hash_removed(self) -> None:
-        """Hash symbols should be removed."""
-        assert _escape_mermaid_label("Item #1") == "Item 1"
+def _head(path: Path, n: int = 512) -> bytes:
+    """Read only the first ``n`` bytes of a file, for prefix assertions."""
+    with open(path, "rb") as f:
+        return f.read(n)
 
-    def test_ampersand_replaced(self) -> None:
-        """Ampersand should be replaced with 'and'."""
-        assert _escape_mermaid_label("A & B") == "A and B"
 
-    def test_angle_brackets_removed(self) -> None:
-        """Angle brackets should be removed."""
-        assert _escape_mermaid_label("<html>") == "html"
+def _contains(path: Path, needle: bytes, ignore_case: bool = False) -> bool:
+    """Search a file for ``needle`` through mmap, without decoding it."""
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if ignore_case:
+            return re.search(re.escape(needle), mm, re.IGNORECASE) is not None
+        return mm.find(needle) != -1
 
-    def test_square_brackets_replaced(self) -> None:
-        """Square brackets should be replaced with parentheses."""
-        assert _escape_mermaid_label("[item]") == "(item)"
 
-    def test_curly_braces_replaced(self) -> None:
-        """Curly braces should be replaced with parentheses."""
-        assert _escape_mermaid_label("{value}") == "(value)"
+class TestEscapeMermaidLabel:
+    """Tests for _escape_mermaid_label function."""
 
-    def test_pipe_replaced(self) -> None:
-        """Pipe character should be replaced with dash."""
-        assert _escape_mermaid_label("A | B") == "A - B"
+    @pytest.mark.parametrize(
+        ("raw", "expected"),
+        [
+            pytest.param("Acme Corp", "Acme Corp", id="plain-text-unchanged"),
+            pytest.param('Company "Best"', "Company 'Best'", id="double-quotes"),
+            pytest.param("Code `example`", "Code 'example'", id="backticks"),
+            pytest.param("Item #1", "Item 1", id="hash-removed"),
+            pytest.param("A & B", "A and B", id="ampersand"),
+            pytest.param("<html>", "html", id="angle-brackets-removed"),
+            pytest.param("[item]", "(item)", id="square-brackets"),
+            pytest.param("{value}", "(value)", id="curly-braces"),
+            pytest.param("A | B", "A - B", id="pipe"),
+            pytest.param("A" * 60, "A" * 60, id="exactly-60-chars-not-truncated"),
+            pytest.param(
+                'Test "quoted" & <html> [array]',
+                "Test 'quoted' and html (array)",
+                id="multiple-special-chars",
+            ),
+        ],
+    )
+    def test_escape(self, raw: str, expected: str) -> None:
+        """Special characters should be replaced or removed as documented."""
+        assert _escape_mermaid_label(raw) == expected
 
     def test_long_text_truncated(self) -> None:
         """Text longer than 60 characters should be truncated."""
@@ -66,145 +84,152 @@ class TestEscapeMermaidLabel:
         assert len(result) == 60
         assert result.endswith("...")
 
-    def test_exactly_60_chars_not_truncated(self) -> None:
-        """Text exactly 60 characters should not be truncated."""
-        text_60 = "A" * 60
-        result = _escape_mermaid_label(text_60)
-        assert result == text_60
-        assert not result.endswith("...")
+    def test_repeated_label_served_from_cache(self) -> None:
+        """A repeated label should be a cache hit, not a re-escape."""
+        _escape_mermaid_label.cache_clear()
 
-    def test_multiple_special_chars(self) -> None:
-        """Multiple special characters should all be handled."""
-        result = _escape_mermaid_label('Test "quoted" & <html> [array]')
-        assert result == "Test 'quoted' and html (array)"
+        _escape_mermaid_label("Acme & Co")
+        assert _escape_mermaid_label.cache_info().misses == 1
+        assert _escape_mermaid_label("Acme & Co") == "Acme and Co"
+        assert _escape_mermaid_label.cache_info().hits == 1
 
 
 class TestGetNodeShape:
     """Tests for _get_node_shape function."""
 
-    def test_company_rectangle_shape(self) -> None:
-        """Company nodes should use rectangle shape."""
-        node = Node(id="c1", type="Company", name="Acme Corp")
-        result = _get_node_shape(node)
-        assert result == 'c1["Acme Corp"]'
-
-    def test_risk_factor_rounded_shape(self) -> None:
-        """RiskFactor nodes should use rounded shape."""
-        node = Node(id="r1", type="RiskFactor", name="Market Risk")
-        result = _get_node_shape(node)
-        assert result == 'r1("Market Risk")'
-
-    def test_dollar_amount_parallelogram_shape(self) -> None:
-        """DollarAmount nodes should use parallelogram shape."""
-        node = Node(id="a1", type="DollarAmount", name="$1,000,000")
-        result = _get_node_shape(node)
-        # Mermaid parallelogram syntax: [/"label"/]
-        assert result == 'a1[/"$1,000,000"/]'
-
-    def test_company_with_context(self) -> None:
-        """Company with context should include context in label."""
-        node = Node(id="c1", type="Company", name="Acme Corp", context="Parent company")
-        result = _get_node_shape(node)
-        assert "Acme Corp" in result
-        assert "Parent company" in result
-
-    def test_dollar_amount_with_context_shows_context_first(self) -> None:
-        """DollarAmount with context should show context before amount."""
-        node = Node(id="a1", type="DollarAmount", name="$1M", context="Revenue")
-        result = _get_node_shape(node)
-        # For dollar amounts, context comes first
-        assert "Revenue: $1M" in result or "Revenue" in result
-
-    def test_escapes_special_chars_in_name(self) -> None:
-        """Special characters in node name should be escaped."""
-        node = Node(id="c1", type="Company", name='Company "A"')
-        result = _get_node_shape(node)
-        assert '"A"' not in result  # Double quotes should be escaped
-        assert "'A'" in result
+    @pytest.mark.parametrize(
+        ("node", "expected"),
+        [
+            # Company: rectangle
+            pytest.param(_ACME, 'c1["Acme Corp"]', id="company-rectangle"),
+            # RiskFactor: rounded
+            pytest.param(_RISK, 'r1("Market Risk")', id="risk-factor-rounded"),
+            # DollarAmount: Mermaid parallelogram syntax [/"label"/]
+            pytest.param(
+                Node(id="a1", type="DollarAmount", name="$1,000,000"),
+                'a1[/"$1,000,000"/]',
+                id="dollar-amount-parallelogram",
+            ),
+            pytest.param(
+                Node(id="c1", type="Company", name="Acme Corp", context="Parent company"),
+                'c1["Acme Corp (Parent company)"]',
+                id="company-with-context",
+            ),
+            # For dollar amounts, context comes first
+            pytest.param(
+                Node(id="a1", type="DollarAmount", name="$1M", context="Revenue"),
+                'a1[/"Revenue: $1M"/]',
+                id="dollar-amount-context-first",
+            ),
+            # Double quotes in the name are escaped to single quotes
+            pytest.param(
+                Node(id="c1", type="Company", name='Company "A"'),
+                'c1["Company \'A\'"]',
+                id="escapes-special-chars-in-name",
+            ),
+        ],
+    )
+    def test_shape(self, node: Node, expected: str) -> None:
+        """Each node type should map to its Mermaid shape and label."""
+        assert _get_node_shape(node) == expected
 
 
 class TestRenderMermaid:
     """Tests for render_mermaid function."""
 
-    def test_creates_mermaid_file(self, tmp_path: Path) -> None:
+    def test_creates_mermaid_file(self, rendered_mmd: Path) -> None:
         """render_mermaid should create a .mmd file."""
-        graph = KnowledgeGraph(
-            schema_version="1.0.0",
-            nodes=[
-                Node(id="c1", type="Company", name="Acme Corp"),
-            ],
-            relationships=[],
-        )
+        assert rendered_mmd.exists()
+
+    def test_file_starts_with_flowchart(self, rendered_mmd: Path) -> None:
+        """Mermaid file should start with flowchart declaration."""
+        assert _head(rendered_mmd, 9) == b"flowchart"
+
+    def test_includes_all_nodes(self, rendered_mmd: Path) -> None:
+        """Mermaid file should include all graph nodes."""
+        content = rendered_mmd.read_text()
+        for node_id in ("company_1", "company_2", "risk_1", "risk_2", "amount_1", "amount_2"):
+            assert node_id in content
+
+    def test_includes_relationships(self, rendered_mmd: Path) -> None:
+        """Mermaid file should include relationship arrows."""
+        content = rendered_mmd.read_text()
+        assert "company_1 -->|HAS_RISK| risk_1" in content
+        assert content.count("-->") == 5
+
+    def test_full_content_layout(self, tmp_path: Path) -> None:
+        """Mermaid file should list node definitions before relationships."""
+        graph = _G_CR
         output_path = tmp_path / "graph.mmd"
 
         render_mermaid(graph, output_path)
 
-        assert output_path.exists()
+        assert output_path.read_text() == (
+            "flowchart TD\n"
+            "\n"
+            "    %% Node definitions\n"
+            '    c1["Acme Corp"]\n'
+            '    r1("Market Risk")\n'
+            "\n"
+            "    %% Relationships\n"
+            "    c1 -->|HAS_RISK| r1\n"
+        )
 
-    def test_file_starts_with_flowchart(self, tmp_path: Path) -> None:
-        """Mermaid file should start with flowchart declaration."""
+    def test_non_ascii_labels_written_as_utf8(self, tmp_path: Path) -> None:
+        """Non-ASCII label text should be written as UTF-8."""
         graph = KnowledgeGraph(
             schema_version="1.0.0",
-            nodes=[
-                Node(id="c1", type="Company", name="Acme Corp"),
-            ],
+            nodes=[Node(id="a1", type="DollarAmount", name="₹1,000 crore")],
             relationships=[],
         )
         output_path = tmp_path / "graph.mmd"
 
         render_mermaid(graph, output_path)
 
-        content = output_path.read_text()
-        assert content.startswith("flowchart")
+        assert '₹1,000 crore' in output_path.read_bytes().decode("utf-8")
 
-    def test_includes_all_nodes(self, tmp_path: Path) -> None:
-        """Mermaid file should include all graph nodes."""
-        graph = KnowledgeGraph(
-            schema_version="1.0.0",
-            nodes=[
-                Node(id="c1", type="Company", name="Acme Corp"),
-                Node(id="r1", type="RiskFactor", name="Market Risk"),
-                Node(id="a1", type="DollarAmount", name="$1M"),
-            ],
-            relationships=[],
-        )
+    def test_unchanged_output_not_rewritten(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Re-rendering an identical graph should skip the file write."""
+        graph = _G_ONE
         output_path = tmp_path / "graph.mmd"
+        render_mermaid(graph, output_path)
+
+        def fail_write(self: Path, data: bytes) -> int:
+            raise AssertionError("unchanged output should not be rewritten")
 
+        monkeypatch.setattr(Path, "write_bytes", fail_write)
         render_mermaid(graph, output_path)
 
-        content = output_path.read_text()
-        assert "c1" in content
-        assert "r1" in content
-        assert "a1" in content
+        assert (tmp_path / "graph.mmd.sha").exists()
 
-    def test_includes_relationships(self, tmp_path: Path) -> None:
-        """Mermaid file should include relationship arrows."""
-        graph = KnowledgeGraph(
-            schema_version="1.0.0",
-            nodes=[
-                Node(id="c1", type="Company", name="Acme Corp"),
-                Node(id="r1", type="RiskFactor", name="Market Risk"),
-            ],
-            relationships=[
-                Relationship(source="c1", target="r1", relation="HAS_RISK"),
-            ],
-        )
+    def test_missing_output_rewritten_despite_digest(self, tmp_path: Path) -> None:
+        """A deleted output file should be regenerated even if its digest exists."""
+        graph = _G_ONE
         output_path = tmp_path / "graph.mmd"
+        render_mermaid(graph, output_path)
+        output_path.unlink()
 
         render_mermaid(graph, output_path)
 
-        content = output_path.read_text()
-        assert "c1" in content
-        assert "r1" in content
-        assert "-->" in content or "---" in content
+        assert output_path.exists()
+
+    def test_edited_output_rewritten_despite_digest(self, tmp_path: Path) -> None:
+        """A hand-edited output file should be regenerated even if its digest exists."""
+        graph = _G_ONE
+        output_path = tmp_path / "graph.mmd"
+        render_mermaid(graph, output_path)
+        expected = output_path.read_text()
+        output_path.write_text(expected[:10])
+
+        render_mermaid(graph, output_path)
+
+        assert output_path.read_text() == expected
 
     def test_creates_parent_directories(self, tmp_path: Path) -> None:
         """render_mermaid should create parent directories if needed."""
-        graph = KnowledgeGraph(
-            schema_version="1.0.0",
-            nodes=[Node(id="c1", type="Company", name="Acme")],
-            relationships=[],
-        )
+        graph = _G_ONE
         output_path = tmp_path / "deep" / "nested" / "graph.mmd"
 
         render_mermaid(graph, output_path)
@@ -213,11 +238,7 @@ class TestRenderMermaid:
 
     def test_empty_graph_still_creates_file(self, tmp_path: Path) -> None:
         """Empty graph should still create a valid Mermaid file."""
-        graph = KnowledgeGraph(
-            schema_version="1.0.0",
-            nodes=[],
-            relationships=[],
-        )
+        graph = _G_EMPTY
         output_path = tmp_path / "graph.mmd"
 
         render_mermaid(graph, output_path)
@@ -230,165 +251,130 @@ class TestRenderMermaid:
 class TestRenderMermaidHtml:
     """Tests for render_mermaid_html function."""
 
-    def test_creates_html_file(self, tmp_path: Path) -> None:
+    def test_creates_html_file(self, rendered_html: Path) -> None:
         """render_mermaid_html should create an .html file."""
-        graph = KnowledgeGraph(
-            schema_version="1.0.0",
-            nodes=[
-                Node(id="c1", type="Company", name="Acme Corp"),
-            ],
-            relationships=[],
-        )
-        output_path = tmp_path / "graph.html"
-
-        render_mermaid_html(graph, output_path)
+        assert rendered_html.exists()
 
-        assert output_path.exists()
-
-    def test_html_contains_doctype(self, tmp_path: Path) -> None:
+    def test_html_contains_doctype(self, rendered_html: Path) -> None:
         """HTML file should start with DOCTYPE declaration."""
-        graph = KnowledgeGraph(
-            schema_version="1.0.0",
-            nodes=[Node(id="c1", type="Company", name="Acme")],
-            relationships=[],
-        )
-        output_path = tmp_path / "graph.html"
-
-        render_mermaid_html(graph, output_path)
+        assert _head(rendered_html).startswith(b"<!DOCTYPE html>")
 
-        content = output_path.read_text()
-        assert "<!DOCTYPE html>" in content
-
-    def test_html_includes_mermaid_script(self, tmp_path: Path) -> None:
+    def test_html_includes_mermaid_script(self, rendered_html: Path) -> None:
         """HTML file should include Mermaid.js library."""
-        graph = KnowledgeGraph(
-            schema_version="1.0.0",
-            nodes=[Node(id="c1", type="Company", name="Acme")],
-            relationships=[],
-        )
-        output_path = tmp_path / "graph.html"
-
-        render_mermaid_html(graph, output_path)
+        assert _contains(rendered_html, b"mermaid", ignore_case=True)
 
-        content = output_path.read_text()
-        assert "mermaid" in content.lower()
-
-    def test_html_includes_graph_content(self, tmp_path: Path) -> None:
+    def test_html_includes_graph_content(self, rendered_html: Path) -> None:
         """HTML file should include graph nodes."""
-        graph = KnowledgeGraph(
-            schema_version="1.0.0",
-            nodes=[
-                Node(id="company_1", type="Company", name="Acme Corp"),
-                Node(id="risk_1", type="RiskFactor", name="Market Risk"),
-            ],
-            relationships=[
-                Relationship(source="company_1", target="risk_1", relation="HAS_RISK"),
-            ],
-        )
-        output_path = tmp_path / "graph.html"
-
-        render_mermaid_html(graph, output_path)
+        assert _contains(rendered_html, b"company_1")
+        assert _contains(rendered_html, b"risk_1")
 
-        content = output_path.read_text()
-        assert "company_1" in content
-        assert "risk_1" in content
-
-    def test_html_includes_zoom_controls(self, tmp_path: Path) -> None:
+    def test_html_includes_zoom_controls(self, rendered_html: Path) -> None:
         """HTML file should include zoom controls."""
-        graph = KnowledgeGraph(
-            schema_version="1.0.0",
-            nodes=[Node(id="c1", type="Company", name="Acme")],
-            relationships=[],
-        )
-        output_path = tmp_path / "graph.html"
-
-        render_mermaid_html(graph, output_path)
-
-        content = output_path.read_text()
         # Should have zoom-related content
-        assert "zoom" in content.lower()
+        assert _contains(rendered_html, b"zoom", ignore_case=True)
 
-    def test_html_includes_legend(self, tmp_path: Path) -> None:
+    def test_html_includes_legend(self, rendered_html: Path) -> None:
         """HTML file should include a legend for node types."""
-        graph = KnowledgeGraph(
-            schema_version="1.0.0",
-            nodes=[Node(id="c1", type="Company", name="Acme")],
-            relationships=[],
-        )
-        output_path = tmp_path / "graph.html"
-
-        render_mermaid_html(graph, output_path)
-
-        content = output_path.read_text()
-        assert "legend" in content.lower()
+        assert _contains(rendered_html, b"legend", ignore_case=True)
 
     def test_creates_parent_directories(self, tmp_path: Path) -> None:
         """render_mermaid_html should create parent directories if needed."""
-        graph = KnowledgeGraph(
-            schema_version="1.0.0",
-            nodes=[Node(id="c1", type="Company", name="Acme")],
-            relationships=[],
-        )
+        graph = _G_ONE
         output_path = tmp_path / "deep" / "nested" / "graph.html"
 
         render_mermaid_html(graph, output_path)
 
         assert output_path.exists()
 
-    def test_html_displays_node_count(self, tmp_path: Path) -> None:
+    def test_html_displays_node_count(self, rendered_html: Path) -> None:
         """HTML should display the number of nodes."""
-        graph = KnowledgeGraph(
-            schema_version="1.0.0",
-            nodes=[
-                Node(id="c1", type="Company", name="Acme"),
-                Node(id="c2", type="Company", name="Beta"),
-                Node(id="r1", type="RiskFactor", name="Risk"),
-            ],
-            relationships=[],
-        )
+        assert _contains(rendered_html, b'<span class="stat-value">6</span> Nodes')
+
+    def test_html_displays_relationship_count(self, rendered_html: Path) -> None:
+        """HTML should display the number of relationships."""
+        assert _contains(rendered_html, b'<span class="stat-value">5</span> Relationships')
+
+    def test_html_has_document_structure(self, rendered_html: Path) -> None:
+        """HTML file should have html, head and body elements."""
+        # Should have proper HTML structure
+        head = _head(rendered_html)
+        assert b"<html" in head
+        assert b"<head>" in head
+        assert _contains(rendered_html, b"<body>")
+        assert _contains(rendered_html, b"</html>")
+
+    def test_shared_assets_written_alongside_html(self, tmp_path: Path) -> None:
+        """Stylesheet and script should be written next to the HTML and linked."""
+        graph = _G_ONE
         output_path = tmp_path / "graph.html"
 
         render_mermaid_html(graph, output_path)
 
         content = output_path.read_text()
-        # Should show node count somewhere
-        assert "3" in content  # 3 nodes
+        assert (tmp_path / "style.css").exists()
+        assert (tmp_path / "mermaid_init.js").exists()
+        assert '<link rel="stylesheet" href="style.css">' in content
+        assert '<script src="mermaid_init.js" defer></script>' in content
+        assert "<style>" not in content
 
-    def test_html_displays_relationship_count(self, tmp_path: Path) -> None:
-        """HTML should display the number of relationships."""
-        graph = KnowledgeGraph(
-            schema_version="1.0.0",
-            nodes=[
-                Node(id="c1", type="Company", name="Acme"),
-                Node(id="r1", type="RiskFactor", name="Risk"),
-            ],
-            relationships=[
-                Relationship(source="c1", target="r1", relation="HAS_RISK"),
-            ],
-        )
+    def test_stale_shared_assets_are_rewritten(self, tmp_path: Path) -> None:
+        """Outdated asset files should be replaced on the next render."""
+        graph = _G_ONE
+        stylesheet = tmp_path / "style.css"
+        stylesheet.write_text("/* stale */")
+
+        render_mermaid_html(graph, tmp_path / "graph.html")
+
+        assert stylesheet.read_text() != "/* stale */"
+
+    def test_uses_cdn_when_no_bundled_mermaid(self, tmp_path: Path) -> None:
+        """Without a vendored Mermaid.js the page should load it from the CDN."""
+        graph = _G_ONE
         output_path = tmp_path / "graph.html"
 
         render_mermaid_html(graph, output_path)
 
-        content = output_path.read_text()
-        # Should show relationship count
-        assert "1" in content  # 1 relationship
-
-    def test_html_is_self_contained(self, tmp_path: Path) -> None:
-        """HTML file should be self-contained (can open in browser)."""
-        graph = KnowledgeGraph(
-            schema_version="1.0.0",
-            nodes=[Node(id="c1", type="Company", name="Acme")],
-            relationships=[],
+        assert visualizer_mermaid.MERMAID_CDN_URL in output_path.read_text()
+        assert not (tmp_path / "mermaid.min.js").exists()
+
+    def test_bundled_mermaid_copied_and_referenced_locally(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A vendored Mermaid.js should be copied next to the page and used."""
+        bundle_root = tmp_path / "bundle"
+        (bundle_root / "assets").mkdir(parents=True)
+        (bundle_root / "assets" / "mermaid.min.js").write_text("/* mermaid */")
+        monkeypatch.setattr(
+            visualizer_mermaid.resources, "files", lambda package: bundle_root
         )
-        output_path = tmp_path / "graph.html"
+        graph = _G_ONE
+        output_dir = tmp_path / "out"
+        output_path = output_dir / "graph.html"
 
         render_mermaid_html(graph, output_path)
 
         content = output_path.read_text()
-        # Should have proper HTML structure
-        assert "<html" in content
-        assert "</html>" in content
-        assert "<head>" in content
-        assert "<body>" in content
+        assert (output_dir / "mermaid.min.js").read_text() == "/* mermaid */"
+        assert '<script src="mermaid.min.js" defer></script>' in content
+        assert visualizer_mermaid.MERMAID_CDN_URL not in content
+
+    def test_updated_bundled_mermaid_refreshes_local_copy(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Upgrading the vendored Mermaid.js should replace the copied file."""
+        bundle_root = tmp_path / "bundle"
+        (bundle_root / "assets").mkdir(parents=True)
+        bundled = bundle_root / "assets" / "mermaid.min.js"
+        bundled.write_text("/* mermaid v1 */")
+        monkeypatch.setattr(
+            visualizer_mermaid.resources, "files", lambda package: bundle_root
+        )
+        graph = _G_ONE
+        output_dir = tmp_path / "out"
+        output_path = output_dir / "graph.html"
+        render_mermaid_html(graph, output_path)
+
+        bundled.write_text("/* mermaid v2 */")
+        render_mermaid_html(graph, output_path)
 
+        assert (output_dir / "mermaid.min.js").read_text() == "/* mermaid v2 */"
@@ -0,0 +1,211 @@
+let zoom = 1;
+const minZoom = 0.05;
+const maxZoom = 2;
+const zoomStep = 0.05;
+
+const wrapper = document.getElementById('wrapper');
+const container = document.getElementById('container');
+const loading = document.getElementById('loading');
+const diagram = document.getElementById('diagram');
+const zoomSlider = document.getElementById('zoomSlider');
+
+// Initialize Mermaid with dark theme
+mermaid.initialize({
+    startOnLoad: false,
+    theme: 'dark',
+    maxTextSize: 2000000,
+    maxEdges: 20000,
+    flowchart: {
+        useMaxWidth: false,
+        htmlLabels: true,
+        curve: 'basis',
+        nodeSpacing: 20,
+        rankSpacing: 40,
+        padding: 15
+    },
+    themeVariables: {
+        fontSize: '10px',
+        primaryColor: '#21262d',
+        primaryTextColor: '#c9d1d9',
+        primaryBorderColor: '#58a6ff',
+        lineColor: '#8b949e',
+        secondaryColor: '#30363d',
+        tertiaryColor: '#161b22'
+    }
+});
+
+// Render the diagram
+async function renderDiagram() {
+    try {
+        const content = diagram.textContent.trim();
+        const { svg } = await mermaid.render('rendered-graph', content);
+        diagram.innerHTML = svg;
+        diagram.style.display = 'block';
+        loading.style.display = 'none';
+
+        // Auto-fit to screen after render with slight delay
+        setTimeout(() => {
+            fitToScreen();
+            wrapper.scrollTo(0, 0);
+        }, 200);
+    } catch (e) {
+        loading.innerHTML = '<div style="color:#f85149;">Error rendering: ' + e.message + '</div><div style="margin-top:1rem;font-size:0.8rem;color:#8b949e;">Try refreshing the page or use a different browser.</div>';
+    }
+}
+
+// Update zoom display and slider
+function updateZoom() {
+    container.style.transform = `scale(${zoom})`;
+    const percent = Math.round(zoom * 100);
+    document.getElementById('zoomLevel').textContent = percent + '%';
+    zoomSlider.value = percent;
+}
+
+// Set zoom directly
+function setZoom(newZoom) {
+    zoom = Math.max(minZoom, Math.min(maxZoom, newZoom));
+    updateZoom();
+}
+
+// Set zoom from slider
+function setZoomFromSlider(value) {
+    setZoom(value / 100);
+}
+
+function zoomIn() {
+    const step = zoom < 0.2 ? 0.02 : (zoom < 0.5 ? 0.05 : 0.1);
+    setZoom(zoom + step);
+}
+
+function zoomOut() {
+    const step = zoom < 0.2 ? 0.02 : (zoom < 0.5 ? 0.05 : 0.1);
+    setZoom(zoom - step);
+}
+
+function resetZoom() {
+    zoom = 1;
+    updateZoom();
+    wrapper.scrollTo(0, 0);
+}
+
+function fitToScreen() {
+    const svg = diagram.querySelector('svg');
+    if (!svg) return;
+
+    const bbox = svg.getBBox ? svg.getBBox() : null;
+    const svgWidth = bbox ? bbox.width : (svg.viewBox?.baseVal?.width || svg.clientWidth);
+    const svgHeight = bbox ? bbox.height : (svg.viewBox?.baseVal?.height || svg.clientHeight);
+
+    const wrapperWidth = wrapper.clientWidth - 40;
+    const wrapperHeight = wrapper.clientHeight - 40;
+
+    const scaleX = wrapperWidth / svgWidth;
+    const scaleY = wrapperHeight / svgHeight;
+
+    zoom = Math.max(minZoom, Math.min(scaleX, scaleY, 1));
+
+    updateZoom();
+
+    setTimeout(() => {
+        const containerWidth = container.scrollWidth * zoom;
+        const containerHeight = container.scrollHeight * zoom;
+        const scrollX = Math.max(0, (containerWidth - wrapperWidth) / 2);
+        const scrollY = Math.max(0, (containerHeight - wrapperHeight) / 2);
+        wrapper.scrollTo(scrollX, scrollY);
+    }, 50);
+}
+
+// Scroll navigation
+function scrollTo(direction) {
+    const amount = 300;
+    switch(direction) {
+        case 'left': wrapper.scrollBy(-amount, 0); break;
+        case 'right': wrapper.scrollBy(amount, 0); break;
+        case 'top': wrapper.scrollBy(0, -amount); break;
+        case 'bottom': wrapper.scrollBy(0, amount); break;
+    }
+}
+
+// Mouse wheel zoom (with Ctrl or Meta key)
+wrapper.addEventListener('wheel', (e) => {
+    if (e.ctrlKey || e.metaKey) {
+        e.preventDefault();
+        const delta = e.deltaY > 0 ? -1 : 1;
+        const step = zoom < 0.2 ? 0.01 : (zoom < 0.5 ? 0.02 : 0.05);
+        setZoom(zoom + (delta * step));
+    }
+}, { passive: false });
+
+// Drag to pan
+let isDragging = false;
+let startX, startY, scrollLeft, scrollTop;
+
+wrapper.addEventListener('mousedown', (e) => {
+    isDragging = true;
+    startX = e.pageX - wrapper.offsetLeft;
+    startY = e.pageY - wrapper.offsetTop;
+    scrollLeft = wrapper.scrollLeft;
+    scrollTop = wrapper.scrollTop;
+    wrapper.style.cursor = 'grabbing';
+});
+
+wrapper.addEventListener('mouseleave', () => {
+    isDragging = false;
+    wrapper.style.cursor = 'grab';
+});
+
+wrapper.addEventListener('mouseup', () => {
+    isDragging = false;
+    wrapper.style.cursor = 'grab';
+});
+
+wrapper.addEventListener('mousemove', (e) => {
+    if (!isDragging) return;
+    e.preventDefault();
+    const x = e.pageX - wrapper.offsetLeft;
+    const y = e.pageY - wrapper.offsetTop;
+    wrapper.scrollLeft = scrollLeft - (x - startX);
+    wrapper.scrollTop = scrollTop - (y - startY);
+});
+
+// Keyboard navigation
+document.addEventListener('keydown', (e) => {
+    if (e.target.tagName === 'INPUT') return;
+
+    const scrollAmount = e.shiftKey ? 200 : 50;
+
+    switch(e.key) {
+        case '+': case '=': zoomIn(); e.preventDefault(); break;
+        case '-': case '_': zoomOut(); e.preventDefault(); break;
+        case '0': resetZoom(); e.preventDefault(); break;
+        case 'f': case 'F': fitToScreen(); e.preventDefault(); break;
+        case 'ArrowLeft': wrapper.scrollBy(-scrollAmount, 0); e.preventDefault(); break;
+        case 'ArrowRight': wrapper.scrollBy(scrollAmount, 0); e.preventDefault(); break;
+        case 'ArrowUp': wrapper.scrollBy(0, -scrollAmount); e.preventDefault(); break;
+        case 'ArrowDown': wrapper.scrollBy(0, scrollAmount); e.preventDefault(); break;
+        case 'Home': wrapper.scrollTo(0, 0); e.preventDefault(); break;
+        case 'End': wrapper.scrollTo(wrapper.scrollWidth, wrapper.scrollHeight); e.preventDefault(); break;
+    }
+});
+
+// Touch support for mobile
+let touchStartX, touchStartY;
+wrapper.addEventListener('touchstart', (e) => {
+    if (e.touches.length === 1) {
+        touchStartX = e.touches[0].pageX;
+        touchStartY = e.touches[0].pageY;
+    }
+}, { passive: true });
+
+wrapper.addEventListener('touchmove', (e) => {
+    if (e.touches.length === 1) {
+        const dx = touchStartX - e.touches[0].pageX;
+        const dy = touchStartY - e.touches[0].pageY;
+        wrapper.scrollBy(dx, dy);
+        touchStartX = e.touches[0].pageX;
+        touchStartY = e.touches[0].pageY;
+    }
+}, { passive: true });
+
+// Start rendering
+renderDiagram();